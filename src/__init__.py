@@ -2,13 +2,17 @@
 It is a pygame framework for making simple games.
 """
 
-from . import config, consts, inputs, maths, timers, window
+from . import config, consts, inputs, maths, replay, timers, tracing, window
 from .animations import Animation, SpriteAnimation
+from .bus import EventBus
 from .consts import *
 from .event_handler import EventHandler
 from .game import Game
+from .jobs import JobRunner, WorkerPool
 from .particles import (AnimatedParticle, Particle, ParticleManager,
                         RectParticle)
+from .profiler import FrameProfiler
+from .recorder import FrameRecorder
 from .scene_2d import Scene2D
 from .scene_manager import SceneManager
 from .sprites import SpriteSheet, TileSet
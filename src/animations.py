@@ -4,7 +4,7 @@ import pygame
 from pygame.transform import flip
 
 from .config import FrameData
-from .timers import Chronometer
+from .timers import Chronometer, frame_clock
 
 
 class Animation:  # pylint: disable=R0902
@@ -23,8 +23,10 @@ class Animation:  # pylint: disable=R0902
         self._timer = Chronometer()
         self._current_time = 0
 
-    def play(self, delta: float):
-        """Updates the current frame"""
+    def play(self, delta: float | None = None):
+        """Updates the current frame, by default with the frame clock deltatime"""
+        if delta is None:
+            delta = frame_clock.delta
         if not self.has_ended and not self.is_paused:
             self._timer.update(delta)
             self._current_time += delta
@@ -92,7 +94,9 @@ class SpriteAnimation(Animation):  # pylint: disable=R0902
         self._flip = [False, False]
         self.frame_length = self._animation_data[0][1]
 
-    def play(self, delta: float, flip_x: bool = False, flip_y: bool = False):
+    def play(
+        self, delta: float | None = None, flip_x: bool = False, flip_y: bool = False
+    ):
         """Updates the current frame"""
         super().play(delta)
         self.frame_length = self._animation_data[self._frame][1]
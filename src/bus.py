@@ -0,0 +1,124 @@
+"""## Bus
+Module for sending gameplay messages between systems inside the game"""
+
+import itertools
+import logging
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+BatchHandler = Callable[[list[Any]], None]
+
+logger = logging.getLogger(__name__)
+
+
+class EventBus:
+    """In-process bus for gameplay messages.
+
+    The type of a message is its topic. Messages are queued by topic and
+    delivered when dispatch is called: every handler of a topic gets all the
+    queued messages in one list (it shouldn't modify it), higher priorities
+    first. Only handlers of the exact type are called. Messages published while
+    dispatching are delivered on the next dispatch. A handler that raises is
+    logged and doesn't stop the others"""
+
+    def __init__(self) -> None:
+        self._handlers: dict[type, tuple[tuple[int, int, BatchHandler], ...]] = {}
+        self._queue: dict[type, list[Any]] = {}
+        self._order = itertools.count()
+        self._pending = 0
+        self._peak = 0
+        self._delivered = 0
+        self._dropped = 0
+
+    def subscribe(
+        self,
+        topic: type[T],
+        handler: Callable[[list[T]], None],
+        priority: int = 0,
+    ):
+        """Call handler with the list of messages of topic on every dispatch"""
+        entries = self._handlers.get(topic, ()) + (
+            (-priority, next(self._order), handler),
+        )
+        self._handlers[topic] = tuple(sorted(entries, key=lambda e: e[:2]))
+
+    def unsubscribe(self, topic: type, handler: BatchHandler) -> bool:
+        """Stop calling handler with topic; return True if it was subscribed"""
+        entries = self._handlers.get(topic, ())
+        kept = tuple(entry for entry in entries if entry[2] != handler)
+        if len(kept) == len(entries):
+            return False
+        if kept:
+            self._handlers[topic] = kept
+        else:
+            del self._handlers[topic]
+        return True
+
+    def publish(self, message: Any):
+        """Queue a message to be delivered on the next dispatch"""
+        queue = self._queue.get(type(message))
+        if queue is None:
+            queue = self._queue[type(message)] = []
+        queue.append(message)
+        self._pending += 1
+        if self._pending > self._peak:
+            self._peak = self._pending
+
+    def dispatch(self) -> int:
+        """Deliver the queued messages by topic in publish order; return how many
+        messages were delivered, the ones without handlers are dropped"""
+        if not self._pending:
+            return 0
+        queue, self._queue = self._queue, {}
+        self._pending = 0
+        delivered = 0
+        for topic, messages in queue.items():
+            entries = self._handlers.get(topic)
+            if not entries:
+                self._dropped += len(messages)
+                continue
+            for _, _, handler in entries:
+                try:
+                    handler(messages)
+                except Exception as error:  # pylint: disable=W0718
+                    logger.error("Bus handler %r failed", handler, exc_info=error)
+            delivered += len(messages)
+        self._delivered += delivered
+        return delivered
+
+    def clear(self):
+        """Drop the queued messages"""
+        self._queue.clear()
+        self._pending = 0
+
+    def pending_of(self, topic: type) -> int:
+        """Get the number of queued messages of topic"""
+        return len(self._queue.get(topic, ()))
+
+    def reset_peak(self):
+        """Start measuring the peak queue depth again"""
+        self._peak = self._pending
+
+    def reset_delivered(self):
+        """Start counting the delivered messages again"""
+        self._delivered = 0
+
+    @property
+    def pending(self) -> int:
+        """Get the number of queued messages"""
+        return self._pending
+
+    @property
+    def peak(self) -> int:
+        """Get the highest number of queued messages since the last reset_peak"""
+        return self._peak
+
+    @property
+    def delivered(self) -> int:
+        """Get the number of messages delivered since the last reset_delivered"""
+        return self._delivered
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of messages dropped because their topic had no handlers"""
+        return self._dropped
@@ -2,14 +2,17 @@
 module for setting different type of configuration needed for other classes"""
 
 from dataclasses import dataclass
-from typing import Any, NamedTuple, Protocol, Self
+from typing import Any, Callable, Coroutine, NamedTuple, Protocol, Self
 
 import pygame
 
-from .consts import ScaleFuntions
+from .bus import EventBus
+from .consts import FramePacing, PoolBackend, ScaleFuntions
 from .event_handler import EventHandler
-from .inputs import Keyboard, Mouse
+from .inputs import ActionMap, JoystickManager, Keyboard, Mouse
+from .jobs import JobRunner, WorkerPool
 from .maths import Vec2
+from .timers import FrameClock, Scheduler
 from typing import NamedTuple
 
 
@@ -25,6 +28,11 @@ class WindowConfig:  # pylint: disable=R0902
     vsync: int = 0
     can_fullscreen: bool = True
     can_resize: bool = True
+    headless: bool = False
+    threaded_scale: bool = False
+    dynamic_scale: bool = False
+    min_scale_factor: float = 1.0
+    max_scale_factor: float = 4.0
 
 
 @dataclass
@@ -35,6 +43,22 @@ class GameConfig:
     target_fps: int = 0
     start_fullscreen: bool = False
     clean_color: tuple[int, int, int] = (0, 0, 0)
+    fixed_delta: float = 0.0
+    max_frames: int = 0
+    max_time: float = 0.0
+    capture_frames: list[int] | None = None
+    capture_path: str = "frame_{:05d}.png"
+    tick_rate: int = 0
+    max_steps_per_frame: int = 5
+    profile: bool = False
+    pacing: FramePacing = FramePacing.CLOCK
+    idle_timeout: float = 0.5
+    job_budget_ms: float = 2.0
+    pool_backend: PoolBackend = PoolBackend.THREAD
+    pool_workers: int | None = None
+    pool_events: bool = False
+    mouse_history: int = 0
+    joystick_polled: bool = False
 
 
 class Window(Protocol):
@@ -46,6 +70,7 @@ class Window(Protocol):
     desktop_sizes: list[tuple[int, int]]
     is_fullscreen: bool
     current_size: tuple[int, int]
+    scale_factor: float
 
     def __init__(self, config: WindowConfig) -> None:
         ...
@@ -65,6 +90,12 @@ class Window(Protocol):
     def clean(self, bg_color: pygame.Color):
         """fills the screen/display with the given color"""
 
+    def set_scale_factor(self, scale_factor: float) -> bool:
+        """Change the display scale factor"""
+
+    def close(self):
+        """Release the window resources"""
+
 
 class Game(Protocol):
     """General class that represent the game"""
@@ -74,16 +105,42 @@ class Game(Protocol):
     scene_manager: "SceneManager"
     event_handler: EventHandler
     clock: pygame.Clock
+    frame_clock: FrameClock
+    scheduler: Scheduler
+    jobs: JobRunner
+    pool: WorkerPool
+    bus: EventBus
     display_offset: Vec2
     keyboard: Keyboard
     mouse: Mouse
+    joysticks: JoystickManager
+    actions: ActionMap
+    alpha: float
 
     def __init__(self, config: GameConfig, window: Window) -> None:
         ...
 
-    def run(self):
+    def run(self) -> int:
         """Run the main game loop"""
 
+    async def run_async(self) -> int:
+        """Run the main game loop inside an asyncio event loop"""
+
+    def spawn(
+        self,
+        coroutine: Coroutine,
+        callback: Callable | None = None,
+        error_callback: Callable | None = None,
+    ):
+        """Schedule a coroutine, its result is given to callback on the next frame
+        (or its exception to error_callback)"""
+
+    def stop(self):
+        """Stop the main game loop at the end of the current frame"""
+
+    def invalidate(self):
+        """Redraw the next frame even if the scene is static"""
+
     def init_game(self):
         """Init window, title, scene manager and fullscreen"""
 
@@ -150,10 +207,14 @@ class Scene2D(Protocol):
     """Abstract Class representing a single game scene"""
 
     game: Game
+    is_static: bool
 
     def __init__(self, game: Game) -> None:
         ...
 
+    def invalidate(self):
+        """Redraw the scene on the next frame even if it's static"""
+
     def on_enter_update(self, delta) -> bool:
         """Ativate when enter the scene and return True when finish"""
 
@@ -23,3 +23,39 @@ class Math:
 class JoyGetInputFuction(StrEnum):
     BUTTONS = "buttons"
     AXES = "axes"
+
+
+class RecordFormat(StrEnum):
+    """Enum for FrameRecorder output format"""
+
+    PNG = "png"
+    RAW = "raw"
+
+
+class FramePhase(StrEnum):
+    """Enum for the phases of a frame in Game.run timed by FrameProfiler"""
+
+    EVENTS = "events"
+    CLEAN = "clean"
+    UPDATE = "update"
+    RENDER = "render"
+    UPSCALE = "upscale"
+    RENDER_SCREEN = "render_screen"
+    PRESENT = "present"
+    TICK = "tick"
+    FRAME = "frame"
+
+
+class FramePacing(StrEnum):
+    """Enum for how Game waits for the next frame"""
+
+    CLOCK = "clock"
+    BUSY = "busy"
+    HYBRID = "hybrid"
+
+
+class PoolBackend(StrEnum):
+    """Enum for WorkerPool executor type"""
+
+    THREAD = "thread"
+    PROCESS = "process"
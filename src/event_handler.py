@@ -1,56 +1,270 @@
 """Event handling"""
 
-from typing import Protocol
+import weakref
+from typing import Any, Callable, Iterable, Protocol
 
 import pygame
 
+from .replay import InputPlayer, InputRecorder
+
+EventCallback = Callable[[pygame.Event], None]
+
+# input event types that are blocked on the SDL queue while nothing handles
+# them, text input included (observers that want it subscribe to it); window,
+# system and custom (USEREVENT and up) types are never blocked, they wake
+# static scenes and can be posted by the game itself
+FILTERED_EVENTS = frozenset(
+    (
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.TEXTINPUT,
+        pygame.TEXTEDITING,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEWHEEL,
+        pygame.JOYAXISMOTION,
+        pygame.JOYBALLMOTION,
+        pygame.JOYHATMOTION,
+        pygame.JOYBUTTONDOWN,
+        pygame.JOYBUTTONUP,
+        pygame.JOYDEVICEADDED,
+        pygame.JOYDEVICEREMOVED,
+        pygame.CONTROLLERAXISMOTION,
+        pygame.CONTROLLERBUTTONDOWN,
+        pygame.CONTROLLERBUTTONUP,
+        pygame.CONTROLLERDEVICEADDED,
+        pygame.CONTROLLERDEVICEREMOVED,
+        pygame.CONTROLLERDEVICEREMAPPED,
+        pygame.CONTROLLERTOUCHPADDOWN,
+        pygame.CONTROLLERTOUCHPADMOTION,
+        pygame.CONTROLLERTOUCHPADUP,
+        pygame.CONTROLLERSENSORUPDATE,
+        pygame.FINGERDOWN,
+        pygame.FINGERUP,
+        pygame.FINGERMOTION,
+        pygame.MULTIGESTURE,
+        pygame.AUDIODEVICEADDED,
+        pygame.AUDIODEVICEREMOVED,
+    )
+)
+
 
 class EventObserver(Protocol):
-    """Represent a class that handle events"""
+    """Represent a class that handle events.
+
+    It can also have a handled_events attribute with the event types it
+    handles, then it only receives those; without it receives every event"""
 
     def handle_event(self, event: pygame.Event):
         """Handle a single event"""
 
 
-class EventHandler:
-    """Class for hangling all the events"""
+class _WeakHandler:
+    """Call the handle_event method of an observer held by a weak reference"""
+
+    __slots__ = ("_method",)
+
+    def __init__(self, method: EventCallback) -> None:
+        self._method = weakref.WeakMethod(method)
+
+    def __call__(self, event: pygame.Event):
+        if (method := self._method()) is not None:
+            method(event)
+
+
+class EventHandler:  # pylint: disable=R0902
+    """Class for hangling all the events.
+
+    Every event is sent to the handlers of its type and to the observers
+    without handled_events, all in registration order.
+
+    The input event types (FILTERED_EVENTS) no observer handles are blocked on
+    the SDL queue so they never reach Python, every other type is allowed. If
+    any observer has no handled_events nothing is blocked"""
 
     def __init__(self) -> None:
-        self._observers: list[EventObserver] = []
+        # observer id: (observer or weak reference, weak, handler, event types)
+        self._observers: dict[int, tuple[Any, bool, EventCallback, Any]] = {}
+        # (handler, event types or None for every type) in registration order
+        self._subscriptions: tuple[tuple[EventCallback, frozenset | None], ...] = ()
+        # event type: handlers, built from the subscriptions when first needed
+        self._dispatch: dict[int, tuple[EventCallback, ...]] = {}
         self._last_event = pygame.Event(pygame.NOEVENT)
+        self._waited_event: pygame.Event | None = None
+        self._filter_dirty = True
+        self.recorder: InputRecorder | None = None
+        self.player: InputPlayer | None = None
 
-    def register(self, observer: EventObserver) -> bool:
-        """Register a new observer; return True if registered successfully"""
-        if hasattr(observer, EventObserver.handle_event.__name__):
-            if not self.check_registered(observer):
-                self._observers.append(observer)
-                return True
-        return False
+    def register(self, observer: EventObserver, weak: bool = False) -> bool:
+        """Register a new observer; return True if registered successfully.
+        If weak, the observer is held by a weak reference and deregistered
+        when it's garbage collected"""
+        if not hasattr(observer, EventObserver.handle_event.__name__):
+            return False
+        if self.check_registered(observer):
+            return False
+        key = id(observer)
+        event_types = getattr(observer, "handled_events", None)
+        if weak:
+            handler: EventCallback = _WeakHandler(observer.handle_event)
+            entry = weakref.ref(observer, lambda _ref: self._prune(key))
+        else:
+            handler = observer.handle_event
+            entry = observer
+        self._observers[key] = (entry, weak, handler, event_types)
+        if event_types is None:
+            self._set_subscriptions(self._subscriptions + ((handler, None),))
+        else:
+            self.subscribe(event_types, handler)
+        return True
 
     def deregister(self, observer: EventObserver) -> bool:
         """Deregister a specific observer; return True if deregistered successfully"""
-        if self.check_registered(observer):
-            index = self._observers.index(observer)
-            self._observers.pop(index)
-            return True
-        return False
+        if not self.check_registered(observer):
+            return False
+        self._prune(id(observer))
+        return True
+
+    def _prune(self, key: int):
+        """Remove the observer registered with key and its handler"""
+        if (registered := self._observers.pop(key, None)) is None:
+            return
+        _, _, handler, event_types = registered
+        if event_types is None:
+            self._set_subscriptions(
+                tuple(
+                    (h, types)
+                    for h, types in self._subscriptions
+                    if types is not None or h is not handler
+                )
+            )
+        else:
+            self.unsubscribe(event_types, handler)
 
     def check_registered(self, observer: EventObserver) -> bool:
         """Check if a observer is registered"""
-        return observer in self._observers
+        if (registered := self._observers.get(id(observer))) is None:
+            return False
+        entry, weak, _, _ = registered
+        return (entry() if weak else entry) is observer
+
+    @property
+    def observers(self) -> list[EventObserver]:
+        """Get the registered observers that are still alive"""
+        observers = []
+        for entry, weak, _, _ in self._observers.values():
+            if (observer := entry() if weak else entry) is not None:
+                observers.append(observer)
+        return observers
+
+    def subscribe(self, event_types: int | Iterable[int], handler: EventCallback):
+        """Call handler with every event of the given types"""
+        if isinstance(event_types, int):
+            event_types = (event_types,)
+        self._set_subscriptions(
+            self._subscriptions + ((handler, frozenset(event_types)),)
+        )
+
+    def unsubscribe(
+        self, event_types: int | Iterable[int], handler: EventCallback
+    ) -> bool:
+        """Stop calling handler with the given event types; return True if it was
+        subscribed to any of them"""
+        if isinstance(event_types, int):
+            event_types = (event_types,)
+        event_types = frozenset(event_types)
+        subscriptions = []
+        removed = False
+        for h, types in self._subscriptions:
+            if types is not None and h == handler and types & event_types:
+                removed = True
+                types = types - event_types
+                if not types:
+                    continue
+            subscriptions.append((h, types))
+        if removed:
+            self._set_subscriptions(tuple(subscriptions))
+        return removed
+
+    def _set_subscriptions(
+        self, subscriptions: tuple[tuple[EventCallback, frozenset | None], ...]
+    ):
+        """Replace the subscriptions, the dispatch table is built again"""
+        self._subscriptions = subscriptions
+        self._dispatch = {}
+        self._filter_dirty = True
+
+    def update_filter(self) -> bool:
+        """Block on the SDL queue the input event types nobody handles, it's done
+        on the next loop or wait after observers change; return False if the
+        display isn't initialized yet"""
+        if not pygame.display.get_init():
+            return False
+        blocked = self.blocked_events
+        pygame.event.set_allowed(None)
+        if blocked:
+            # blocking a type drops its queued events, keep the allowed ones
+            queued = pygame.event.get(exclude=list(blocked))
+            pygame.event.set_blocked(list(blocked))
+            for event in queued:
+                pygame.event.post(event)
+        self._filter_dirty = False
+        return True
+
+    @property
+    def blocked_events(self) -> frozenset[int]:
+        """Get the event types that are blocked, empty if any observer has no
+        handled_events"""
+        blocked = FILTERED_EVENTS
+        for _, types in self._subscriptions:
+            if types is None:
+                return frozenset()
+            blocked = blocked.difference(types)
+        return blocked
 
     def _send_event(self, event: pygame.Event):
-        """Send a single event to all observers"""
-        for observer in self._observers:
-            observer.handle_event(event)
+        """Send a single event to the handlers of its type and to all observers
+        without handled_events, in registration order"""
+        if (handlers := self._dispatch.get(event.type)) is None:
+            handlers = self._dispatch[event.type] = tuple(
+                handler
+                for handler, types in self._subscriptions
+                if types is None or event.type in types
+            )
+        for handler in handlers:
+            handler(event)
         self._last_event = event
 
     def loop(self) -> bool:
         """Event loop"""
-        for event in pygame.event.get():
+        if self._filter_dirty:
+            self.update_filter()
+        events = pygame.event.get()
+        if self._waited_event is not None:
+            events.insert(0, self._waited_event)
+            self._waited_event = None
+        if self.player is not None:
+            events = self.player.replace_events(events)
+        if self.recorder is not None:
+            self.recorder.record(events)
+        for event in events:
             self._send_event(event)
         return True
 
+    def wait(self, timeout: int = 0) -> bool:
+        """Block until an event arrives or timeout miliseconds pass (0 waits forever);
+        return True if there is an event. It's sent on the next loop"""
+        if self._waited_event is not None:
+            return True
+        if self._filter_dirty:
+            self.update_filter()
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return False
+        self._waited_event = event
+        return True
+
     def poll(self) -> bool:
         """Event poll"""
         event = pygame.event.poll()
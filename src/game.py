@@ -1,45 +1,381 @@
 """## Game"""
 
+import asyncio
+import logging
 import sys
+from collections import deque
+from time import perf_counter_ns, sleep
+from typing import Any, Callable, Coroutine
 
 import pygame
 
 from .config import GameConfig, Window
+from .bus import EventBus
+from .consts import FramePacing, FramePhase, RecordFormat
 from .event_handler import EventHandler
-from .inputs import Keyboard, Mouse
+from .inputs import ActionMap, JoystickManager, Keyboard, Mouse
+from .jobs import JobRunner, WorkerPool
 from .maths import Vec2
+from .profiler import FrameProfiler
+from .recorder import FrameRecorder
+from .replay import InputPlayer, InputRecorder
+from .resolution import DynamicResolution
 from .scene_manager import SceneManager
-from .timers import Delta
+from .timers import Delta, FramePacer, Scheduler, frame_clock
+from .tracing import tracer
 
+logger = logging.getLogger(__name__)
 
-class Game:  # pylint: disable=R0902
+# how early pygame.event.wait can return before its timeout
+_WAIT_SLACK_NS = 2_000_000
+
+
+class Game:  # pylint: disable=R0902 disable=R0904
     """General class that represent the game"""
 
+    handled_events = (pygame.QUIT,)
+
     def __init__(self, config: GameConfig, window: Window) -> None:
         self.config = config
         self.window = window
-        self.keyboard = Keyboard()
-        self.mouse = Mouse()
+        self.keyboard = Keyboard(frame_clock)
+        self.mouse = Mouse(frame_clock, config.mouse_history)
+        self.joysticks = JoystickManager(frame_clock, config.joystick_polled)
+        self.actions = ActionMap(self.keyboard, self.mouse)
+        self.joysticks.on_connect = self.actions.add_joystick
+        self.joysticks.on_disconnect = self.actions.remove_joystick
         self.event_handler = EventHandler()
         self.scene_manager = SceneManager(self)  # set main as an empty scene
         self.clock = pygame.Clock()
-        self.deltatimer = Delta()
+        self.frame_clock = frame_clock
+        self.deltatimer = Delta(config.fixed_delta, self.frame_clock)
+        self.pacer = FramePacer()
+        self.scheduler = Scheduler()
+        self.jobs = JobRunner(config.job_budget_ms)
+        self.bus = EventBus()
+        self.pool = WorkerPool(
+            config.pool_backend, config.pool_workers, config.pool_events
+        )
         self.display_offset = Vec2()
+        self.recorder: FrameRecorder | None = None
+        self.tracer = tracer
+        self.profiler = FrameProfiler(enabled=config.profile, tracer=self.tracer)
+        self.dynamic_resolution: DynamicResolution | None = None
+        if window.config.dynamic_scale:
+            self.dynamic_resolution = DynamicResolution(
+                window,
+                1000 / (config.target_fps or 60),
+                window.config.min_scale_factor,
+                window.config.max_scale_factor,
+            )
+        self._running = False
+        self._frame_count = 0
+        self._elapsed_time = 0.0
+        self._accumulator = 0.0
+        self._alpha = 1.0
+        self._invalidated = False
+        self._next_frame_ns = 0
+        self._timer_deadline_ns: int | None = None
+        self._idled = False
+        self._tasks: set[asyncio.Task] = set()
+        self._task_results: deque[
+            tuple[asyncio.Task, Callable | None, Callable | None]
+        ] = deque()
+
+    def run(self) -> int:
+        """Run the main game loop, return the number of frames run when it stops"""
+        self.init_game()
+        self._running = True
+        while self._running:
+            self.run_frame()
+        self.stop_recording()
+        self.stop_input_recording()
+        self.pool.shutdown()
+        self.window.close()
+        return self._frame_count
 
-    def run(self):
-        """Run the main game loop"""
+    async def run_async(self) -> int:
+        """Run the main game loop inside an asyncio event loop, yielding to it once
+        per frame; return the number of frames run when it stops"""
         self.init_game()
-        while True:
-            delta = self.deltatimer.get_delta()
-            self.event_handler.loop()
-            self.window.clean(self.config.clean_color)
+        self._running = True
+        try:
+            while self._running:
+                await self.run_frame_async()
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            self.stop_recording()
+            self.stop_input_recording()
+            self.pool.shutdown()
+            self.window.close()
+        return self._frame_count
+
+    def run_frame(self):
+        """Run a single frame of the game loop. If the scene is static and it isn't
+        invalidated, wait for an event first and skip the frame if none arrives
+        and no timer is due"""
+        timeout = self._idle_timeout()
+        if timeout is not None:
+            self._idled = True
+            has_event = self.event_handler.wait(max(1, round(timeout * 1000)))
+            if not has_event and not self._timer_due():
+                return
+        delta = self._process_frame()
+        self.wait_next_frame()
+        self._finish_frame(delta)
+
+    async def run_frame_async(self):
+        """Run a single frame of the game loop, waiting with asyncio.sleep"""
+        timeout = self._idle_timeout()
+        if timeout is not None:
+            self._idled = True
+            has_event = await self._wait_event_async(timeout)
+            if not has_event and not self._timer_due():
+                return
+        delta = self._process_frame()
+        await self.wait_next_frame_async()
+        self._finish_frame(delta)
+
+    def _process_frame(self) -> float:
+        """Run the frame from events until present; return its deltatime"""
+        profiler = self.profiler
+        profiler.begin_frame()
+        start_ns = perf_counter_ns()
+        self._timer_deadline_ns = None
+        delta = self.deltatimer.get_delta()
+        scene_delta = delta
+        if self._idled:
+            # the deltatime includes the time spent idle, only timers need it
+            self._idled = False
+            scene_delta = min(delta, 1 / (self.config.target_fps or 60))
+        self.keyboard.latch()
+        self.mouse.latch()
+        self.joysticks.latch()
+        self.event_handler.loop()
+        self._deliver_task_results()
+        self.pool.drain()
+        self.joysticks.update()
+        self.actions.update()
+        self.bus.reset_delivered()
+        self.bus.dispatch()
+        profiler.mark(FramePhase.EVENTS)
+        self.window.clean(self.config.clean_color)
+        profiler.mark(FramePhase.CLEAN)
+        self.scheduler.update(delta)
+        self.update_scene(scene_delta)
+        self.jobs.run()
+        self.bus.dispatch()
+        profiler.mark(FramePhase.UPDATE)
+        self.scene_manager.render(self.window.display)
+        profiler.mark(FramePhase.RENDER)
+        update_funtion = self.window.get_update_function(self.display_offset)
+        profiler.mark(FramePhase.UPSCALE)
+        self.scene_manager.render_screen(self.window.screen)
+        profiler.mark(FramePhase.RENDER_SCREEN)
+        if update_funtion is not None:
+            update_funtion()
+        self.capture_frame()
+        if self.recorder is not None:
+            self.recorder.capture(self.window.screen)
+        profiler.mark(FramePhase.PRESENT)
+        if self.dynamic_resolution is not None:
+            self.dynamic_resolution.update((perf_counter_ns() - start_ns) / 1e6)
+        return delta
+
+    def _finish_frame(self, delta: float):
+        """Record the frame once the wait for the next one is over"""
+        self.profiler.mark(FramePhase.TICK)
+        self.profiler.end_frame()
+        self._invalidated = False
+        self._frame_count += 1
+        self._elapsed_time += delta
+        self.check_limits()
+
+    def wait_next_frame(self):
+        """Wait for the next frame with the config pacing strategy"""
+        match self.config.pacing:
+            case FramePacing.HYBRID:
+                self.pacer.wait(self.config.target_fps)
+                self.clock.tick()
+            case FramePacing.BUSY:
+                self.clock.tick_busy_loop(self.config.target_fps)
+            case _:
+                self.clock.tick(self.config.target_fps)
+
+    async def wait_next_frame_async(self):
+        """Yield to the asyncio event loop until the next frame for target_fps"""
+        delay = 0.0
+        if self.config.target_fps > 0:
+            period_ns = 1_000_000_000 // self.config.target_fps
+            now = perf_counter_ns()
+            self._next_frame_ns = max(self._next_frame_ns + period_ns, now)
+            delay = (self._next_frame_ns - now) / 1e9
+        await asyncio.sleep(delay)
+        self.clock.tick()
+
+    def _idle_timeout(self) -> float | None:
+        """Get the seconds to wait for an event before running the frame, up to
+        config idle_timeout or the next timer; None if the scene isn't idle or
+        there are generator jobs to resume.
+        The scheduler only advances on frames that run, so the next timer is
+        kept as a perf_counter_ns deadline across the skipped frames"""
+        if not self.scene_manager.is_idle or self._invalidated:
+            return None
+        if self.event_handler.player is not None or self.jobs.pending:
+            return None
+        timeout = self.config.idle_timeout
+        if self._timer_deadline_ns is None:
+            if (next_timer := self.scheduler.next_timer) is None:
+                return timeout
+            self._timer_deadline_ns = perf_counter_ns() + round(next_timer * 1e9)
+        remaining = (self._timer_deadline_ns - perf_counter_ns()) / 1e9
+        return max(0.0, min(timeout, remaining))
+
+    def _timer_due(self) -> bool:
+        """Check if the deadline of the next timer has passed. The SDL wait can
+        return a bit early, so a deadline that close is slept until"""
+        if (deadline := self._timer_deadline_ns) is None:
+            return False
+        remaining_ns = deadline - perf_counter_ns()
+        if remaining_ns > _WAIT_SLACK_NS:
+            return False
+        if remaining_ns > 0:
+            sleep(remaining_ns / 1e9)
+        return True
+
+    async def _wait_event_async(self, timeout: float) -> bool:
+        """Yield to the asyncio event loop until there is an event, a task result
+        or an invalidation; return False after timeout seconds"""
+        deadline = perf_counter_ns() + round(timeout * 1e9)
+        while not (pygame.event.peek() or self._task_results or self._invalidated):
+            if perf_counter_ns() >= deadline:
+                return False
+            await asyncio.sleep(0.005)
+        return True
+
+    def spawn(
+        self,
+        coroutine: Coroutine,
+        callback: Callable[[Any], None] | None = None,
+        error_callback: Callable[[BaseException], None] | None = None,
+    ) -> asyncio.Task:
+        """Schedule a coroutine on the running asyncio loop (only inside run_async).
+        When it's done its result is given to callback on the next frame, after
+        events and before update. If it raises, the exception is given to
+        error_callback instead, or logged without it"""
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks.add(task)
+
+        def done(finished: asyncio.Task):
+            self._tasks.discard(finished)
+            if finished.cancelled():
+                return
+            if finished.exception() is not None or callback is not None:
+                self._task_results.append((finished, callback, error_callback))
+
+        task.add_done_callback(done)
+        return task
+
+    def _deliver_task_results(self):
+        """Give the finished tasks results to their callbacks and their
+        exceptions to their error callbacks"""
+        while self._task_results:
+            task, callback, error_callback = self._task_results.popleft()
+            if (error := task.exception()) is not None:
+                if error_callback is not None:
+                    error_callback(error)
+                else:
+                    logger.error("Spawned task %s failed", task, exc_info=error)
+            elif callback is not None:
+                callback(task.result())
+
+    def update_scene(self, delta: float):
+        """Update scene manager, in fixed steps if config tick_rate is set"""
+        if not self.config.tick_rate:
             self.scene_manager.update(delta)
-            self.scene_manager.render(self.window.display)
-            update_funtion = self.window.get_update_function(self.display_offset)
-            self.scene_manager.render_screen(self.window.screen)
-            if update_funtion is not None:
-                update_funtion()
-            self.clock.tick(self.config.target_fps)
+            return
+        step = 1 / self.config.tick_rate
+        self._accumulator += delta
+        steps = 0
+        while self._accumulator >= step and steps < self.config.max_steps_per_frame:
+            self.scene_manager.update(step)
+            self._accumulator -= step
+            steps += 1
+        if self._accumulator >= step:
+            # too far behind, drop the time that can't be simulated this frame
+            self._accumulator %= step
+        self._alpha = self._accumulator / step
+
+    def stop(self):
+        """Stop the main game loop at the end of the current frame"""
+        self._running = False
+
+    def invalidate(self):
+        """Redraw the next frame even if the scene is static"""
+        self._invalidated = True
+
+    def check_limits(self):
+        """Stop the game loop if config max_frames or max_time are reached"""
+        if self.config.max_frames and self._frame_count >= self.config.max_frames:
+            self.stop()
+        if self.config.max_time and self._elapsed_time >= self.config.max_time:
+            self.stop()
+        if (player := self.event_handler.player) is not None and player.finished:
+            self.stop()
+
+    def capture_frame(self):
+        """Save the screen to a png if the current frame is in config capture_frames"""
+        frames = self.config.capture_frames
+        if frames and self._frame_count in frames:
+            pygame.image.save(
+                self.window.screen, self.config.capture_path.format(self._frame_count)
+            )
+
+    def start_recording(
+        self,
+        path: str,
+        record_format: RecordFormat = RecordFormat.PNG,
+        buffers: int = 8,
+    ) -> FrameRecorder:
+        """Start recording the screen after every frame is presented.
+        Path is formatted with the frame number for png, raw frames are appended"""
+        self.stop_recording()
+        self.recorder = FrameRecorder(
+            path, self.window.screen.get_size(), record_format, buffers
+        ).start()
+        return self.recorder
+
+    def stop_recording(self):
+        """Stop recording, waiting for the pending frames to be saved"""
+        if self.recorder is not None:
+            self.recorder.stop()
+            self.recorder = None
+
+    def start_input_recording(self, path: str) -> InputRecorder:
+        """Start writing every frame deltatime and input events to path"""
+        self.stop_input_recording()
+        self.event_handler.recorder = InputRecorder(path, self.frame_clock)
+        return self.event_handler.recorder
+
+    def stop_input_recording(self):
+        """Stop writing input events, closing the file"""
+        if self.event_handler.recorder is not None:
+            self.event_handler.recorder.close()
+            self.event_handler.recorder = None
+
+    def start_replay(self, path: str) -> InputPlayer:
+        """Replay an input recording: its deltatimes and events are used instead of
+        the real ones and the game loop stops when it ends"""
+        player = InputPlayer(path)
+        self.event_handler.player = player
+        self.deltatimer.source = player.replay_delta
+        return player
+
+    def stop_replay(self):
+        """Go back to the real deltatimes and events"""
+        self.event_handler.player = None
+        self.deltatimer.source = None
 
     def init_game(self):
         """Init window, title, scene manager and fullscreen"""
@@ -47,6 +383,9 @@ class Game:  # pylint: disable=R0902
         self.event_handler.register(self)
         self.event_handler.register(self.keyboard)
         self.event_handler.register(self.mouse)
+        self.event_handler.register(self.joysticks)
+        if self.config.pool_events:
+            self.event_handler.register(self.pool)
         self.scene_manager.start_initial_scene()
         self.set_title(self.config.title)
         if self.config.start_fullscreen and self.window.config.can_fullscreen:
@@ -77,5 +416,25 @@ class Game:  # pylint: disable=R0902
 
     def quit(self):
         """Quit pygame and exit"""
+        self.stop_recording()
+        self.stop_input_recording()
+        self.pool.shutdown()
+        self.window.close()
         pygame.quit()
         sys.exit()
+
+    @property
+    def frame_count(self) -> int:
+        """Get the number of frames run"""
+        return self._frame_count
+
+    @property
+    def alpha(self) -> float:
+        """Get how far is rendering between the last fixed step and the next one,
+        scenes can use it in render to interpolate; always 1 without tick_rate"""
+        return self._alpha
+
+    @property
+    def elapsed_time(self) -> float:
+        """Get the sum of all deltatimes in seconds"""
+        return self._elapsed_time
@@ -1,6 +1,7 @@
 """Inputs"""
 
+from .actions import ActionMap, ActionState
 from .general import Input
-from .joystick import Joystick
+from .joystick import Joystick, JoystickManager
 from .keyboard import Keyboard
 from .mouse import Mouse
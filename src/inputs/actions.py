@@ -0,0 +1,219 @@
+"""## Action mapping"""
+
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable
+
+from .joystick import Joystick
+from .keyboard import Keyboard
+from .mouse import Mouse
+
+Checks = tuple[Callable[[], bool], ...]
+
+
+def _any_check(checks: Checks) -> bool:
+    """Check if any of checks is True, stopping at the first one"""
+    for check in checks:
+        if check():
+            return True
+    return False
+
+
+@dataclass
+class ActionBinding:
+    """Inputs that press an action"""
+
+    keys: tuple[int, ...] = ()
+    mouse_buttons: tuple[int, ...] = ()
+    joy_buttons: tuple[int, ...] = ()
+
+
+@dataclass
+class AxisBinding:
+    """Inputs that move an axis, keys give -1 or 1 and joystick axes their
+    value when it's out of deadzone"""
+
+    negative_keys: tuple[int, ...] = ()
+    positive_keys: tuple[int, ...] = ()
+    joy_axes: tuple[int, ...] = ()
+    deadzone: float = 0.2
+
+
+@dataclass
+class ActionState:
+    """State of every action and axis in the current frame"""
+
+    pressed: dict[str, bool] = field(default_factory=dict)
+    just_pressed: dict[str, bool] = field(default_factory=dict)
+    just_released: dict[str, bool] = field(default_factory=dict)
+    axes: dict[str, float] = field(default_factory=dict)
+
+
+class ActionMap:  # pylint: disable=R0902
+    """Bind named actions and axes to keys, mouse buttons and joystick buttons
+    and axes.
+
+    Bindings are compiled into a flat table of bound input methods that update
+    resolves once per frame into state. Binding again a name replaces it, so
+    actions can be rebound at any time"""
+
+    def __init__(
+        self,
+        keyboard: Keyboard,
+        mouse: Mouse,
+        joysticks: list[Joystick] | None = None,
+    ) -> None:
+        self.keyboard = keyboard
+        self.mouse = mouse
+        self.state = ActionState()
+        self._joysticks: list[Joystick] = list(joysticks or [])
+        self._actions: dict[str, ActionBinding] = {}
+        self._axes: dict[str, AxisBinding] = {}
+        self._action_table: list[tuple[str, Checks, Checks, Checks]] = []
+        self._axis_table: list[
+            tuple[str, Checks, Checks, tuple[Callable[[], float], ...], float]
+        ] = []
+        self._dirty = False
+
+    def bind_action(
+        self,
+        name: str,
+        keys: tuple[int, ...] = (),
+        mouse_buttons: tuple[int, ...] = (),
+        joy_buttons: tuple[int, ...] = (),
+    ):
+        """Bind an action, replacing its previous bindings"""
+        self._actions[name] = ActionBinding(keys, mouse_buttons, joy_buttons)
+        self._dirty = True
+
+    def bind_axis(  # pylint: disable=R0913
+        self,
+        name: str,
+        negative_keys: tuple[int, ...] = (),
+        positive_keys: tuple[int, ...] = (),
+        joy_axes: tuple[int, ...] = (),
+        deadzone: float = 0.2,
+    ):
+        """Bind an axis, replacing its previous bindings"""
+        self._axes[name] = AxisBinding(negative_keys, positive_keys, joy_axes, deadzone)
+        self._dirty = True
+
+    def unbind(self, name: str) -> bool:
+        """Remove an action or axis; return True if it existed"""
+        action = self._actions.pop(name, None)
+        axis = self._axes.pop(name, None)
+        if action is None and axis is None:
+            return False
+        for states in (
+            self.state.pressed,
+            self.state.just_pressed,
+            self.state.just_released,
+            self.state.axes,
+        ):
+            states.pop(name, None)
+        self._dirty = True
+        return True
+
+    def add_joystick(self, joystick: Joystick):
+        """Read the joystick bindings from joystick too"""
+        if joystick not in self._joysticks:
+            self._joysticks.append(joystick)
+            self._dirty = True
+
+    def remove_joystick(self, joystick: Joystick):
+        """Stop reading bindings from joystick"""
+        if joystick in self._joysticks:
+            self._joysticks.remove(joystick)
+            self._dirty = True
+
+    def _checks(self, binding: ActionBinding, method: str) -> Checks:
+        """Bind method (is_pressed, just_pressed or just_released) of every device
+        to the binding inputs"""
+        return (
+            tuple(partial(getattr(self.keyboard, method), key) for key in binding.keys)
+            + tuple(
+                partial(getattr(self.mouse, method), button)
+                for button in binding.mouse_buttons
+            )
+            + tuple(
+                partial(getattr(joystick, method), button)
+                for joystick in self._joysticks
+                for button in binding.joy_buttons
+            )
+        )
+
+    def compile(self):
+        """Build the evaluation table from the bindings"""
+        self._action_table = [
+            (
+                name,
+                self._checks(binding, "is_pressed"),
+                self._checks(binding, "just_pressed"),
+                self._checks(binding, "just_released"),
+            )
+            for name, binding in self._actions.items()
+        ]
+        self._axis_table = [
+            (
+                name,
+                tuple(
+                    partial(self.keyboard.is_pressed, key)
+                    for key in binding.negative_keys
+                ),
+                tuple(
+                    partial(self.keyboard.is_pressed, key)
+                    for key in binding.positive_keys
+                ),
+                tuple(
+                    partial(joystick.axis_value, axis)
+                    for joystick in self._joysticks
+                    for axis in binding.joy_axes
+                ),
+                binding.deadzone,
+            )
+            for name, binding in self._axes.items()
+        ]
+        self._dirty = False
+
+    def update(self):
+        """Resolve the bindings into state, call it once per frame after events.
+        The device edges are checked too, so an input pressed and released in
+        the same frame still gives just_pressed and just_released"""
+        if self._dirty:
+            self.compile()
+        pressed = self.state.pressed
+        just_pressed = self.state.just_pressed
+        just_released = self.state.just_released
+        for name, checks, press_checks, release_checks in self._action_table:
+            now = _any_check(checks)
+            before = pressed.get(name, False)
+            pressed[name] = now
+            just_pressed[name] = not before and (now or _any_check(press_checks))
+            just_released[name] = not now and (before or _any_check(release_checks))
+
+        axes = self.state.axes
+        for name, negatives, positives, getters, deadzone in self._axis_table:
+            value = 0.0
+            for check in negatives:
+                if check():
+                    value -= 1.0
+                    break
+            for check in positives:
+                if check():
+                    value += 1.0
+                    break
+            for getter in getters:
+                axis = getter()
+                if abs(axis) > deadzone:
+                    value += axis
+            axes[name] = max(-1.0, min(value, 1.0))
+
+    @property
+    def actions(self) -> dict[str, ActionBinding]:
+        """Get the action bindings"""
+        return self._actions
+
+    @property
+    def axes(self) -> dict[str, AxisBinding]:
+        """Get the axis bindings"""
+        return self._axes
@@ -13,12 +13,18 @@ class Input(Protocol):
     def handle_event(self, event: Event):
         """Handle a single event"""
 
+    def latch(self):
+        """Save the pressed state as the previous frame one"""
+
     def get_input_data(self, key: InputKey) -> Optional[Any]:
         """Get data of an specific input"""
 
     def is_pressed(self, key: InputKey) -> bool:
         """Check if input key is pressed"""
 
+    def was_pressed(self, key: InputKey) -> bool:
+        """Check if input key was pressed in the previous frame"""
+
     def just_pressed(self, key: InputKey) -> bool:
         """Check if input key is pressed in this exact frame"""
 
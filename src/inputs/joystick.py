@@ -1,13 +1,16 @@
 """## Joystick handling"""
 
+import math
+from array import array
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import pygame
 
 from ..consts import JoyGetInputFuction
-from ..timers import TimeClock
+from ..timers import FrameClock, frame_clock
 from .general import InputKey
+from .states import ButtonStates
 
 
 @dataclass
@@ -41,31 +44,68 @@ class Axi:  # pylint: disable=R0902
 
 
 class Joystick:  # pylint: disable=R0902 disable=R0904
-    """Class for handling keys events"""
-
-    _all_joysticks: dict[str, pygame.joystick.JoystickType] = {}
-    _active_joys: list[int] = []
-
-    def __init__(self, get_input_funtion_type=JoyGetInputFuction.BUTTONS) -> None:
-        joystick = self._connect_joystick()
+    """Class for handling joystick events.
+
+    By default the state comes from events. If polled, axes, buttons, hats and
+    balls are read from the device once per frame by update and only device
+    events are handled, so the rest can be blocked. Axis values go through a
+    deadzone and the axi sensitivity, axes paired with set_stick use a radial
+    deadzone on the stick instead"""
+
+    handled_events = (
+        pygame.JOYDEVICEADDED,
+        pygame.JOYDEVICEREMOVED,
+        pygame.JOYAXISMOTION,
+        pygame.JOYBALLMOTION,
+        pygame.JOYHATMOTION,
+        pygame.JOYBUTTONDOWN,
+        pygame.JOYBUTTONUP,
+    )
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        get_input_funtion_type=JoyGetInputFuction.BUTTONS,
+        clock: FrameClock | None = None,
+        polled: bool = False,
+        deadzone: float = 1e-4,
+        device: pygame.joystick.JoystickType | None = None,
+    ) -> None:
+        joystick = device if device is not None else pygame.Joystick(0)
+        self._device = joystick
         self._instance_id = joystick.get_instance_id()
         self._guid = joystick.get_guid()
         self._joystick_active = True
-        self._buttons: dict[InputKey, JoyButton] = {}
-        self._axis: dict[InputKey, Axi] = {}
-        Joystick._all_joysticks[self._guid] = joystick
-        Joystick._active_joys.append(self._instance_id)
+        self._joy = joystick.get_id()
+        self._clock = clock or frame_clock
+        self.polled = polled
+        if polled:
+            self.handled_events = (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED)
+        axes = joystick.get_numaxes()
+        self._buttons = ButtonStates(joystick.get_numbuttons())
+        self._axis_states = ButtonStates(axes)
+        self._raw_axes = array("d", [0.0]) * axes
+        self._axes = array("d", [0.0]) * axes
+        self._deadzones = array("d", [deadzone]) * axes
+        self._sensitivities = array("d", [1.0]) * axes
+        self._sticks: list[tuple[int, int, float]] = []
+        self._stick_of: dict[int, int] = {}
+        self._hats = array("b", [0]) * (2 * joystick.get_numhats())
+        self._balls = array("i", [0]) * (2 * joystick.get_numballs())
         self.change_get_input_function(get_input_funtion_type)
 
-    def _connect_joystick(self):
-        """Search for an avalibe id and return a new joystick"""
-        if len(Joystick._active_joys) == pygame.joystick.get_count():
-            raise pygame.error("There aren't more joystick connected.")
+    def connect(self, device: pygame.joystick.JoystickType):
+        """Use device, when the same controller is connected again"""
+        self._device = device
+        self._instance_id = device.get_instance_id()
+        self._joy = device.get_id()
+        self._joystick_active = True
 
-        for i in range(pygame.joystick.get_count()):
-            if i not in Joystick._active_joys:
-                break
-        return pygame.Joystick(i)
+    def disconnect(self):
+        """Stop using the device and forget the inputs state"""
+        if self._joystick_active:
+            self._device.quit()
+            self._joystick_active = False
+            self._reset()
 
     def change_get_input_function(self, funtion_type=JoyGetInputFuction.BUTTONS):
         """Change get_input_data function between get_axi and get_button"""
@@ -80,211 +120,309 @@ class Joystick:  # pylint: disable=R0902 disable=R0904
         match event.type:
             case pygame.JOYDEVICEADDED:
                 if event.guid == self._guid and not self._joystick_active:
-                    if self._instance_id in Joystick._active_joys:
-                        # assign a new joystick
-                        Joystick._all_joysticks[self._guid] = self._connect_joystick()
-                    try:
-                        # init joystick if is connected
-                        Joystick._all_joysticks[self._guid].init()
-                    except pygame.error:
-                        # assign a new joystick
-                        Joystick._all_joysticks[self._guid] = self._connect_joystick()
-
-                    self._instance_id = Joystick._all_joysticks[
-                        self._guid
-                    ].get_instance_id()
-                    self._joystick_active = True
-                    Joystick._active_joys.append(self._instance_id)
+                    self.connect(pygame.Joystick(event.device_index))
             case pygame.JOYDEVICEREMOVED:
-                if event.instance_id == self._instance_id and self._joystick_active:
-                    Joystick._all_joysticks[self._guid].quit()
-                    Joystick._active_joys.remove(self._instance_id)
-                    self._joystick_active = False
-                    self._buttons = {}
-                    self._axis = {}
+                if event.instance_id == self._instance_id:
+                    self.disconnect()
             case pygame.JOYAXISMOTION:
                 if event.instance_id != self._instance_id:
                     return
-                if event.axis not in self._axis:
-                    start_time = TimeClock.seconds()
-                    start_frame = pygame.time.get_ticks()
-                    self._axis[event.axis] = Axi(
-                        event.joy,
-                        event.instance_id,
-                        event.axis,
-                        event.value,
-                        True,
-                        start_time,
-                        start_frame,
-                        None,
-                        None,
-                    )
-                else:
-                    axi = self._axis[event.axis]
-                    axi.joy = event.joy
-                    axi.instance_id = event.instance_id
-                    axi.axis = event.axis
-
-                    prescision = 0 + 1 * axi.sensitivity
-                    axi.value = event.value * prescision
-                    if prescision * -10e-5 <= axi.value <= prescision * 10e-5:
-                        axi.moving = False
-                        axi.end_time = TimeClock.seconds()
-                        axi.end_frame = pygame.time.get_ticks()
-                    else:
-                        axi.moving = True
-                        axi.end_time = None
-                        axi.end_frame = None
+                if event.axis < len(self._raw_axes):
+                    self._raw_axes[event.axis] = event.value
+                    self._shape_axis(event.axis)
+            case pygame.JOYHATMOTION:
+                if event.instance_id != self._instance_id:
+                    return
+                if 2 * event.hat < len(self._hats):
+                    (
+                        self._hats[2 * event.hat],
+                        self._hats[2 * event.hat + 1],
+                    ) = event.value
+            case pygame.JOYBALLMOTION:
+                if event.instance_id != self._instance_id:
+                    return
+                if 2 * event.ball < len(self._balls):
+                    self._balls[2 * event.ball] += event.rel[0]
+                    self._balls[2 * event.ball + 1] += event.rel[1]
             case pygame.JOYBUTTONDOWN:
                 if event.instance_id != self._instance_id:
                     return
-                start_time = TimeClock().seconds()
-                start_frame = pygame.time.get_ticks()
-                self._buttons[event.button] = JoyButton(
-                    event.joy,
-                    event.instance_id,
-                    event.button,
-                    True,
-                    start_time,
-                    start_frame,
-                    None,
-                    None,
-                )
+                self._joy = event.joy
+                self._buttons.grow(event.button + 1)
+                self._buttons.press(event.button, self._clock.frame, self._clock.time)
             case pygame.JOYBUTTONUP:
                 if event.instance_id != self._instance_id:
                     return
-                button: JoyButton = self._buttons[event.button]
-                button.pressed = False
-                button.end_time = TimeClock.seconds()
-                button.end_frame = pygame.time.get_ticks()
-            # TODO: Handle pygame.JOYBALLMOTION and pygame.JOYHATMOTION events
+                self._buttons.grow(event.button + 1)
+                self._buttons.release(event.button, self._clock.frame, self._clock.time)
+
+    def _reset(self):
+        """Forget the state of every input"""
+        self._buttons.clear()
+        self._axis_states.clear()
+        for values in (self._raw_axes, self._axes, self._hats, self._balls):
+            values[:] = array(values.typecode, [0]) * len(values)
+
+    def update(self):
+        """Read every axi, button, hat and ball from the device and shape the axes
+        in polled mode, call it once per frame after events"""
+        if not self.polled or not self._joystick_active:
+            return
+        device = self._device
+        frame = self._clock.frame
+        time = self._clock.time
+        raw_axes = self._raw_axes
+        raw_axes[:] = array("d", map(device.get_axis, range(len(raw_axes))))
+        buttons = self._buttons
+        for i in range(min(len(buttons.pressed), device.get_numbuttons())):
+            if device.get_button(i) != buttons.pressed[i]:
+                if buttons.pressed[i]:
+                    buttons.release(i, frame, time)
+                else:
+                    buttons.press(i, frame, time)
+        hats = self._hats
+        for i in range(len(hats) // 2):
+            hats[2 * i], hats[2 * i + 1] = device.get_hat(i)
+        balls = self._balls
+        for i in range(len(balls) // 2):
+            x, y = device.get_ball(i)
+            balls[2 * i] += x
+            balls[2 * i + 1] += y
+
+        stick_of = self._stick_of
+        for i in range(len(raw_axes)):
+            if i not in stick_of:
+                self._shape_axis(i)
+        for x_axis, y_axis, deadzone in self._sticks:
+            self._shape_stick(x_axis, y_axis, deadzone)
+
+    def _shape_axis(self, axis: int):
+        """Apply the deadzone and sensitivity of axis to its raw value"""
+        if (stick := self._stick_of.get(axis)) is not None:
+            self._shape_stick(*self._sticks[stick])
+            return
+        value = self._raw_axes[axis]
+        deadzone = self._deadzones[axis]
+        if abs(value) <= deadzone:
+            value = 0.0
+        elif deadzone > 0:
+            value = math.copysign((abs(value) - deadzone) / (1 - deadzone), value)
+        self._set_axis(axis, value * self._sensitivities[axis])
+
+    def _shape_stick(self, x_axis: int, y_axis: int, deadzone: float):
+        """Apply a radial deadzone and the sensitivity to a pair of axes"""
+        x = self._raw_axes[x_axis]
+        y = self._raw_axes[y_axis]
+        magnitude = math.hypot(x, y)
+        if magnitude <= deadzone:
+            x = y = 0.0
+        else:
+            scale = min(1.0, (magnitude - deadzone) / (1 - deadzone)) / magnitude
+            x *= scale
+            y *= scale
+        self._set_axis(x_axis, x * self._sensitivities[x_axis])
+        self._set_axis(y_axis, y * self._sensitivities[y_axis])
+
+    def _set_axis(self, axis: int, value: float):
+        """Set the shaped value of axis, starting or ending its move"""
+        self._axes[axis] = value
+        states = self._axis_states
+        if (value != 0.0) != states.is_pressed(axis):
+            if value != 0.0:
+                states.press(axis, self._clock.frame, self._clock.time)
+            else:
+                states.release(axis, self._clock.frame, self._clock.time)
+
+    def latch(self):
+        """Save the pressed buttons and moving axes as the previous frame ones and
+        reset the balls motion, call it at the start of every frame"""
+        self._buttons.latch()
+        self._axis_states.latch()
+        if balls := self._balls:
+            balls[:] = array("i", [0]) * len(balls)
 
     # buttons mehtods
     def get_button(self, key: InputKey) -> Optional[JoyButton]:
         """Get data of an specific button"""
-        return self._buttons[key] if key in self._buttons else None
+        if (start_frame := self._buttons.press_frame(key)) is None:
+            return None
+        return JoyButton(
+            self._joy,
+            self._instance_id,
+            key,
+            self._buttons.is_pressed(key),
+            self._buttons.press_time(key),
+            start_frame,
+            self._buttons.release_time(key),
+            self._buttons.release_frame(key),
+        )
 
     def is_pressed(self, key: InputKey) -> bool:
         """Check if a button is pressed"""
-        return k.pressed if (k := self.get_button(key)) else False
+        return self._buttons.is_pressed(key)
+
+    def was_pressed(self, key: InputKey) -> bool:
+        """Check if a button was pressed in the previous frame"""
+        return self._buttons.was_pressed(key)
 
     def just_pressed(self, key: InputKey) -> bool:
         """Check if a button is pressed in this exact frame"""
-        return self.hold_frames(key) == 0
+        return self._buttons.press_frame(key) == self._clock.frame
 
     def just_released(self, key: InputKey) -> bool:
         """Check if a button stop being pressed in this exact frame"""
-        return k.end_frame if (k := self.get_button(key)) else None
+        return self._buttons.release_frame(key) == self._clock.frame
 
     def press_time(self, key: InputKey) -> Optional[float]:
         """Get the time that a button was pressed"""
-        return k.start_time if (k := self.get_button(key)) else None
+        return self._buttons.press_time(key)
 
     def press_frame(self, key: InputKey) -> Optional[int]:
         """Get the frame that a button was pressed"""
-        return k.start_frame if (k := self.get_button(key)) else None
+        return self._buttons.press_frame(key)
 
     def hold_time(self, key: InputKey) -> Optional[float]:
         """Return how long a button is being pressed"""
-        return (
-            TimeClock.seconds() - k.start_time if (k := self.get_button(key)) else None
-        )
+        k = self.press_time(key)
+        return None if k is None else self._clock.time - k
 
     def hold_frames(self, key: InputKey) -> Optional[int]:
         """Return how many frames a button is being pressed"""
-        return (
-            pygame.time.get_ticks() - k.start_frame
-            if (k := self.get_button(key))
-            else None
-        )
+        k = self.press_frame(key)
+        return None if k is None else self._clock.frame - k
 
     def release_time(self, key: InputKey) -> Optional[float]:
         """Return the time a button stop being pressed"""
-        return k.end_time if (k := self.get_button(key)) else None
+        return self._buttons.release_time(key)
 
     def release_frame(self, key: InputKey) -> Optional[int]:
         """Return the frame a button stop being pressed"""
-        return k.end_frame if (k := self.get_button(key)) else None
+        return self._buttons.release_frame(key)
 
     def time_since_release(self, key: InputKey) -> Optional[float]:
         """Return how long a button stop pressed"""
-        return TimeClock.seconds() - k if (k := self.release_time(key)) else None
+        k = self.release_time(key)
+        return None if k is None else self._clock.time - k
 
     def frames_since_release(self, key: InputKey) -> Optional[int]:
         """Return how many frames a button stop pressed"""
-        return pygame.time.get_ticks() - k if (k := self.release_frame(key)) else None
+        k = self.release_frame(key)
+        return None if k is None else self._clock.frame - k
 
     # axes methods
     def get_axi(self, key: InputKey) -> Optional[Axi]:
         """Get data of an specific axi"""
-        return self._axis[key] if key in self._axis else None
+        if (start_frame := self._axis_states.press_frame(key)) is None:
+            return None
+        return Axi(
+            self._joy,
+            self._instance_id,
+            key,
+            self._axes[key],
+            self._axis_states.is_pressed(key),
+            self._axis_states.press_time(key),
+            start_frame,
+            self._axis_states.release_time(key),
+            self._axis_states.release_frame(key),
+            self._sensitivities[key],
+        )
+
+    def axis_value(self, key: InputKey) -> float:
+        """Get the value of an axi after deadzone and sensitivity"""
+        return self._axes[key] if 0 <= key < len(self._axes) else 0.0
 
     def is_moving(self, key: InputKey) -> bool:
         """Check if an axi is moving"""
-        return k.moving if (k := self.get_axi(key)) else False
+        return self._axis_states.is_pressed(key)
 
     def just_move(self, key: InputKey) -> bool:
         """Check if an axi is moving in this exact frame"""
-        return self.hold_frames_axi(key) == 0
+        return self._axis_states.press_frame(key) == self._clock.frame
 
     def just_released_axi(self, key: InputKey) -> bool:
         """Check if an axi stop moving in this exact frame"""
-        return k.end_frame if (k := self.get_axi(key)) else None
+        return self._axis_states.release_frame(key) == self._clock.frame
 
     def move_time(self, key: InputKey) -> Optional[float]:
         """Get the time that an axi start moving"""
-        return k.start_time if (k := self.get_axi(key)) else None
+        return self._axis_states.press_time(key)
 
     def move_frame(self, key: InputKey) -> Optional[int]:
         """Get the frame that an axi start moving"""
-        return k.start_frame if (k := self.get_axi(key)) else None
+        return self._axis_states.press_frame(key)
 
     def hold_time_axi(self, key: InputKey) -> Optional[float]:
         """Return how long an axi is moving"""
-        return TimeClock.seconds() - k.start_time if (k := self.get_axi(key)) else None
+        k = self.move_time(key)
+        return None if k is None else self._clock.time - k
 
     def hold_frames_axi(self, key: InputKey) -> Optional[int]:
         """Return how many frames an axi is moving"""
-        return (
-            pygame.time.get_ticks() - k.start_frame
-            if (k := self.get_axi(key))
-            else None
-        )
+        k = self.move_frame(key)
+        return None if k is None else self._clock.frame - k
 
     def release_time_axi(self, key: InputKey) -> Optional[float]:
         """Return the time an axi stop moving"""
-        return k.end_time if (k := self.get_axi(key)) else None
+        return self._axis_states.release_time(key)
 
     def release_frame_axi(self, key: InputKey) -> Optional[int]:
         """Return the frame an axi stop moving"""
-        return k.end_frame if (k := self.get_axi(key)) else None
+        return self._axis_states.release_frame(key)
 
     def time_since_release_axi(self, key: InputKey) -> Optional[float]:
         """Return how long an axi stop moving"""
-        return TimeClock.seconds() - k if (k := self.release_time_axi(key)) else None
+        k = self.release_time_axi(key)
+        return None if k is None else self._clock.time - k
 
     def frames_since_release_axi(self, key: InputKey) -> Optional[int]:
         """Return how many frames an axi stop moving"""
-        return (
-            pygame.time.get_ticks() - k if (k := self.release_frame_axi(key)) else None
-        )
+        k = self.release_frame_axi(key)
+        return None if k is None else self._clock.frame - k
 
     def change_axi_precision(self, key: InputKey, sensitivity: float):
         """Change the sensitivity of an axi"""
-        if key in self._axis:
-            sensitivity = max(0.0, min(sensitivity, 1.0))
-            self._axis[key].sensitivity = sensitivity
+        if 0 <= key < len(self._sensitivities):
+            self._sensitivities[key] = max(0.0, min(sensitivity, 1.0))
+
+    def set_deadzone(self, key: InputKey, deadzone: float):
+        """Change the deadzone of an axi, values under it are 0"""
+        if 0 <= key < len(self._deadzones):
+            self._deadzones[key] = max(0.0, min(deadzone, 0.99))
+
+    def set_stick(self, x_axis: int, y_axis: int, deadzone: float = 0.2):
+        """Pair two axes as a stick with a radial deadzone, the stick is still
+        while its distance to the center is under deadzone"""
+        self._stick_of[x_axis] = self._stick_of[y_axis] = len(self._sticks)
+        self._sticks.append((x_axis, y_axis, max(0.0, min(deadzone, 0.99))))
+
+    # hats and balls methods
+    def hat(self, key: InputKey) -> tuple[int, int]:
+        """Get the (x, y) position of a hat"""
+        if 0 <= key < len(self._hats) // 2:
+            return self._hats[2 * key], self._hats[2 * key + 1]
+        return 0, 0
+
+    def ball(self, key: InputKey) -> tuple[int, int]:
+        """Get the (x, y) motion of a ball in this frame"""
+        if 0 <= key < len(self._balls) // 2:
+            return self._balls[2 * key], self._balls[2 * key + 1]
+        return 0, 0
 
     @property
     def joystick_type(self):
         """Get JoystickType"""
-        return Joystick._all_joysticks[self._guid]
+        return self._device
 
     @property
     def instance_id(self):
         """Get joystick instance id"""
         return self._instance_id
 
+    @property
+    def guid(self) -> str:
+        """Get joystick guid"""
+        return self._guid
+
     @property
     def is_active(self):
         """It's joystick active"""
@@ -296,8 +434,7 @@ class Joystick:  # pylint: disable=R0902 disable=R0904
         if not self._joystick_active:
             return []
         return [
-            Joystick._all_joysticks[self._guid].get_button(i)
-            for i in range(Joystick._all_joysticks[self._guid].get_numbuttons())
+            self._device.get_button(i) for i in range(self._device.get_numbuttons())
         ]
 
     @property
@@ -305,17 +442,138 @@ class Joystick:  # pylint: disable=R0902 disable=R0904
         """JoystickType.get_axis for all axes"""
         if not self._joystick_active:
             return []
-        return [
-            Joystick._all_joysticks[self._guid].get_axis(i)
-            for i in range(Joystick._all_joysticks[self._guid].get_numaxes())
-        ]
+        return [self._device.get_axis(i) for i in range(self._device.get_numaxes())]
 
     @property
     def joystick_balls(self):
         """JoystickType.get_ball for all balls"""
         if not self._joystick_active:
             return []
-        return [
-            Joystick._all_joysticks[self._guid].get_ball
-            for i in range(Joystick._all_joysticks[self._guid].get_numballs())
-        ]
+        return [self._device.get_ball(i) for i in range(self._device.get_numballs())]
+
+
+class JoystickManager:  # pylint: disable=R0902
+    """Open a Joystick for every connected controller and route each event only
+    to the joystick it belongs to.
+
+    Joysticks are kept by instance id and get a slot that is kept while
+    disconnected, so a controller with the same guid takes it back when
+    connected again. Other controllers take the oldest disconnected slot,
+    dropping its guid, and only add a slot when none is disconnected"""
+
+    handled_events = Joystick.handled_events
+
+    def __init__(
+        self,
+        clock: FrameClock | None = None,
+        polled: bool = False,
+        deadzone: float = 1e-4,
+    ) -> None:
+        self._clock = clock or frame_clock
+        self.polled = polled
+        self.deadzone = deadzone
+        self._joysticks: dict[int, Joystick] = {}
+        self._slots: list[Joystick | None] = []
+        self._slot_of: dict[int, int] = {}
+        # disconnected slot: guid, oldest first
+        self._disconnected: dict[int, str] = {}
+        self.on_connect: Callable[[Joystick], None] | None = None
+        self.on_disconnect: Callable[[Joystick], None] | None = None
+        if polled:
+            self.handled_events = (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED)
+
+    def handle_event(self, event: pygame.Event):
+        """Handle device events and send the rest to their joystick"""
+        match event.type:
+            case pygame.JOYDEVICEADDED:
+                # a replayed event may name a device that isn't plugged in
+                if event.device_index < pygame.joystick.get_count():
+                    self.add(pygame.Joystick(event.device_index))
+            case pygame.JOYDEVICEREMOVED:
+                self.remove(event.instance_id)
+            case _:
+                if (joystick := self._joysticks.get(event.instance_id)) is not None:
+                    joystick.handle_event(event)
+
+    def add(self, device: pygame.joystick.JoystickType) -> Joystick:
+        """Open a joystick for device, reusing the one of a disconnected
+        controller with the same guid"""
+        instance_id = device.get_instance_id()
+        if (joystick := self._joysticks.get(instance_id)) is not None:
+            return joystick
+        guid = device.get_guid()
+        slot = next((s for s, g in self._disconnected.items() if g == guid), None)
+        if slot is not None:
+            del self._disconnected[slot]
+            joystick = self._slots[slot]
+            joystick.connect(device)
+        else:
+            joystick = Joystick(
+                clock=self._clock,
+                polled=self.polled,
+                deadzone=self.deadzone,
+                device=device,
+            )
+            slot = self._free_slot()
+            self._slots[slot] = joystick
+        self._joysticks[instance_id] = joystick
+        self._slot_of[instance_id] = slot
+        if self.on_connect is not None:
+            self.on_connect(joystick)
+        return joystick
+
+    def remove(self, instance_id: int) -> Joystick | None:
+        """Disconnect the joystick of instance_id, keeping its slot"""
+        joystick = self._joysticks.pop(instance_id, None)
+        if joystick is None:
+            return None
+        slot = self._slot_of.pop(instance_id)
+        joystick.disconnect()
+        self._disconnected[slot] = joystick.guid
+        if self.on_disconnect is not None:
+            self.on_disconnect(joystick)
+        return joystick
+
+    def _free_slot(self) -> int:
+        """Get the oldest disconnected slot, dropping its guid, or a new one"""
+        if self._disconnected:
+            slot = next(iter(self._disconnected))
+            del self._disconnected[slot]
+            return slot
+        self._slots.append(None)
+        return len(self._slots) - 1
+
+    def latch(self):
+        """Latch every connected joystick, call it at the start of every frame"""
+        for joystick in self._joysticks.values():
+            joystick.latch()
+
+    def update(self):
+        """Poll every connected joystick in polled mode, call it after events"""
+        if self.polled:
+            for joystick in self._joysticks.values():
+                joystick.update()
+
+    def get(self, slot: int) -> Joystick | None:
+        """Get the joystick of a slot, None if it's empty or disconnected"""
+        if 0 <= slot < len(self._slots):
+            joystick = self._slots[slot]
+            if joystick is not None and joystick.is_active:
+                return joystick
+        return None
+
+    def get_by_instance_id(self, instance_id: int) -> Joystick | None:
+        """Get the connected joystick of an instance id"""
+        return self._joysticks.get(instance_id)
+
+    def slot(self, joystick: Joystick) -> int | None:
+        """Get the slot of a connected joystick"""
+        return self._slot_of.get(joystick.instance_id)
+
+    @property
+    def joysticks(self) -> list[Joystick]:
+        """Get the connected joysticks"""
+        return list(self._joysticks.values())
+
+    def __len__(self) -> int:
+        return len(self._joysticks)
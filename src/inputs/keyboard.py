@@ -1,111 +1,201 @@
 """## Keyboard handling"""
 
-from dataclasses import dataclass
 from typing import Optional
 
 import pygame
 
-from ..timers import TimeClock
+from ..timers import FrameClock, frame_clock
 from .general import InputKey
+from .states import ButtonStates
 
+_SCANCODE_MASK = 1 << 30
+_SCANCODE_SLOT = 512
+_OVERFLOW_SLOT = 1024
 
-@dataclass
-class KeyboardKey:
-    """KeyboardKey dataclass"""
 
-    key: int
-    name: str
-    pressed: bool
-    start_time: float
-    start_frame: int
-    end_time: Optional[float]
-    end_frame: Optional[int]
+class KeyboardKey:
+    """State of a key read from the keyboard arrays. There is one record per key
+    that is reused on every press, the name is looked up the first time it's
+    read"""
+
+    __slots__ = ("key", "_slot", "_states", "_name")
+
+    def __init__(self, key: int, slot: int, states: ButtonStates) -> None:
+        self.key = key
+        self._slot = slot
+        self._states = states
+        self._name: str | None = None
+
+    @property
+    def name(self) -> str:
+        """Get the key name"""
+        if self._name is None:
+            self._name = pygame.key.name(self.key)
+        return self._name
+
+    @property
+    def pressed(self) -> bool:
+        """Check if the key is pressed"""
+        return self._states.is_pressed(self._slot)
+
+    @property
+    def start_time(self) -> Optional[float]:
+        """Get the time the key was pressed"""
+        return self._states.press_time(self._slot)
+
+    @property
+    def start_frame(self) -> Optional[int]:
+        """Get the frame the key was pressed"""
+        return self._states.press_frame(self._slot)
+
+    @property
+    def end_time(self) -> Optional[float]:
+        """Get the time the key was released, None while it's pressed"""
+        return self._states.release_time(self._slot)
+
+    @property
+    def end_frame(self) -> Optional[int]:
+        """Get the frame the key was released, None while it's pressed"""
+        return self._states.release_frame(self._slot)
+
+    def __repr__(self) -> str:
+        return f"KeyboardKey(key={self.key}, pressed={self.pressed})"
 
 
 class Keyboard:
-    """Class for handling keys events"""
-
-    def __init__(self):
-        self._keys: dict[InputKey, KeyboardKey] = {}
+    """Class for handling keys events.
+
+    Key states are stored in arrays: keys under 512 use their own slot, SDL
+    scancode keys use 512 plus their scancode and any other key gets a slot
+    the first time it's pressed. Keys can also be given by name (as in
+    pygame.key.key_code)"""
+
+    handled_events = (pygame.KEYDOWN, pygame.KEYUP)
+
+    def __init__(self, clock: FrameClock | None = None):
+        self._states = ButtonStates(_OVERFLOW_SLOT)
+        self._overflow: dict[int, int] = {}
+        self._overflow_keys: list[int] = []
+        self._key_codes: dict[str, int] = {}
+        self._records: list[KeyboardKey | None] = [None] * _OVERFLOW_SLOT
+        self._clock = clock or frame_clock
+
+    def _slot(self, key: InputKey, create: bool = False) -> int:
+        """Get the states slot of key, -1 if it doesn't have one"""
+        if isinstance(key, str):
+            key = self._key_code(key)
+        if 0 <= key < _SCANCODE_SLOT:
+            return key
+        if key & _SCANCODE_MASK:
+            return _SCANCODE_SLOT + (key & 0x1FF)
+        slot = self._overflow.get(key, -1)
+        if slot == -1 and create:
+            slot = _OVERFLOW_SLOT + len(self._overflow)
+            self._overflow[key] = slot
+            self._overflow_keys.append(key)
+            self._states.grow(slot + 1)
+            self._records.append(None)
+        return slot
+
+    def _key(self, slot: int) -> int:
+        """Get the key of a states slot"""
+        if slot < _SCANCODE_SLOT:
+            return slot
+        if slot < _OVERFLOW_SLOT:
+            return _SCANCODE_MASK | (slot - _SCANCODE_SLOT)
+        return self._overflow_keys[slot - _OVERFLOW_SLOT]
+
+    def _key_code(self, name: str) -> int:
+        """Get the key of a key name, ValueError if it's unknown"""
+        if (key := self._key_codes.get(name)) is None:
+            key = self._key_codes[name] = pygame.key.key_code(name)
+        return key
 
     def handle_event(self, event: pygame.Event) -> None:
         """Handle a single event"""
         if event.type == pygame.KEYDOWN:
-            start_time = TimeClock.seconds()
-            start_frame = pygame.time.get_ticks()
-            self._keys[event.key] = KeyboardKey(
-                key=event.key,
-                name=pygame.key.name(event.key),
-                pressed=True,
-                start_time=start_time,
-                start_frame=start_frame,
-                end_time=None,
-                end_frame=None,
+            self._states.press(
+                self._slot(event.key, True), self._clock.frame, self._clock.time
             )
         elif event.type == pygame.KEYUP:
-            self._keys[event.key].pressed = False
-            self._keys[event.key].end_time = TimeClock.seconds()
-            self._keys[event.key].end_frame = pygame.time.get_ticks()
+            self._states.release(
+                self._slot(event.key, True), self._clock.frame, self._clock.time
+            )
+
+    def latch(self):
+        """Save the pressed keys as the previous frame ones, call it at the start
+        of every frame"""
+        self._states.latch()
 
     def get_input_data(self, key: InputKey) -> Optional[KeyboardKey]:
         """Get data of an specific key"""
-        return self._keys[key] if key in self._keys else None
+        slot = self._slot(key)
+        if self._states.press_frame(slot) is None:
+            return None
+        if (record := self._records[slot]) is None:
+            record = self._records[slot] = KeyboardKey(
+                self._key(slot), slot, self._states
+            )
+        return record
 
     def is_pressed(self, key: InputKey) -> bool:
         """Check if key is pressed"""
-        return k.pressed if (k := self.get_input_data(key)) else False
+        return self._states.is_pressed(self._slot(key))
+
+    def was_pressed(self, key: InputKey) -> bool:
+        """Check if key was pressed in the previous frame"""
+        return self._states.was_pressed(self._slot(key))
 
     def just_pressed(self, key: InputKey) -> bool:
         """Check if key is pressed in this exact frame"""
-        return self.hold_frames(key) == 0
+        return self._states.press_frame(self._slot(key)) == self._clock.frame
 
     def just_released(self, key: InputKey) -> bool:
         """Check if key stop being pressed in this exact frame"""
-        return self.frames_since_release(key) == 0
+        return self._states.release_frame(self._slot(key)) == self._clock.frame
 
     def press_time(self, key: InputKey) -> Optional[float]:
         """Get the time that an input key was pressed"""
-        return k.start_time if (k := self.get_input_data(key)) else None
+        return self._states.press_time(self._slot(key))
 
     def press_frame(self, key: InputKey) -> Optional[int]:
         """Get the frame that an input key was pressed"""
-        return k.start_frame if (k := self.get_input_data(key)) else None
+        return self._states.press_frame(self._slot(key))
 
     def hold_time(self, key: InputKey) -> Optional[float]:
         """Return how long an input key is being pressed"""
-        return (
-            TimeClock.seconds() - k.start_time
-            if (k := self.get_input_data(key))
-            else None
-        )
+        t = self.press_time(key)
+        return None if t is None else self._clock.time - t
 
     def hold_frames(self, key: InputKey) -> Optional[int]:
         """Return how many frames an input key is being pressed"""
-        return (
-            pygame.time.get_ticks() - k.start_frame
-            if (k := self.get_input_data(key))
-            else None
-        )
+        t = self.press_frame(key)
+        return None if t is None else self._clock.frame - t
 
     def release_time(self, key: InputKey) -> Optional[float]:
         """Return the time an input key stop being pressed"""
-        return k.end_time if (k := self.get_input_data(key)) else None
+        return self._states.release_time(self._slot(key))
 
     def release_frame(self, key: InputKey) -> Optional[int]:
         """Return the frame an input key stop being pressed"""
-        return k.end_frame if (k := self.get_input_data(key)) else None
+        return self._states.release_frame(self._slot(key))
 
     def time_since_release(self, key: InputKey) -> Optional[float]:
         """Return how long an input key stop pressed"""
-        return TimeClock.seconds() - t if (t := self.release_time(key)) else None
+        t = self.release_time(key)
+        return None if t is None else self._clock.time - t
 
     def frames_since_release(self, key: InputKey) -> Optional[int]:
         """Return how many frames an input key stop pressed"""
-        return pygame.time.get_ticks() - t if (t := self.release_frame(key)) else None
+        t = self.release_frame(key)
+        return None if t is None else self._clock.frame - t
 
     def get_pressed(self) -> list[KeyboardKey]:
         """Get all keys being pressed"""
-        return [k for k in self._keys.values() if k.pressed]
+        return [
+            self.get_input_data(self._key(slot))
+            for slot in self._states.pressed_slots()
+        ]
 
     def __getitem__(self, key: InputKey) -> Optional[KeyboardKey]:
         return self.get_input_data(key)
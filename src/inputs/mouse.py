@@ -1,12 +1,14 @@
 """## Mouse handling"""
 
+from array import array
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import pygame
 
-from ..timers import TimeClock
+from ..timers import FrameClock, frame_clock
 from .general import InputKey
+from .states import ButtonStates
 
 
 @dataclass
@@ -26,13 +28,14 @@ class MouseButton:
 
 @dataclass
 class Motion:
-    """Motion dataclass"""
+    """Motion dataclass, rel is the sum of the motion in frame"""
 
     pos: tuple[int, int]
     rel: tuple[int, int]
     buttons: tuple[int, int, int]
     touch: bool
     window: Any
+    frame: int = -1
 
 
 @dataclass
@@ -48,38 +51,45 @@ class Wheel:
     window: None
 
 
-class Mouse:
-    """Class for handling mouse events"""
-
-    def __init__(self):
-        self._buttons: dict[InputKey, MouseButton] = {}
+class Mouse:  # pylint: disable=R0902
+    """Class for handling mouse events.
+
+    Motion events are coalesced into one Motion per frame that is updated in
+    place. With history, the last history motion positions are also kept in
+    a ring buffer for tools that need every sample"""
+
+    handled_events = (
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEWHEEL,
+    )
+
+    def __init__(self, clock: FrameClock | None = None, history: int = 0):
+        self._states = ButtonStates(8)
+        self._buttons: dict[InputKey, tuple[tuple[int, int], Any, Any]] = {}
+        self._clock = clock or frame_clock
+        self._pos: tuple[int, int] | None = None
+        self._history_x = array("i", [0]) * history
+        self._history_y = array("i", [0]) * history
+        self._history_frames = array("q", [0]) * history
+        self._history_index = 0
+        self._history_count = 0
         self.motion: Motion | None = None
         self.wheel: Wheel | None = None
 
     def handle_event(self, event: pygame.event.Event) -> None:
         match event.type:
             case pygame.MOUSEBUTTONDOWN:
-                start_time = TimeClock.seconds()
-                start_frame = pygame.time.get_ticks()
-                self._buttons[event.button] = MouseButton(
-                    pos=event.pos,
-                    number=event.button,
-                    touch=event.touch,
-                    window=event.window,
-                    pressed=True,
-                    start_time=start_time,
-                    start_frame=start_frame,
-                    end_time=None,
-                    end_frame=None,
-                )
+                self._states.grow(event.button + 1)
+                self._states.press(event.button, self._clock.frame, self._clock.time)
+                self._buttons[event.button] = (event.pos, event.touch, event.window)
+                self._pos = event.pos
             case pygame.MOUSEBUTTONUP:
-                self._buttons[event.button].pressed = False
-                self._buttons[event.button].end_time = TimeClock.seconds()
-                self._buttons[event.button].end_frame = pygame.time.get_ticks()
+                self._states.grow(event.button + 1)
+                self._states.release(event.button, self._clock.frame, self._clock.time)
             case pygame.MOUSEMOTION:
-                self.motion = Motion(
-                    event.pos, event.rel, event.buttons, event.touch, event.window
-                )
+                self._handle_motion(event)
             case pygame.MOUSEWHEEL:
                 self.wheel = Wheel(
                     event.flipped,
@@ -91,77 +101,131 @@ class Mouse:
                     event.window,
                 )
 
+    def _handle_motion(self, event: pygame.Event):
+        """Add a motion event to the frame motion and the history"""
+        frame = self._clock.frame
+        motion = self.motion
+        if motion is None:
+            motion = self.motion = Motion(
+                event.pos, event.rel, event.buttons, event.touch, event.window, frame
+            )
+        elif motion.frame == frame:
+            motion.rel = (motion.rel[0] + event.rel[0], motion.rel[1] + event.rel[1])
+        else:
+            motion.rel = event.rel
+            motion.frame = frame
+        motion.pos = event.pos
+        motion.buttons = event.buttons
+        motion.touch = event.touch
+        motion.window = event.window
+        self._pos = event.pos
+        if size := len(self._history_frames):
+            index = self._history_index
+            self._history_x[index], self._history_y[index] = event.pos
+            self._history_frames[index] = frame
+            self._history_index = (index + 1) % size
+            self._history_count = min(self._history_count + 1, size)
+
+    def latch(self):
+        """Save the pressed buttons as the previous frame ones and reset the
+        motion rel, call it at the start of every frame"""
+        self._states.latch()
+        if self.motion is not None:
+            self.motion.rel = (0, 0)
+
+    def get_history(self) -> list[tuple[int, int, int]]:
+        """Get the kept motion samples as (x, y, frame), from oldest to newest"""
+        size = len(self._history_frames)
+        start = self._history_index - self._history_count
+        return [
+            (self._history_x[i], self._history_y[i], self._history_frames[i])
+            for i in ((start + n) % size for n in range(self._history_count))
+        ]
+
     def get_input_data(self, key: InputKey) -> Optional[MouseButton]:
         """Get data of an specific input"""
-        return self._buttons[key] if key in self._buttons else None
+        if (start_frame := self._states.press_frame(key)) is None:
+            return None
+        pos, touch, window = self._buttons[key]
+        return MouseButton(
+            pos=pos,
+            number=key,
+            touch=touch,
+            window=window,
+            pressed=self._states.is_pressed(key),
+            start_time=self._states.press_time(key),
+            start_frame=start_frame,
+            end_time=self._states.release_time(key),
+            end_frame=self._states.release_frame(key),
+        )
 
     def is_pressed(self, key: InputKey) -> bool:
         """Check if input key is pressed"""
-        return k.pressed if (k := self.get_input_data(key)) else False
+        return self._states.is_pressed(key)
+
+    def was_pressed(self, key: InputKey) -> bool:
+        """Check if input key was pressed in the previous frame"""
+        return self._states.was_pressed(key)
 
     def just_pressed(self, key: InputKey) -> bool:
         """Check if input key is pressed in this exact frame"""
-        return self.hold_frames(key) == 0
+        return self._states.press_frame(key) == self._clock.frame
 
     def just_released(self, key: InputKey) -> bool:
         """Check if input key stop being pressed in this exact frame"""
-        return self.frames_since_release(key) == 0
+        return self._states.release_frame(key) == self._clock.frame
 
     def press_time(self, key: InputKey) -> Optional[float]:
         """Get the time that an input key was pressed"""
-        return k.start_time if (k := self.get_input_data(key)) else None
+        return self._states.press_time(key)
 
     def press_frame(self, key: InputKey) -> Optional[int]:
         """Get the frame that an input key was pressed"""
-        return k.start_frame if (k := self.get_input_data(key)) else None
+        return self._states.press_frame(key)
 
     def hold_time(self, key: InputKey) -> Optional[float]:
         """Return how long an input key is being pressed"""
-        return (
-            TimeClock.seconds() - k.start_time
-            if (k := self.get_input_data(key))
-            else None
-        )
+        t = self.press_time(key)
+        return None if t is None else self._clock.time - t
 
     def hold_frames(self, key: InputKey) -> Optional[int]:
         """Return how many frames an input key is being pressed"""
-        return (
-            pygame.time.get_ticks() - k.start_frame
-            if (k := self.get_input_data(key))
-            else None
-        )
+        t = self.press_frame(key)
+        return None if t is None else self._clock.frame - t
 
     def release_time(self, key: InputKey) -> Optional[float]:
         """Return the time an input key stop being pressed"""
-        return k.end_time if (k := self.get_input_data(key)) else None
+        return self._states.release_time(key)
 
     def release_frame(self, key: InputKey) -> Optional[int]:
         """Return the frame an input key stop being pressed"""
-        return k.end_frame if (k := self.get_input_data(key)) else None
+        return self._states.release_frame(key)
 
     def time_since_release(self, key: InputKey) -> Optional[float]:
         """Return how long an input key stop pressed"""
-        return TimeClock.seconds() - t if (t := self.release_time(key)) else None
+        t = self.release_time(key)
+        return None if t is None else self._clock.time - t
 
     def frames_since_release(self, key: InputKey) -> Optional[int]:
         """Return how many frames an input key stop pressed"""
-        return pygame.time.get_ticks() - t if (t := self.release_frame(key)) else None
+        t = self.release_frame(key)
+        return None if t is None else self._clock.frame - t
 
     def get_pressed(self) -> list[MouseButton]:
         """Get all buttons being pressed"""
-        return [k for k in self._buttons.values() if k.pressed]
+        return [self.get_input_data(slot) for slot in self._states.pressed_slots()]
 
-    @staticmethod
-    def get_pos() -> tuple[int, int]:
-        """Get the mouse position"""
-        return pygame.mouse.get_pos()
+    def get_pos(self) -> tuple[int, int]:
+        """Get the mouse position of the last mouse event"""
+        if self._pos is None:
+            self._pos = pygame.mouse.get_pos()
+        return self._pos
 
-    @staticmethod
     def get_pos_scaled(
-        screen_size: tuple[int, int], display_size: tuple[int, int]
+        self, screen_size: tuple[int, int], display_size: tuple[int, int]
     ) -> tuple[float, float]:
         """Get the mouse position scaled"""
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.get_pos()
         return (
             mouse_pos[0] / screen_size[0] * display_size[0],
             mouse_pos[1] / screen_size[1] * display_size[1],
@@ -0,0 +1,95 @@
+"""## Input states"""
+
+from array import array
+from typing import Optional
+
+
+class ButtonStates:
+    """Press and release state of buttons stored in arrays indexed by slot.
+
+    Frames and times are -1 while a slot hasn't been pressed or released,
+    previous keeps the pressed state of the last frame after latch"""
+
+    def __init__(self, size: int) -> None:
+        self.pressed = bytearray(size)
+        self.previous = bytearray(size)
+        self.press_frames = array("q", [-1]) * size
+        self.release_frames = array("q", [-1]) * size
+        self.press_times = array("d", [-1.0]) * size
+        self.release_times = array("d", [-1.0]) * size
+
+    def grow(self, size: int):
+        """Add slots until there are size"""
+        extra = size - len(self.pressed)
+        if extra <= 0:
+            return
+        self.pressed.extend(bytes(extra))
+        self.previous.extend(bytes(extra))
+        self.press_frames.extend(array("q", [-1]) * extra)
+        self.release_frames.extend(array("q", [-1]) * extra)
+        self.press_times.extend(array("d", [-1.0]) * extra)
+        self.release_times.extend(array("d", [-1.0]) * extra)
+
+    def press(self, slot: int, frame: int, time: float):
+        """Set slot as pressed in frame and forget its last release"""
+        self.pressed[slot] = 1
+        self.press_frames[slot] = frame
+        self.press_times[slot] = time
+        self.release_frames[slot] = -1
+        self.release_times[slot] = -1.0
+
+    def release(self, slot: int, frame: int, time: float):
+        """Set slot as released in frame"""
+        self.pressed[slot] = 0
+        self.release_frames[slot] = frame
+        self.release_times[slot] = time
+
+    def latch(self):
+        """Save the pressed state as the previous frame one"""
+        self.previous[:] = self.pressed
+
+    def clear(self):
+        """Release every slot and forget its frames and times"""
+        size = len(self.pressed)
+        self.pressed = bytearray(size)
+        self.previous = bytearray(size)
+        self.press_frames = array("q", [-1]) * size
+        self.release_frames = array("q", [-1]) * size
+        self.press_times = array("d", [-1.0]) * size
+        self.release_times = array("d", [-1.0]) * size
+
+    def is_pressed(self, slot: int) -> bool:
+        """Check if slot is pressed"""
+        return 0 <= slot < len(self.pressed) and self.pressed[slot] == 1
+
+    def was_pressed(self, slot: int) -> bool:
+        """Check if slot was pressed in the previous frame"""
+        return 0 <= slot < len(self.previous) and self.previous[slot] == 1
+
+    def press_frame(self, slot: int) -> Optional[int]:
+        """Get the frame slot was pressed"""
+        if 0 <= slot < len(self.press_frames) and self.press_frames[slot] >= 0:
+            return self.press_frames[slot]
+        return None
+
+    def press_time(self, slot: int) -> Optional[float]:
+        """Get the time slot was pressed"""
+        if 0 <= slot < len(self.press_frames) and self.press_frames[slot] >= 0:
+            return self.press_times[slot]
+        return None
+
+    def release_frame(self, slot: int) -> Optional[int]:
+        """Get the frame slot was released"""
+        if 0 <= slot < len(self.release_frames) and self.release_frames[slot] >= 0:
+            return self.release_frames[slot]
+        return None
+
+    def release_time(self, slot: int) -> Optional[float]:
+        """Get the time slot was released"""
+        if 0 <= slot < len(self.release_frames) and self.release_frames[slot] >= 0:
+            return self.release_times[slot]
+        return None
+
+    def pressed_slots(self) -> list[int]:
+        """Get the slots being pressed"""
+        return [slot for slot, pressed in enumerate(self.pressed) if pressed]
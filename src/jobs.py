@@ -0,0 +1,325 @@
+"""## Jobs
+Module for spreading expensive work across frames"""
+
+import heapq
+import itertools
+import logging
+import queue
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from time import perf_counter_ns
+from typing import Any, Callable, Generator, Hashable
+
+import pygame
+
+from .consts import PoolBackend
+
+JOB_DONE = pygame.event.custom_type()
+JOB_READY = pygame.event.custom_type()
+
+logger = logging.getLogger(__name__)
+
+
+class Job:  # pylint: disable=R0902
+    """Handle of a generator job"""
+
+    __slots__ = (
+        "generator",
+        "priority",
+        "callback",
+        "error_callback",
+        "owner",
+        "result",
+        "error",
+        "done",
+        "cancelled",
+        "on_cancel",
+    )
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        generator: Generator,
+        priority: int,
+        callback: Callable[[Any], None] | None,
+        owner: Hashable | None = None,
+        error_callback: Callable[[Exception], None] | None = None,
+    ) -> None:
+        self.generator = generator
+        self.priority = priority
+        self.callback = callback
+        self.error_callback = error_callback
+        self.owner = owner
+        self.result = None
+        self.error: Exception | None = None
+        self.done = False
+        self.cancelled = False
+        # set by the runner while the job is queued
+        self.on_cancel: Callable[[], None] | None = None
+
+    def cancel(self):
+        """Stop resuming the job"""
+        if not (self.done or self.cancelled):
+            self.cancelled = True
+            if self.on_cancel is not None:
+                self.on_cancel()
+
+
+class JobRunner:
+    """Cooperative runner of generator jobs.
+
+    Every frame jobs are resumed (next on the generator) by priority, higher
+    first and round robin between equal priorities, until budget_ms is used.
+    The value returned by the generator is given to its callback. A job that
+    raises is dropped and the exception given to its error_callback, or logged
+    without it"""
+
+    def __init__(self, budget_ms: float = 2.0) -> None:
+        self.budget_ms = budget_ms
+        self._heap: list[tuple[int, int, Job]] = []
+        self._order = itertools.count()
+        self._used_ms = 0.0
+        self._resumes = 0
+        self._pending = 0
+
+    def submit(  # pylint: disable=R0913
+        self,
+        generator: Generator,
+        priority: int = 0,
+        callback: Callable[[Any], None] | None = None,
+        owner: Hashable | None = None,
+        error_callback: Callable[[Exception], None] | None = None,
+    ) -> Job:
+        """Add a generator job, it yields whenever it can be paused"""
+        job = Job(generator, priority, callback, owner, error_callback)
+        job.on_cancel = self._count_cancelled
+        self._pending += 1
+        self._push(job)
+        return job
+
+    def run(self) -> int:
+        """Resume jobs until the budget is used; return how many were finished"""
+        start = perf_counter_ns()
+        budget_ns = self.budget_ms * 1e6
+        finished = 0
+        self._resumes = 0
+        while self._heap:
+            if self._resumes and perf_counter_ns() - start >= budget_ns:
+                break
+            _, _, job = heapq.heappop(self._heap)
+            if job.cancelled:
+                job.generator.close()
+                continue
+            self._resumes += 1
+            try:
+                next(job.generator)
+            except StopIteration as stop:
+                self._finish(job)
+                job.result = stop.value
+                finished += 1
+                if job.callback is not None:
+                    job.callback(job.result)
+                continue
+            except Exception as error:  # pylint: disable=W0718
+                self._finish(job)
+                job.error = error
+                if job.error_callback is not None:
+                    job.error_callback(error)
+                else:
+                    logger.error("Job %r failed", job.generator, exc_info=error)
+                continue
+            self._push(job)
+        self._used_ms = (perf_counter_ns() - start) / 1e6
+        return finished
+
+    def cancel_owner(self, owner: Hashable) -> int:
+        """Cancel the jobs of owner; return how many were cancelled"""
+        cancelled = 0
+        for _, _, job in self._heap:
+            if job.owner is owner and not job.cancelled:
+                job.cancel()
+                cancelled += 1
+        return cancelled
+
+    def clear(self):
+        """Cancel all jobs"""
+        for _, _, job in self._heap:
+            job.on_cancel = None
+            job.cancel()
+            job.generator.close()
+        self._heap.clear()
+        self._pending = 0
+
+    def _push(self, job: Job):
+        heapq.heappush(self._heap, (-job.priority, next(self._order), job))
+
+    def _finish(self, job: Job):
+        """Mark a job as done, it's no longer pending"""
+        job.done = True
+        job.on_cancel = None
+        if not job.cancelled:
+            self._pending -= 1
+
+    def _count_cancelled(self):
+        """Count a job cancelled while it's queued"""
+        self._pending -= 1
+
+    @property
+    def pending(self) -> int:
+        """Get the number of jobs not finished"""
+        return self._pending
+
+    @property
+    def used_ms(self) -> float:
+        """Get the miliseconds used by jobs in the last run"""
+        return self._used_ms
+
+    @property
+    def resumes(self) -> int:
+        """Get how many times jobs were resumed in the last run"""
+        return self._resumes
+
+
+class WorkerPool:  # pylint: disable=R0902
+    """Run functions in parallel on a thread or process pool.
+
+    Results are given to their callbacks on the main thread: drain runs them
+    from a queue, or if post_events is set a JOB_DONE event is posted and
+    handle_event runs them. When drained, a JOB_READY event is posted to wake
+    a loop waiting for events. Jobs can have an owner to cancel them together"""
+
+    handled_events = (JOB_DONE,)
+
+    def __init__(
+        self,
+        backend: PoolBackend = PoolBackend.THREAD,
+        workers: int | None = None,
+        post_events: bool = False,
+    ) -> None:
+        self.backend = backend
+        self.workers = workers
+        self.post_events = post_events
+        self._executor: Executor | None = None
+        self._results: queue.SimpleQueue[
+            tuple[Future, Callable | None, Callable | None]
+        ] = queue.SimpleQueue()
+        self._owners: dict[Hashable, set[Future]] = {}
+        self._future_owners: dict[Future, Hashable] = {}
+        self._dropped: set[Future] = set()
+        self._pending = 0
+
+    def submit(
+        self,
+        function: Callable,
+        *args: Any,
+        callback: Callable[[Any], None] | None = None,
+        owner: Hashable | None = None,
+        error_callback: Callable[[BaseException], None] | None = None,
+    ) -> Future:
+        """Run function(*args) on the pool, callback gets its result. If it
+        raises, the exception is given to error_callback, or logged without it"""
+        if self._executor is None:
+            if self.backend == PoolBackend.PROCESS:
+                self._executor = ProcessPoolExecutor(self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(self.workers, "pgcrow-pool")
+        future = self._executor.submit(function, *args)
+        self._pending += 1
+        if owner is not None:
+            self._owners.setdefault(owner, set()).add(future)
+            self._future_owners[future] = owner
+        future.add_done_callback(
+            lambda done: self._finish(done, callback, error_callback)
+        )
+        return future
+
+    def _finish(
+        self,
+        future: Future,
+        callback: Callable | None,
+        error_callback: Callable | None,
+    ):
+        """Send a finished future to the main thread, it may run on a worker.
+        Cancelled futures are cancelled by the main thread, so they are
+        forgotten right away"""
+        if future.cancelled():
+            self._pending -= 1
+            self._forget(future)
+            return
+        if self.post_events:
+            pygame.event.post(
+                pygame.Event(
+                    JOB_DONE,
+                    future=future,
+                    callback=callback,
+                    error_callback=error_callback,
+                )
+            )
+        else:
+            self._results.put((future, callback, error_callback))
+            if pygame.display.get_init():
+                pygame.event.post(pygame.Event(JOB_READY))
+
+    def drain(self) -> int:
+        """Give the finished results to their callbacks; return how many"""
+        delivered = 0
+        while True:
+            try:
+                future, callback, error_callback = self._results.get_nowait()
+            except queue.Empty:
+                return delivered
+            delivered += self._deliver(future, callback, error_callback)
+
+    def handle_event(self, event: pygame.Event):
+        """Handle JOB_DONE events when post_events is set"""
+        if event.type == JOB_DONE:
+            self._deliver(event.future, event.callback, event.error_callback)
+
+    def _deliver(
+        self,
+        future: Future,
+        callback: Callable | None,
+        error_callback: Callable | None,
+    ) -> int:
+        """Run callback with the future result, or error_callback with its
+        exception, unless it was cancelled"""
+        self._pending -= 1
+        self._forget(future)
+        if future in self._dropped:
+            self._dropped.discard(future)
+            return 0
+        if (error := future.exception()) is not None:
+            if error_callback is not None:
+                error_callback(error)
+            else:
+                logger.error("Pool job %r failed", future, exc_info=error)
+        elif callback is not None:
+            callback(future.result())
+        return 1
+
+    def _forget(self, future: Future):
+        """Remove future from its owner"""
+        owner = self._future_owners.pop(future, None)
+        if owner is not None:
+            self._owners[owner].discard(future)
+            if not self._owners[owner]:
+                del self._owners[owner]
+
+    def cancel_owner(self, owner: Hashable) -> int:
+        """Cancel the jobs of owner, the running ones won't be delivered;
+        return how many were cancelled"""
+        futures = self._owners.pop(owner, set())
+        for future in futures:
+            self._future_owners.pop(future, None)
+            if not future.cancel():
+                self._dropped.add(future)
+        return len(futures)
+
+    def shutdown(self, wait: bool = False):
+        """Stop the pool, cancelling the jobs not started"""
+        if self._executor is not None:
+            self._executor.shutdown(wait, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def pending(self) -> int:
+        """Get the number of jobs not delivered yet"""
+        return self._pending
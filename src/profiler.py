@@ -0,0 +1,114 @@
+"""## Profiler
+Module for timing the phases of every frame"""
+
+from array import array
+from time import perf_counter_ns
+from typing import NamedTuple
+
+from .consts import FramePhase
+from .tracing import Tracer
+
+
+class PhaseStats(NamedTuple):
+    """Timings of a frame phase in miliseconds"""
+
+    average: float
+    p50: float
+    p95: float
+    p99: float
+
+
+class FrameProfiler:  # pylint: disable=R0902
+    """Time each FramePhase with perf_counter_ns into a ring buffer of the last
+    size frames. If a tracer is given and enabled, phases are also recorded as
+    spans. When both are disabled every method returns right away, and a frame
+    they are enabled in the middle of isn't recorded"""
+
+    def __init__(
+        self, size: int = 240, enabled: bool = False, tracer: Tracer | None = None
+    ) -> None:
+        self.enabled = enabled
+        self.tracer = tracer
+        self._size = max(1, size)
+        self._samples = {phase: array("q", [0] * self._size) for phase in FramePhase}
+        self._index = 0
+        self._count = 0
+        self._frame_start_ns = 0
+        self._last_ns = 0
+
+    def begin_frame(self):
+        """Start timing a new frame"""
+        if not self.enabled and not (self.tracer and self.tracer.enabled):
+            self._frame_start_ns = 0
+            return
+        self._frame_start_ns = self._last_ns = perf_counter_ns()
+
+    def mark(self, phase: FramePhase):
+        """Record the time since the previous mark as the duration of phase"""
+        tracing = self.tracer is not None and self.tracer.enabled
+        if (not self.enabled and not tracing) or not self._frame_start_ns:
+            return
+        now = perf_counter_ns()
+        if self.enabled:
+            self._samples[phase][self._index] = now - self._last_ns
+        if tracing:
+            self.tracer.add(phase, self._last_ns, now, "frame")
+        self._last_ns = now
+
+    def end_frame(self):
+        """Record the whole frame duration and move to the next slot"""
+        tracing = self.tracer is not None and self.tracer.enabled
+        if (not self.enabled and not tracing) or not self._frame_start_ns:
+            return
+        now = perf_counter_ns()
+        if tracing:
+            self.tracer.add(FramePhase.FRAME, self._frame_start_ns, now, "frame")
+        if not self.enabled:
+            return
+        self._samples[FramePhase.FRAME][self._index] = now - self._frame_start_ns
+        self._index = (self._index + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+
+    def reset(self):
+        """Forget all recorded frames"""
+        self._index = 0
+        self._count = 0
+
+    def samples(self, phase: FramePhase) -> list[int]:
+        """Get the recorded durations of phase in nanoseconds, oldest first"""
+        data = self._samples[phase]
+        if self._count < self._size:
+            return data[: self._count].tolist()
+        return (data[self._index :] + data[: self._index]).tolist()
+
+    def average(self, phase: FramePhase) -> float:
+        """Get the rolling average duration of phase in miliseconds"""
+        if not self._count:
+            return 0.0
+        return sum(self._samples[phase][: self._count]) / self._count / 1e6
+
+    def percentile(self, phase: FramePhase, percent: float) -> float:
+        """Get the duration of phase in miliseconds at the given percent (0-100)"""
+        if not self._count:
+            return 0.0
+        data = sorted(self._samples[phase][: self._count])
+        index = min(self._count - 1, round(percent / 100 * (self._count - 1)))
+        return data[index] / 1e6
+
+    def stats(self, phase: FramePhase) -> PhaseStats:
+        """Get the average, p50, p95 and p99 of phase in miliseconds"""
+        return PhaseStats(
+            self.average(phase),
+            self.percentile(phase, 50),
+            self.percentile(phase, 95),
+            self.percentile(phase, 99),
+        )
+
+    def all_stats(self) -> dict[FramePhase, PhaseStats]:
+        """Get the stats of every phase"""
+        return {phase: self.stats(phase) for phase in FramePhase}
+
+    @property
+    def frames(self) -> int:
+        """Get the number of frames recorded, up to size"""
+        return self._count
@@ -0,0 +1,106 @@
+"""## Recorder
+Module for recording gameplay frames on a background thread"""
+
+import queue
+import threading
+
+import pygame
+
+from .consts import RecordFormat
+
+
+class FrameRecorder:  # pylint: disable=R0902
+    """Copy frames into a ring of preallocated buffers and save them on a worker thread.
+
+    When every buffer is waiting to be saved the frame is dropped and counted
+    instead of stalling the game loop."""
+
+    def __init__(
+        self,
+        path: str,
+        size: tuple[int, int],
+        record_format: RecordFormat = RecordFormat.PNG,
+        buffers: int = 8,
+    ) -> None:
+        self.path = path
+        self.size = size
+        self.record_format = record_format
+        self._buffers = [pygame.Surface(size) for _ in range(max(1, buffers))]
+        self._free: queue.Queue[int] = queue.Queue()
+        self._pending: queue.Queue[tuple[int, int] | None] = queue.Queue()
+        for index in range(len(self._buffers)):
+            self._free.put(index)
+        self._thread: threading.Thread | None = None
+        self._frame = 0
+        self._recorded = 0
+        self._dropped = 0
+
+    def start(self) -> "FrameRecorder":
+        """Start the worker thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._work, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Wait for pending frames to be saved and stop the worker thread"""
+        if self._thread is not None:
+            self._pending.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def capture(self, surface: pygame.Surface) -> bool:
+        """Copy surface into a free buffer; return False if the frame was dropped"""
+        frame = self._frame
+        self._frame += 1
+        try:
+            index = self._free.get_nowait()
+        except queue.Empty:
+            self._dropped += 1
+            return False
+        buffer = self._buffers[index]
+        if surface.get_size() == self.size:
+            buffer.blit(surface, (0, 0))
+        else:
+            buffer.blit(pygame.transform.scale(surface, self.size), (0, 0))
+        self._pending.put((index, frame))
+        return True
+
+    def _work(self):
+        """Save pending buffers until stop is called"""
+        raw_file = None
+        if self.record_format == RecordFormat.RAW:
+            raw_file = open(self.path, "ab")  # pylint: disable=R1732
+        try:
+            while (item := self._pending.get()) is not None:
+                index, frame = item
+                buffer = self._buffers[index]
+                if raw_file is not None:
+                    raw_file.write(pygame.image.tobytes(buffer, "RGB"))
+                else:
+                    pygame.image.save(buffer, self.path.format(frame))
+                self._recorded += 1
+                self._free.put(index)
+        finally:
+            if raw_file is not None:
+                raw_file.close()
+
+    @property
+    def is_recording(self) -> bool:
+        """Check if the worker thread is running"""
+        return self._thread is not None
+
+    @property
+    def recorded(self) -> int:
+        """Get the number of frames saved"""
+        return self._recorded
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of frames dropped because no buffer was free"""
+        return self._dropped
+
+    @property
+    def queued(self) -> int:
+        """Get the number of frames waiting to be saved"""
+        return self._pending.qsize()
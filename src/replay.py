@@ -0,0 +1,187 @@
+"""## Replay
+Module for recording input events and deltatimes to a binary file and
+playing them back, so a session can be replayed frame by frame"""
+
+import struct
+from typing import Any
+
+import pygame
+
+from .timers import FrameClock, frame_clock
+
+_MAGIC = b"PGCI"
+_VERSION = 2
+_HEADER = struct.Struct("<4sH")
+_FRAME = struct.Struct("<dH")
+_TYPE = struct.Struct("<I")
+_TEXT = struct.Struct("<B")
+
+# event type: (struct, attributes as (name, size)), size 1 is a single value
+# and more is a tuple of that many values
+_EVENTS: dict[int, tuple[struct.Struct, tuple[tuple[str, int], ...]]] = {
+    pygame.KEYDOWN: (
+        struct.Struct("<iiH"),
+        (("key", 1), ("scancode", 1), ("mod", 1)),
+    ),
+    pygame.MOUSEMOTION: (
+        struct.Struct("<iiii3B?"),
+        (("pos", 2), ("rel", 2), ("buttons", 3), ("touch", 1)),
+    ),
+    pygame.MOUSEBUTTONDOWN: (
+        struct.Struct("<iiB?"),
+        (("pos", 2), ("button", 1), ("touch", 1)),
+    ),
+    pygame.MOUSEWHEEL: (
+        struct.Struct("<ii?ff?"),
+        (
+            ("x", 1),
+            ("y", 1),
+            ("flipped", 1),
+            ("precise_x", 1),
+            ("precise_y", 1),
+            ("touch", 1),
+        ),
+    ),
+    pygame.JOYAXISMOTION: (
+        struct.Struct("<iiBd"),
+        (("joy", 1), ("instance_id", 1), ("axis", 1), ("value", 1)),
+    ),
+    pygame.JOYBALLMOTION: (
+        struct.Struct("<iiBii"),
+        (("joy", 1), ("instance_id", 1), ("ball", 1), ("rel", 2)),
+    ),
+    pygame.JOYBUTTONDOWN: (
+        struct.Struct("<iiB"),
+        (("joy", 1), ("instance_id", 1), ("button", 1)),
+    ),
+    pygame.JOYHATMOTION: (
+        struct.Struct("<iiBbb"),
+        (("joy", 1), ("instance_id", 1), ("hat", 1), ("value", 2)),
+    ),
+    pygame.JOYDEVICEADDED: (struct.Struct("<i"), (("device_index", 1),)),
+    pygame.JOYDEVICEREMOVED: (struct.Struct("<i"), (("instance_id", 1),)),
+}
+_EVENTS[pygame.KEYUP] = _EVENTS[pygame.KEYDOWN]
+_EVENTS[pygame.MOUSEBUTTONUP] = _EVENTS[pygame.MOUSEBUTTONDOWN]
+_EVENTS[pygame.JOYBUTTONUP] = _EVENTS[pygame.JOYBUTTONDOWN]
+# event type: text attribute written after the struct
+_TEXT_EVENTS = {
+    pygame.KEYDOWN: "unicode",
+    pygame.KEYUP: "unicode",
+    pygame.JOYDEVICEADDED: "guid",
+}
+
+RECORDED_EVENTS = frozenset(_EVENTS)
+
+
+class InputRecorder:
+    """Write every frame deltatime and its input events (RECORDED_EVENTS) to a
+    struct packed binary file"""
+
+    def __init__(self, path: str, clock: FrameClock | None = None) -> None:
+        self.path = path
+        self._clock = clock or frame_clock
+        self._file = open(path, "wb")  # pylint: disable=R1732
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION))
+        self._frames = 0
+
+    def record(self, events: list[pygame.Event]):
+        """Write a frame with the clock deltatime and the recordable events"""
+        recorded = [event for event in events if event.type in _EVENTS]
+        write = self._file.write
+        write(_FRAME.pack(self._clock.delta, len(recorded)))
+        for event in recorded:
+            event_struct, attributes = _EVENTS[event.type]
+            values: list[Any] = []
+            for name, size in attributes:
+                value = getattr(event, name)
+                if size == 1:
+                    values.append(value)
+                else:
+                    values.extend(value)
+            write(_TYPE.pack(event.type))
+            write(event_struct.pack(*values))
+            if (text_name := _TEXT_EVENTS.get(event.type)) is not None:
+                text = getattr(event, text_name).encode()[:255]
+                write(_TEXT.pack(len(text)))
+                write(text)
+        self._frames += 1
+
+    def close(self):
+        """Flush and close the file"""
+        if not self._file.closed:
+            self._file.close()
+
+    @property
+    def frames(self) -> int:
+        """Get the number of frames recorded"""
+        return self._frames
+
+
+class InputPlayer:
+    """Play back a file written by InputRecorder. replay_delta starts the next
+    frame and returns its deltatime, replace_events gives its events in place
+    of the recordable ones from pygame"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            self._data = file.read()
+        magic, version = _HEADER.unpack_from(self._data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} isn't an input recording")
+        self._offset = _HEADER.size
+        self._events: list[pygame.Event] = []
+        self._frames = 0
+
+    def replay_delta(self) -> float | None:
+        """Read the next frame; return its deltatime, None if there are no more"""
+        if self.finished:
+            self._events = []
+            return None
+        data = self._data
+        delta, count = _FRAME.unpack_from(data, self._offset)
+        offset = self._offset + _FRAME.size
+        events = []
+        for _ in range(count):
+            (event_type,) = _TYPE.unpack_from(data, offset)
+            offset += _TYPE.size
+            event_struct, attributes = _EVENTS[event_type]
+            values = event_struct.unpack_from(data, offset)
+            offset += event_struct.size
+            kwargs: dict[str, Any] = {"window": None}
+            index = 0
+            for name, size in attributes:
+                if size == 1:
+                    kwargs[name] = values[index]
+                else:
+                    kwargs[name] = values[index : index + size]
+                index += size
+            if (text_name := _TEXT_EVENTS.get(event_type)) is not None:
+                (length,) = _TEXT.unpack_from(data, offset)
+                offset += _TEXT.size
+                kwargs[text_name] = data[offset : offset + length].decode()
+                offset += length
+            events.append(pygame.Event(event_type, kwargs))
+        self._offset = offset
+        self._events = events
+        self._frames += 1
+        return delta
+
+    def replace_events(self, events: list[pygame.Event]) -> list[pygame.Event]:
+        """Get the current frame events followed by the events that aren't
+        recordable, recordable ones are dropped while playing. QUIT isn't
+        recordable, so the window can always be closed"""
+        if self.finished and not self._events:
+            return events
+        return self._events + [event for event in events if event.type not in _EVENTS]
+
+    @property
+    def finished(self) -> bool:
+        """Check if every frame was played"""
+        return self._offset >= len(self._data)
+
+    @property
+    def frames(self) -> int:
+        """Get the number of frames played"""
+        return self._frames
@@ -0,0 +1,82 @@
+"""## Resolution
+Module for changing the display resolution to keep frame times under budget"""
+
+from array import array
+
+from .config import Window
+
+
+class DynamicResolution:  # pylint: disable=R0902
+    """Watch frame times and change the window scale factor between bounds.
+
+    The scale factor goes up one step (lower resolution) when the average of the
+    last frames is over high of the budget and down one step when it's under
+    low of the budget. After a change the samples are dropped and nothing
+    changes for cooldown frames, so the resolution doesn't oscillate"""
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        window: Window,
+        budget_ms: float,
+        min_scale_factor: float = 1.0,
+        max_scale_factor: float = 4.0,
+        step: float = 0.25,
+        frames: int = 30,
+        high: float = 0.95,
+        low: float = 0.7,
+        cooldown: int = 60,
+    ) -> None:
+        self.window = window
+        self.budget_ms = budget_ms
+        self.min_scale_factor = min_scale_factor
+        self.max_scale_factor = max_scale_factor
+        self.step = step
+        self.high = high
+        self.low = low
+        self.cooldown = cooldown
+        self._samples = array("d", [0.0] * max(1, frames))
+        self._index = 0
+        self._count = 0
+        self._total = 0.0
+        self._wait = 0
+
+    def update(self, frame_ms: float) -> bool:
+        """Add a frame time; return True if the scale factor has changed"""
+        self._total += frame_ms - self._samples[self._index]
+        self._samples[self._index] = frame_ms
+        self._index = (self._index + 1) % len(self._samples)
+        self._count = min(self._count + 1, len(self._samples))
+        if self._wait > 0:
+            self._wait -= 1
+            return False
+        if self._count < len(self._samples):
+            return False
+
+        scale = self.window.scale_factor
+        average = self._total / self._count
+        if average > self.budget_ms * self.high:
+            scale = min(self.max_scale_factor, scale + self.step)
+        elif average < self.budget_ms * self.low:
+            scale = max(self.min_scale_factor, scale - self.step)
+        if not self.window.set_scale_factor(scale):
+            return False
+        self.reset()
+        self._wait = self.cooldown
+        return True
+
+    def reset(self):
+        """Drop all frame times"""
+        self._samples = array("d", [0.0] * len(self._samples))
+        self._index = 0
+        self._count = 0
+        self._total = 0.0
+
+    @property
+    def average_ms(self) -> float:
+        """Get the average of the last frame times in miliseconds"""
+        return self._total / self._count if self._count else 0.0
+
+    @property
+    def scale_factor(self) -> float:
+        """Get the current window scale factor"""
+        return self.window.scale_factor
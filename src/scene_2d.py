@@ -6,12 +6,22 @@ from .config import Game, SceneManager
 
 
 class Scene2D:
-    """Class representing a single game scene"""
+    """Class representing a single game scene.
+
+    Set is_static to True when the scene only changes on events, the game loop
+    then waits for events instead of redrawing every frame; call invalidate to
+    redraw it for any other reason"""
+
+    is_static = False
 
     def __init__(self, game: Game) -> None:
         self.game = game
         self.scene_manager = None
 
+    def invalidate(self):
+        """Redraw the scene on the next frame even if it's static"""
+        self.game.invalidate()
+
     def set_scene_manager(self, scene_manager: SceneManager):
         """Set scene manager"""
 
@@ -6,6 +6,7 @@ import pygame
 
 from .config import CallableScene, Game
 from .scene_2d import Scene2D
+from .tracing import tracer
 
 
 class SceneManager:  # pylint: disable=R0902
@@ -56,10 +57,18 @@ class SceneManager:  # pylint: disable=R0902
     def __update_transition(self, delta: float):
         """Update the current scene transition"""
         if self._run_exit:
-            if self._actual_scene.on_exit_update(delta):
+            name = f"{self._actual_scene_name}.on_exit_update" if tracer.enabled else ""
+            with tracer.span(name, "scene"):
+                finished = self._actual_scene.on_exit_update(delta)
+            if finished:
                 self.__init_scene()
         if self._run_enter:
-            if self._actual_scene.on_enter_update(delta):
+            name = (
+                f"{self._actual_scene_name}.on_enter_update" if tracer.enabled else ""
+            )
+            with tracer.span(name, "scene"):
+                finished = self._actual_scene.on_enter_update(delta)
+            if finished:
                 self._run_enter = False
 
     def __render_transition(self, display: pygame.Surface):
@@ -81,6 +90,10 @@ class SceneManager:  # pylint: disable=R0902
     def change_scene(self, name: str):
         """Method to change scenes if name is avalible in scenes"""
         if name in self._scenes and not (self._run_enter or self._run_exit):
+            if tracer.enabled:
+                tracer.instant(
+                    f"change_scene {self._actual_scene_name} -> {name}", "scene"
+                )
             self._next_scene_name = name
             if not self._actual_scene:
                 self.__init_scene()
@@ -89,9 +102,15 @@ class SceneManager:  # pylint: disable=R0902
 
     def __init_scene(self):
         """Instantiate the next scene"""
-        self._actual_scene: Scene2D = self._scenes[self._next_scene_name].scene_class(
-            **self._scenes[self._next_scene_name].kwargs
-        )
+        if self._actual_scene is not None:
+            # the exited scene jobs are no longer needed
+            self.game.jobs.cancel_owner(self._actual_scene)
+            self.game.pool.cancel_owner(self._actual_scene)
+            self.game.event_handler.deregister(self._actual_scene)
+        scene = self._scenes[self._next_scene_name]
+        name = f"{self._next_scene_name}.__init__" if tracer.enabled else ""
+        with tracer.span(name, "scene"):
+            self._actual_scene: Scene2D = scene.scene_class(**scene.kwargs)
         self._run_enter = True
         self._run_exit = False
         self._previus_scene_name = self._actual_scene_name
@@ -102,6 +121,15 @@ class SceneManager:  # pylint: disable=R0902
         "Get all scenes names"
         return set(self._scenes.keys())
 
+    @property
+    def is_idle(self) -> bool:
+        """Check if the actual scene is static and there isn't a transition running"""
+        return (
+            self._actual_scene is not None
+            and self._actual_scene.is_static
+            and not (self._run_enter or self._run_exit)
+        )
+
     @property
     def actual_scene(self) -> Scene2D:
         """Get a Scene2D object"""
@@ -1,6 +1,10 @@
 """## Timers"""
 
+import heapq
+import itertools
 import time
+from array import array
+from typing import Any, Callable, NamedTuple
 
 
 class TimeClock:
@@ -27,17 +31,83 @@ class TimeClock:
         return time.time() // 3600
 
 
-class Delta:
-    """Timer for deltatime"""
+class FrameClock:
+    """Frame timestamp service based on perf_counter_ns.
+
+    It's sampled once per frame with tick, so everything that reads it during
+    a frame sees the same frame index, frame start time and deltatime."""
 
     def __init__(self) -> None:
+        self._start_ns = time.perf_counter_ns()
+        self._frame_start_ns = self._start_ns
+        self._delta = 0.0
+        self._frame = 0
+
+    def tick(self, delta: float | None = None) -> float:
+        """Start a new frame and return its deltatime in seconds.
+        If delta is given the frame time is advanced by it instead of the real time"""
+        if delta is None:
+            now = time.perf_counter_ns()
+            self._delta = (now - self._frame_start_ns) / 1e9
+            self._frame_start_ns = now
+        else:
+            self._delta = delta
+            self._frame_start_ns += round(delta * 1e9)
+        self._frame += 1
+        return self._delta
+
+    @property
+    def frame(self) -> int:
+        """Get the current frame index"""
+        return self._frame
+
+    @property
+    def frame_start_ns(self) -> int:
+        """Get the perf_counter_ns value when the current frame started"""
+        return self._frame_start_ns
+
+    @property
+    def time(self) -> float:
+        """Get the seconds since the clock was created at the start of the frame"""
+        return (self._frame_start_ns - self._start_ns) / 1e9
+
+    @property
+    def delta(self) -> float:
+        """Get the current frame deltatime in seconds"""
+        return self._delta
+
+
+frame_clock = FrameClock()
+
+
+class Delta:
+    """Timer for deltatime, if fixed is given it's always returned as deltatime.
+    If a clock is given it's ticked, so the deltatime is its frame deltatime.
+    If source is set, the deltatime it returns is used unless it's None"""
+
+    def __init__(
+        self, fixed: float | None = None, clock: FrameClock | None = None
+    ) -> None:
         self._delta = 0
-        self._prev_time = time.time()
+        self._fixed = fixed
+        self._clock = clock
+        self._prev_time = time.perf_counter()
+        self.source: Callable[[], float | None] | None = None
 
     def get_delta(self) -> float:
         """Get deltatime in seconds"""
-        self._delta = time.time() - self._prev_time
-        self._prev_time = time.time()
+        fixed = self._fixed
+        if self.source is not None and (delta := self.source()) is not None:
+            fixed = delta
+        if self._clock is not None:
+            self._delta = self._clock.tick(fixed if fixed else None)
+            return self._delta
+        if fixed:
+            self._delta = fixed
+            return self._delta
+        now = time.perf_counter()
+        self._delta = now - self._prev_time
+        self._prev_time = now
         return self._delta
 
     @property
@@ -53,8 +123,10 @@ class Chronometer:
         self._current_time = 0
         self._start_time = 0
 
-    def update(self, delta: float) -> float:
-        """Update the currente time"""
+    def update(self, delta: float | None = None) -> float:
+        """Update the currente time, by default with the frame clock deltatime"""
+        if delta is None:
+            delta = frame_clock.delta
         self._start_time += delta
         self._current_time = self._start_time
         return self._current_time
@@ -73,3 +145,197 @@ class Chronometer:
     def current_time_ms(self) -> float:
         """Get currente time in miliseconds"""
         return self._current_time * 1000
+
+
+class PacingStats(NamedTuple):
+    """FramePacer stats in miliseconds"""
+
+    mean_error: float
+    max_error: float
+    sleep_overshoot: float
+
+
+class FramePacer:
+    """Frame pacing that sleeps until close to the deadline and spins the rest.
+
+    The spin margin is the biggest sleep overshoot of the last frames, so it
+    adapts to the OS sleep granularity without spinning a whole frame"""
+
+    def __init__(self, frames: int = 60) -> None:
+        self._deadline_ns = 0
+        self._overshoots = array("q", [1_000_000] * max(1, frames))
+        self._errors = array("q", [0] * max(1, frames))
+        self._index = 0
+        self._count = 0
+
+    def wait(self, target_fps: int):
+        """Wait until the next frame deadline for target_fps"""
+        if target_fps <= 0:
+            return
+        period_ns = 1_000_000_000 // target_fps
+        now = time.perf_counter_ns()
+        if not self._deadline_ns:
+            self._deadline_ns = now
+            return
+        deadline = self._deadline_ns + period_ns
+        if now >= deadline:
+            # late, start counting from now
+            self._deadline_ns = now
+            self._record(now - deadline, None)
+            return
+
+        overshoot = None
+        sleep_ns = deadline - now - max(self._overshoots)
+        if sleep_ns > 0:
+            time.sleep(sleep_ns / 1e9)
+            overshoot = max(0, time.perf_counter_ns() - now - sleep_ns)
+        while (now := time.perf_counter_ns()) < deadline:
+            pass
+        self._deadline_ns = deadline
+        self._record(now - deadline, overshoot)
+
+    def _record(self, error_ns: int, overshoot_ns: int | None):
+        """Save the frame error and sleep overshoot"""
+        self._errors[self._index] = error_ns
+        if overshoot_ns is not None:
+            self._overshoots[self._index] = overshoot_ns
+        self._index = (self._index + 1) % len(self._errors)
+        self._count = min(self._count + 1, len(self._errors))
+
+    def stats(self) -> PacingStats:
+        """Get the mean and max error of the last frames and the sleep overshoot"""
+        if not self._count:
+            return PacingStats(0.0, 0.0, max(self._overshoots) / 1e6)
+        errors = self._errors[: self._count]
+        return PacingStats(
+            sum(errors) / self._count / 1e6,
+            max(errors) / 1e6,
+            max(self._overshoots) / 1e6,
+        )
+
+
+class TimerHandle:
+    """Handle of a Scheduler timer"""
+
+    __slots__ = ("deadline", "interval", "callback", "args", "cancelled", "on_cancel")
+
+    def __init__(
+        self, deadline: float, interval: float, callback: Callable, args: tuple
+    ) -> None:
+        self.deadline = deadline
+        self.interval = interval
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        # set by the scheduler while the handle is in its heap
+        self.on_cancel: Callable[[], None] | None = None
+
+    def cancel(self) -> bool:
+        """Stop the timer from firing; return False if it was already cancelled"""
+        if self.cancelled:
+            return False
+        self.cancelled = True
+        if self.on_cancel is not None:
+            self.on_cancel()
+        return True
+
+
+class Scheduler:
+    """Timers and delayed callbacks kept in a min-heap by deadline.
+
+    The time only advances with update, so each frame costs as much as the
+    timers that fire, not as the timers that exist. Cancelled timers are
+    removed lazily when they reach the top of the heap"""
+
+    def __init__(self) -> None:
+        self._time = 0.0
+        self._heap: list[tuple[float, int, TimerHandle]] = []
+        self._order = itertools.count()
+        self._cancelled = 0
+
+    def after(self, seconds: float, callback: Callable, *args: Any) -> TimerHandle:
+        """Call callback(*args) once after seconds"""
+        return self._push(TimerHandle(self._time + seconds, 0.0, callback, args))
+
+    def every(self, interval: float, callback: Callable, *args: Any) -> TimerHandle:
+        """Call callback(*args) every interval seconds until it's cancelled"""
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+        return self._push(TimerHandle(self._time + interval, interval, callback, args))
+
+    def cancel(self, handle: TimerHandle) -> bool:
+        """Cancel a timer; return False if it was already cancelled"""
+        return handle.cancel()
+
+    def update(self, delta: float) -> int:
+        """Advance the time by delta and fire the due timers; return how many fired"""
+        self._time += delta
+        fired = 0
+        heap = self._heap
+        while heap and heap[0][0] <= self._time:
+            handle = self._pop()
+            if handle.cancelled:
+                continue
+            if handle.interval:
+                handle.deadline += handle.interval
+                self._push(handle)
+            handle.callback(*handle.args)
+            fired += 1
+        return fired
+
+    def clear(self):
+        """Remove all timers"""
+        for _, _, handle in self._heap:
+            handle.on_cancel = None
+            handle.cancel()
+        self._heap.clear()
+        self._cancelled = 0
+
+    def _push(self, handle: TimerHandle) -> TimerHandle:
+        handle.on_cancel = self._count_cancelled
+        heapq.heappush(self._heap, (handle.deadline, next(self._order), handle))
+        return handle
+
+    def _pop(self) -> TimerHandle:
+        """Take the first timer out of the heap"""
+        _, _, handle = heapq.heappop(self._heap)
+        handle.on_cancel = None
+        if handle.cancelled:
+            self._cancelled -= 1
+        return handle
+
+    def _count_cancelled(self):
+        """Count a timer cancelled while it's in the heap"""
+        self._cancelled += 1
+        if self._cancelled > len(self._heap) // 2:
+            self._compact()
+
+    def _compact(self):
+        """Remove cancelled timers from the heap, in place since update may be
+        iterating it"""
+        heap = self._heap
+        for _, _, handle in heap:
+            if handle.cancelled:
+                handle.on_cancel = None
+        heap[:] = [item for item in heap if not item[2].cancelled]
+        heapq.heapify(heap)
+        self._cancelled = 0
+
+    @property
+    def time(self) -> float:
+        """Get the scheduler time in seconds"""
+        return self._time
+
+    @property
+    def next_timer(self) -> float | None:
+        """Get the seconds until the next timer fires, None if there isn't one"""
+        while self._heap and self._heap[0][2].cancelled:
+            self._pop()
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - self._time)
+
+    @property
+    def pending(self) -> int:
+        """Get the number of timers waiting to fire"""
+        return len(self._heap) - self._cancelled
@@ -0,0 +1,151 @@
+"""## Tracing
+Module for recording spans of code and exporting them in Chrome Trace Event
+format, which can be opened in chrome://tracing, Perfetto or speedscope"""
+
+import functools
+import json
+import os
+import threading
+from array import array
+from contextlib import nullcontext
+from time import perf_counter_ns
+from typing import Any, Callable
+
+_NULL_SPAN = nullcontext()
+_INSTANT = -1
+
+
+class Span:
+    """Context manager that records its duration on a Tracer"""
+
+    __slots__ = ("_tracer", "_name", "_category", "_start_ns")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._start_ns = 0
+
+    def __enter__(self) -> "Span":
+        self._start_ns = perf_counter_ns()
+        return self
+
+    def __exit__(self, *_exc):
+        self._tracer.add(self._name, self._start_ns, perf_counter_ns(), self._category)
+
+
+class Tracer:  # pylint: disable=R0902
+    """Record spans with their thread id into a preallocated ring buffer of size
+    spans. When disabled span returns a shared null context and nothing is
+    recorded"""
+
+    def __init__(self, size: int = 65536, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._size = max(1, size)
+        self._names: list[str] = [""] * self._size
+        self._categories: list[str] = [""] * self._size
+        self._threads = array("q", [0] * self._size)
+        self._starts = array("q", [0] * self._size)
+        self._durations = array("q", [0] * self._size)
+        self._index = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        self._origin_ns = perf_counter_ns()
+
+    def add(self, name: str, start_ns: int, end_ns: int, category: str = "user"):
+        """Record a span that started and ended at the given perf_counter_ns"""
+        if not self.enabled:
+            return
+        with self._lock:
+            index = self._index
+            self._names[index] = name
+            self._categories[index] = category
+            self._threads[index] = threading.get_ident()
+            self._starts[index] = start_ns
+            self._durations[index] = end_ns - start_ns
+            self._index = (index + 1) % self._size
+            self._count = min(self._count + 1, self._size)
+
+    def instant(self, name: str, category: str = "user"):
+        """Record an event without duration"""
+        now = perf_counter_ns()
+        self.add(name, now, now + _INSTANT, category)
+
+    def span(self, name: str, category: str = "user") -> Span | nullcontext:
+        """Get a context manager that records the time spent inside it"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, category)
+
+    def trace(self, name: str | None = None, category: str = "user") -> Callable:
+        """Decorator that records every call of the function as a span"""
+
+        def decorator(function: Callable) -> Callable:
+            span_name = name or function.__qualname__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs) -> Any:
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = perf_counter_ns()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.add(span_name, start, perf_counter_ns(), category)
+
+            return wrapper
+
+        return decorator
+
+    def clear(self):
+        """Forget all recorded spans"""
+        with self._lock:
+            self._index = 0
+            self._count = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the recorded spans as a Chrome Trace Event dict"""
+        pid = os.getpid()
+        with self._lock:
+            start = self._index - self._count
+            indexes = [(start + i) % self._size for i in range(self._count)]
+            events = []
+            for i in indexes:
+                event = {
+                    "name": self._names[i],
+                    "cat": self._categories[i],
+                    "ts": (self._starts[i] - self._origin_ns) / 1000,
+                    "pid": pid,
+                    "tid": self._threads[i],
+                }
+                if self._durations[i] == _INSTANT:
+                    event.update(ph="i", s="t")
+                else:
+                    event.update(ph="X", dur=self._durations[i] / 1000)
+                events.append(event)
+        thread_ids = {event["tid"] for event in events}
+        for thread in threading.enumerate():
+            if thread.ident in thread_ids:
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": pid,
+                        "tid": thread.ident,
+                        "args": {"name": thread.name},
+                    }
+                )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, path: str):
+        """Write the recorded spans to a Chrome Trace Event json file"""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file)
+
+    @property
+    def spans(self) -> int:
+        """Get the number of spans recorded, up to size"""
+        return self._count
+
+
+tracer = Tracer()
@@ -1,6 +1,8 @@
 """## Window
 Window module for handling differents type of window"""
 
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Self
 
 import pygame
@@ -21,9 +23,22 @@ class WindowScreen:
         self.config = config
 
     def init_screen(self) -> Self:
-        """Initialize screen"""
+        """Initialize screen, with the SDL dummy video driver if config is headless.
+        SDL_VIDEODRIVER is only set while pygame is initialized, then its previous
+        value is restored so later windows in the process use the real driver"""
         if not pygame.get_init():
-            pygame.init()
+            if self.config.headless:
+                driver = os.environ.get("SDL_VIDEODRIVER")
+                os.environ["SDL_VIDEODRIVER"] = "dummy"
+                try:
+                    pygame.init()
+                finally:
+                    if driver is None:
+                        del os.environ["SDL_VIDEODRIVER"]
+                    else:
+                        os.environ["SDL_VIDEODRIVER"] = driver
+            else:
+                pygame.init()
             self._init_desktop_sizes()
             size_index = self._desktop_sizes.index(self.config.window_size)
             self.change_size(self._desktop_sizes[size_index])
@@ -71,6 +86,13 @@ class WindowScreen:
         self._win_screen.fill(bg_color)
         self.display.fill(bg_color)
 
+    def set_scale_factor(self, _scale_factor: float) -> bool:
+        """Change the display scale factor, screen windows can't be scaled"""
+        return False
+
+    def close(self):
+        """Release the window resources, screen windows have none"""
+
     def _init_desktop_sizes(self):
         self._desktop_sizes = pygame.display.get_desktop_sizes()
         if not self.config.avalible_window_sizes:
@@ -99,6 +121,11 @@ class WindowScreen:
         """Get if window is fullscreen"""
         return self._is_fullscreen
 
+    @property
+    def scale_factor(self) -> float:
+        """Get how many times the screen is bigger than the display"""
+        return 1.0
+
     @property
     def display(self):
         """Returns the screen surface"""
@@ -111,7 +138,12 @@ class WindowScreen:
 
 
 class WindowDisplay(WindowScreen):
-    """Window class that blits on a intermediate display"""
+    """Window class that blits on a intermediate display.
+
+    If config threaded_scale is set and vsync isn't, the display is double
+    buffered: the scene renders into one buffer while a worker thread scales
+    the other one, so the screen shows the previous frame (the first frame
+    only shows the clean color). Call close to stop the worker thread."""
 
     def __init__(self, config: WindowConfig) -> None:
         super().__init__(config)
@@ -120,23 +152,81 @@ class WindowDisplay(WindowScreen):
                 self.scale_funtion = pygame.transform.smoothscale
             case _:
                 self.scale_funtion = pygame.transform.scale
+        self._display = None
+        self._scale_factor = config.scale_factor
+        self._back_display = None
+        self._scaled = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._scaling: Future | None = None
 
     def init_screen(self) -> Self:
         """Initialize screen"""
         super().init_screen()
-        screen_size = self._win_screen.get_size()
-        self._display = pygame.transform.scale_by(
-            pygame.Surface(screen_size), 1 / self.config.scale_factor
-        )
+        self.close()
+        self._display = self._create_display()
+        if self.config.threaded_scale and not self.config.vsync:
+            self._back_display = self._display.copy()
+            self._executor = ThreadPoolExecutor(1, "pgcrow-scale")
         return self
 
     def get_update_function(self, offset: tuple[int, int] = (0, 0)):
         """Render to the screen"""
-        self._win_screen.blit(
-            self.scale_funtion(self._display, self._win_screen.get_size()), offset
-        )
+        if self._executor is None:
+            self._win_screen.blit(
+                self.scale_funtion(self._display, self._win_screen.get_size()), offset
+            )
+        else:
+            self._present_threaded(offset)
         return pygame.display.update
 
+    def _present_threaded(self, offset: tuple[int, int]):
+        """Blit the frame scaled by the worker and send the new one to be scaled,
+        on the first frame nothing has been scaled yet"""
+        screen_size = self._win_screen.get_size()
+        if self._scaling is not None:
+            scaled = self._scaling.result()
+            if scaled.get_size() == screen_size:
+                self._win_screen.blit(scaled, offset)
+        if self._scaled is None or self._scaled.get_size() != screen_size:
+            self._scaled = pygame.Surface(screen_size, 0, self._display)
+        self._scaling = self._executor.submit(
+            self.scale_funtion, self._display, screen_size, self._scaled
+        )
+        self._display, self._back_display = self._back_display, self._display
+
+    def close(self):
+        """Wait for the frame being scaled and stop the scaling thread"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._scaling = None
+
+    def _create_display(self) -> pygame.Surface:
+        """Create a display surface for the current scale factor"""
+        return pygame.transform.scale_by(
+            pygame.Surface(self._win_screen.get_size()), 1 / self._scale_factor
+        )
+
+    def set_scale_factor(self, scale_factor: float) -> bool:
+        """Reallocate the display with a new scale factor"""
+        if self._display is None or scale_factor == self._scale_factor:
+            return False
+        self._scale_factor = scale_factor
+        self._display = self._create_display()
+        if self._back_display is not None:
+            self._back_display = self._display.copy()
+        return True
+
+    @property
+    def scale_factor(self) -> float:
+        """Get how many times the screen is bigger than the display"""
+        return self._scale_factor
+
+    @property
+    def is_threaded(self) -> bool:
+        """Check if the display is scaled on a worker thread"""
+        return self._executor is not None
+
     @property
     def display(self):
         """Returns the display surface"""
@@ -193,6 +283,7 @@ class WindowScreenGL(WindowScreen):
 class WindowDisplayGL(WindowScreenGL):
     def __init__(self, config: WindowConfig) -> None:
         super().__init__(config)
+        self._scale_factor = config.scale_factor
         match config.scale_funtion:
             case "smooth":
                 self.scale_funtion = pygame.transform.smoothscale
@@ -202,12 +293,23 @@ class WindowDisplayGL(WindowScreenGL):
     def init_screen(self) -> Self:
         """Initialize screen"""
         super().init_screen()
-        screen_size = self._screen_surf.get_size()
-        self._display = pygame.transform.scale_by(
-            pygame.Surface(screen_size), 1 / self.config.scale_factor
-        )
+        self._display = self._create_display()
         return self
-    
+
+    def _create_display(self) -> pygame.Surface:
+        """Create a display surface for the current scale factor"""
+        return pygame.transform.scale_by(
+            pygame.Surface(self._screen_surf.get_size()), 1 / self._scale_factor
+        )
+
+    def set_scale_factor(self, scale_factor: float) -> bool:
+        """Reallocate the display with a new scale factor"""
+        if self._screen_surf is None or scale_factor == self._scale_factor:
+            return False
+        self._scale_factor = scale_factor
+        self._display = self._create_display()
+        return True
+
     def get_update_function(self, offset: tuple[int, int] = (0, 0)):
         """Render to the screen partially implemented, manually use pygame.flip instead"""
         self._screen_surf.blit(
@@ -215,6 +317,11 @@ class WindowDisplayGL(WindowScreenGL):
         )
         return None
 
+    @property
+    def scale_factor(self) -> float:
+        """Get how many times the screen is bigger than the display"""
+        return self._scale_factor
+
     @property
     def display(self):
         """Returns the display surface"""
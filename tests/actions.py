@@ -0,0 +1,87 @@
+import unittest
+
+import pygame
+
+from src.inputs import ActionMap, Keyboard, Mouse
+from src.timers import FrameClock
+
+
+def key_event(event_type: int, key: int) -> pygame.Event:
+    return pygame.Event(event_type, key=key, scancode=0, mod=0, unicode="")
+
+
+def button_event(event_type: int, button: int) -> pygame.Event:
+    return pygame.Event(event_type, pos=(0, 0), button=button, touch=False, window=None)
+
+
+class TestActionMap(unittest.TestCase):
+    def setUp(self):
+        self.clock = FrameClock()
+        self.keyboard = Keyboard(self.clock)
+        self.mouse = Mouse(self.clock)
+        self.actions = ActionMap(self.keyboard, self.mouse)
+
+    def test_action(self):
+        self.actions.bind_action("jump", keys=(pygame.K_SPACE,), mouse_buttons=(1,))
+        self.actions.update()
+        self.assertFalse(self.actions.state.pressed["jump"])
+        self.mouse.handle_event(button_event(pygame.MOUSEBUTTONDOWN, 1))
+        self.actions.update()
+        self.assertTrue(self.actions.state.pressed["jump"])
+        self.assertTrue(self.actions.state.just_pressed["jump"])
+        self.keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_SPACE))
+        self.mouse.handle_event(button_event(pygame.MOUSEBUTTONUP, 1))
+        self.actions.update()
+        self.assertTrue(self.actions.state.pressed["jump"])
+        self.assertFalse(self.actions.state.just_pressed["jump"])
+        self.keyboard.handle_event(key_event(pygame.KEYUP, pygame.K_SPACE))
+        self.actions.update()
+        self.assertFalse(self.actions.state.pressed["jump"])
+        self.assertTrue(self.actions.state.just_released["jump"])
+
+    def test_axis(self):
+        self.actions.bind_axis(
+            "move_x", negative_keys=(pygame.K_a,), positive_keys=(pygame.K_d,)
+        )
+        self.keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_a))
+        self.actions.update()
+        self.assertEqual(-1.0, self.actions.state.axes["move_x"])
+        self.keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_d))
+        self.actions.update()
+        self.assertEqual(0.0, self.actions.state.axes["move_x"])
+
+    def test_rebind(self):
+        self.actions.bind_action("fire", keys=(pygame.K_f,))
+        self.keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_g))
+        self.actions.update()
+        self.assertFalse(self.actions.state.pressed["fire"])
+        self.actions.bind_action("fire", keys=(pygame.K_g,))
+        self.actions.update()
+        self.assertTrue(self.actions.state.pressed["fire"])
+        self.assertTrue(self.actions.unbind("fire"))
+        self.assertNotIn("fire", self.actions.state.pressed)
+        self.assertFalse(self.actions.unbind("fire"))
+
+    def test_tap_in_one_frame(self):
+        self.actions.bind_action("jump", keys=(pygame.K_SPACE,))
+        self.actions.update()
+        self.clock.tick()
+        self.keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_SPACE))
+        self.keyboard.handle_event(key_event(pygame.KEYUP, pygame.K_SPACE))
+        self.actions.update()
+        self.assertFalse(self.actions.state.pressed["jump"])
+        self.assertTrue(self.actions.state.just_pressed["jump"])
+        self.assertTrue(self.actions.state.just_released["jump"])
+        self.clock.tick()
+        self.actions.update()
+        self.assertFalse(self.actions.state.just_pressed["jump"])
+        self.assertFalse(self.actions.state.just_released["jump"])
+
+    def test_unbind_action_and_axis(self):
+        self.actions.bind_action("move", keys=(pygame.K_m,))
+        self.actions.bind_axis("move", positive_keys=(pygame.K_d,))
+        self.actions.update()
+        self.assertTrue(self.actions.unbind("move"))
+        self.assertNotIn("move", self.actions.actions)
+        self.assertNotIn("move", self.actions.axes)
+        self.assertNotIn("move", self.actions.state.axes)
@@ -0,0 +1,94 @@
+import unittest
+from dataclasses import dataclass
+
+from src.bus import EventBus
+
+
+@dataclass
+class Damage:
+    amount: int
+
+
+@dataclass
+class Pickup:
+    item: str
+
+
+class TestEventBus(unittest.TestCase):
+    def test_batches(self):
+        bus = EventBus()
+        batches = []
+        bus.subscribe(Damage, batches.append)
+        bus.publish(Damage(1))
+        bus.publish(Damage(2))
+        bus.publish(Pickup("coin"))
+        self.assertEqual(3, bus.pending)
+        self.assertEqual(2, bus.pending_of(Damage))
+        self.assertEqual([], batches)
+        self.assertEqual(2, bus.dispatch())
+        self.assertEqual([[Damage(1), Damage(2)]], batches)
+        self.assertEqual(1, bus.dropped)
+        self.assertEqual(0, bus.pending)
+        self.assertEqual(3, bus.peak)
+        bus.reset_peak()
+        self.assertEqual(0, bus.peak)
+        self.assertEqual(0, bus.dispatch())
+
+    def test_priority(self):
+        bus = EventBus()
+        order = []
+        bus.subscribe(Damage, lambda _: order.append("low"), priority=-1)
+        bus.subscribe(Damage, lambda _: order.append("high"), priority=5)
+        bus.subscribe(Damage, lambda _: order.append("normal"))
+        bus.publish(Damage(1))
+        bus.dispatch()
+        self.assertEqual(["high", "normal", "low"], order)
+
+    def test_publish_while_dispatching(self):
+        bus = EventBus()
+        pickups = []
+
+        def on_damage(messages: list[Damage]):
+            for message in messages:
+                bus.publish(Pickup(f"drop{message.amount}"))
+
+        bus.subscribe(Damage, on_damage)
+        bus.subscribe(Pickup, pickups.extend)
+        bus.publish(Damage(3))
+        bus.dispatch()
+        self.assertEqual([], pickups)
+        self.assertEqual(1, bus.pending)
+        bus.dispatch()
+        self.assertEqual([Pickup("drop3")], pickups)
+        self.assertTrue(bus.unsubscribe(Pickup, pickups.extend))
+        self.assertFalse(bus.unsubscribe(Pickup, pickups.extend))
+
+    def test_handler_error(self):
+        bus = EventBus()
+        damages, pickups = [], []
+
+        def fail(_):
+            raise ValueError("failed")
+
+        bus.subscribe(Damage, fail, priority=1)
+        bus.subscribe(Damage, damages.extend)
+        bus.subscribe(Pickup, pickups.extend)
+        bus.publish(Damage(1))
+        bus.publish(Pickup("coin"))
+        with self.assertLogs("src.bus", "ERROR"):
+            self.assertEqual(2, bus.dispatch())
+        self.assertEqual([Damage(1)], damages)
+        self.assertEqual([Pickup("coin")], pickups)
+        self.assertEqual(0, bus.pending)
+
+    def test_delivered(self):
+        bus = EventBus()
+        bus.subscribe(Damage, lambda _: None)
+        bus.publish(Damage(1))
+        bus.dispatch()
+        bus.publish(Damage(2))
+        bus.publish(Damage(3))
+        bus.dispatch()
+        self.assertEqual(3, bus.delivered)
+        bus.reset_delivered()
+        self.assertEqual(0, bus.delivered)
@@ -21,12 +21,32 @@ class TestConfigClasses(unittest.TestCase):
         self.assertEqual(0, wc.vsync)
         self.assertEqual(True, wc.can_fullscreen)
         self.assertEqual(True, wc.can_resize)
+        self.assertEqual(False, wc.headless)
+        self.assertEqual(False, wc.threaded_scale)
+        self.assertEqual(False, wc.dynamic_scale)
+        self.assertEqual(1.0, wc.min_scale_factor)
+        self.assertEqual(4.0, wc.max_scale_factor)
 
     def test_gameconfig_construction(self):
         self.assertEqual("Game Test", gc.title)
         self.assertEqual(60, gc.target_fps)
         self.assertEqual(False, gc.start_fullscreen)
         self.assertEqual((20, 20, 170), gc.clean_color)
+        self.assertEqual(0.0, gc.fixed_delta)
+        self.assertEqual(0, gc.max_frames)
+        self.assertEqual(0.0, gc.max_time)
+        self.assertEqual(None, gc.capture_frames)
+        self.assertEqual(0, gc.tick_rate)
+        self.assertEqual(5, gc.max_steps_per_frame)
+        self.assertEqual(False, gc.profile)
+        self.assertEqual(src.consts.FramePacing.CLOCK, gc.pacing)
+        self.assertEqual(0.5, gc.idle_timeout)
+        self.assertEqual(2.0, gc.job_budget_ms)
+        self.assertEqual(src.consts.PoolBackend.THREAD, gc.pool_backend)
+        self.assertEqual(None, gc.pool_workers)
+        self.assertEqual(False, gc.pool_events)
+        self.assertEqual(0, gc.mouse_history)
+        self.assertEqual(False, gc.joystick_polled)
 
     def test_callablescene_construction(self):
         cs = CallableScene(Scene2D, {"game": Game})
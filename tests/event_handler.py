@@ -0,0 +1,160 @@
+import gc
+import os
+import unittest
+
+import pygame
+
+from src.event_handler import EventHandler
+
+
+class Recorder:
+    def __init__(self):
+        self.events: list[int] = []
+
+    def handle_event(self, event: pygame.Event):
+        self.events.append(event.type)
+
+
+class KeyRecorder(Recorder):
+    handled_events = (pygame.KEYDOWN, pygame.KEYUP)
+
+
+class TestEventHandler(unittest.TestCase):
+    def setUp(self):
+        self.handler = EventHandler()
+
+    def send(self, *event_types: int):
+        for event_type in event_types:
+            self.handler._send_event(pygame.Event(event_type))
+
+    def test_broadcast(self):
+        observer = Recorder()
+        self.assertTrue(self.handler.register(observer))
+        self.assertFalse(self.handler.register(observer))
+        self.send(pygame.KEYDOWN, pygame.QUIT)
+        self.assertEqual([pygame.KEYDOWN, pygame.QUIT], observer.events)
+
+    def test_handled_events(self):
+        observer = KeyRecorder()
+        self.handler.register(observer)
+        self.send(pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.KEYUP)
+        self.assertEqual([pygame.KEYDOWN, pygame.KEYUP], observer.events)
+        self.assertTrue(self.handler.deregister(observer))
+        self.send(pygame.KEYDOWN)
+        self.assertEqual(2, len(observer.events))
+        self.assertFalse(self.handler.deregister(observer))
+
+    def test_registration_order(self):
+        events: list[str] = []
+
+        class Broadcast:
+            def handle_event(self, _event: pygame.Event):
+                events.append("broadcast")
+
+        class Keys:
+            handled_events = (pygame.KEYDOWN,)
+
+            def handle_event(self, _event: pygame.Event):
+                events.append("keys")
+
+        self.handler.register(Broadcast())
+        self.handler.register(Keys())
+        self.handler.subscribe(pygame.KEYDOWN, lambda _event: events.append("last"))
+        self.send(pygame.KEYDOWN, pygame.KEYUP)
+        self.assertEqual(["broadcast", "keys", "last", "broadcast"], events)
+
+    def test_subscribe(self):
+        events: list[int] = []
+        self.handler.subscribe(pygame.QUIT, lambda event: events.append(event.type))
+        self.send(pygame.KEYDOWN, pygame.QUIT)
+        self.assertEqual([pygame.QUIT], events)
+        self.assertFalse(self.handler.unsubscribe(pygame.QUIT, print))
+
+    def test_unsubscribe_while_dispatching(self):
+        events: list[str] = []
+
+        def first(_event: pygame.Event):
+            events.append("first")
+            self.handler.unsubscribe(pygame.QUIT, second)
+
+        def second(_event: pygame.Event):
+            events.append("second")
+
+        self.handler.subscribe(pygame.QUIT, first)
+        self.handler.subscribe(pygame.QUIT, second)
+        self.send(pygame.QUIT, pygame.QUIT)
+        self.assertEqual(["first", "second", "first"], events)
+
+    def test_weak_observer(self):
+        observer = KeyRecorder()
+        self.assertTrue(self.handler.register(observer, weak=True))
+        self.assertTrue(self.handler.check_registered(observer))
+        self.send(pygame.KEYDOWN)
+        self.assertEqual([pygame.KEYDOWN], observer.events)
+        del observer
+        gc.collect()
+        self.assertEqual([], self.handler.observers)
+        self.assertIn(pygame.KEYDOWN, self.handler.blocked_events)
+        self.send(pygame.KEYDOWN)
+
+    def test_deregister_while_dispatching(self):
+        second = Recorder()
+
+        class First(Recorder):
+            def handle_event(inner, event: pygame.Event):
+                super().handle_event(event)
+                self.handler.deregister(second)
+
+        first = First()
+        self.handler.register(first)
+        self.handler.register(second)
+        self.send(pygame.QUIT, pygame.QUIT)
+        self.assertEqual(2, len(first.events))
+        self.assertEqual(1, len(second.events))
+        self.assertEqual([first], self.handler.observers)
+
+    def test_last_event(self):
+        self.send(pygame.KEYUP)
+        self.assertEqual(pygame.KEYUP, self.handler.last_event.type)
+
+    def test_filter(self):
+        observer = KeyRecorder()
+        self.handler.register(observer)
+        self.assertNotIn(pygame.KEYDOWN, self.handler.blocked_events)
+        self.assertIn(pygame.MOUSEMOTION, self.handler.blocked_events)
+        self.assertIn(pygame.TEXTINPUT, self.handler.blocked_events)
+        self.assertIn(pygame.TEXTEDITING, self.handler.blocked_events)
+        self.assertFalse(self.handler.update_filter())
+        driver = os.environ.get("SDL_VIDEODRIVER")
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.display.init()
+        try:
+            pygame.event.post(pygame.Event(pygame.KEYDOWN))
+            self.handler.loop()
+            self.assertEqual([pygame.KEYDOWN], observer.events)
+            observer.events.clear()
+            self.assertTrue(pygame.event.get_blocked(pygame.MOUSEMOTION))
+            self.assertFalse(pygame.event.get_blocked(pygame.KEYDOWN))
+            self.assertFalse(pygame.event.get_blocked(pygame.QUIT))
+            self.assertFalse(pygame.event.get_blocked(pygame.WINDOWEXPOSED))
+            self.assertFalse(pygame.event.get_blocked(pygame.VIDEORESIZE))
+            custom = pygame.event.custom_type()
+            self.assertFalse(pygame.event.get_blocked(pygame.USEREVENT))
+            self.assertFalse(pygame.event.get_blocked(custom))
+            pygame.event.post(pygame.Event(pygame.MOUSEMOTION))
+            pygame.event.post(pygame.Event(pygame.KEYUP))
+            pygame.event.post(pygame.Event(custom))
+            self.handler.loop()
+            self.assertEqual([pygame.KEYUP], observer.events)
+            self.assertEqual(custom, self.handler.last_event.type)
+
+            self.handler.register(Recorder())
+            self.assertEqual(frozenset(), self.handler.blocked_events)
+            self.handler.loop()
+            self.assertFalse(pygame.event.get_blocked(pygame.MOUSEMOTION))
+        finally:
+            pygame.display.quit()
+            if driver is None:
+                del os.environ["SDL_VIDEODRIVER"]
+            else:
+                os.environ["SDL_VIDEODRIVER"] = driver
@@ -1,9 +1,13 @@
+import asyncio
+import os
+import tempfile
 import unittest
+from time import perf_counter
 
 import pygame
 
 from src import EventHandler, Game, Scene2D, SceneManager, WindowScreen
-from src.config import GameConfig, WindowConfig
+from src.config import CallableScene, GameConfig, WindowConfig
 from src.inputs import Keyboard, Mouse
 from src.maths import Vec2
 from src.timers import Delta
@@ -11,9 +15,25 @@ from src.timers import Delta
 from .test_utils import WindowContex
 
 wc = WindowConfig((720, 480), 2, "nearest", [(360, 240)])
+hwc = WindowConfig((320, 180), headless=True)
 gc = GameConfig("TestWindow", 60)
 
 
+class CountScene(Scene2D):
+    def __init__(self, game) -> None:
+        super().__init__(game)
+        self.deltas = []
+
+    def update(self, delta: float):
+        self.deltas.append(delta)
+
+
+def count_game(config: GameConfig, window) -> Game:
+    g = Game(config, window)
+    g.scene_manager = SceneManager(g, initial=CallableScene(CountScene, {"game": g}))
+    return g
+
+
 class TestGameType(unittest.TestCase):
     def test_game_contruction(self):
         with WindowContex(WindowScreen, wc) as w:
@@ -69,3 +89,282 @@ class TestGameType(unittest.TestCase):
             g.init_game()
             self.assertTrue(w.is_fullscreen)
             self.assertEqual(w.desktop_sizes[0], w.current_size)
+
+    def test_run_max_frames(self):
+        with WindowContex(WindowScreen, hwc) as w:
+            g = Game(GameConfig("TestWindow", fixed_delta=1 / 60, max_frames=10), w)
+            self.assertEqual(10, g.run())
+            self.assertEqual(10, g.frame_count)
+            self.assertAlmostEqual(10 / 60, g.elapsed_time)
+
+    def test_run_max_time(self):
+        with WindowContex(WindowScreen, hwc) as w:
+            g = Game(GameConfig("TestWindow", fixed_delta=0.25, max_time=1.0), w)
+            self.assertEqual(4, g.run())
+
+    def test_capture_frames(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with WindowContex(WindowScreen, hwc) as w:
+                gcc = GameConfig(
+                    "TestWindow",
+                    fixed_delta=1 / 60,
+                    max_frames=3,
+                    capture_frames=[0, 2],
+                    capture_path=os.path.join(tmp, "frame_{}.png"),
+                )
+                Game(gcc, w).run()
+            self.assertEqual(["frame_0.png", "frame_2.png"], sorted(os.listdir(tmp)))
+
+    def test_fixed_step(self):
+        with WindowContex(WindowScreen, hwc) as w:
+            gcc = GameConfig(fixed_delta=1 / 30, max_frames=3, tick_rate=60)
+            g = count_game(gcc, w)
+            g.run()
+            self.assertEqual([1 / 60] * 6, g.scene_manager.actual_scene.deltas)
+            self.assertAlmostEqual(0.0, g.alpha)
+
+    def test_fixed_step_alpha(self):
+        with WindowContex(WindowScreen, hwc) as w:
+            gcc = GameConfig(fixed_delta=0.015, max_frames=1, tick_rate=100)
+            g = count_game(gcc, w)
+            g.run()
+            self.assertEqual(1, len(g.scene_manager.actual_scene.deltas))
+            self.assertAlmostEqual(0.5, g.alpha)
+
+    def test_fixed_step_max_steps(self):
+        with WindowContex(WindowScreen, hwc) as w:
+            gcc = GameConfig(
+                fixed_delta=1.0, max_frames=2, tick_rate=10, max_steps_per_frame=4
+            )
+            g = count_game(gcc, w)
+            g.run()
+            self.assertEqual(8, len(g.scene_manager.actual_scene.deltas))
+
+    def test_idle_scene(self):
+        with WindowContex(WindowScreen, hwc) as w:
+            g = Game(GameConfig(idle_timeout=0.01), w)
+            g.init_game()
+            pygame.event.clear()
+            g.scene_manager.update(0)  # finish the enter transition
+            g.scene_manager.actual_scene.is_static = True
+            self.assertTrue(g.scene_manager.is_idle)
+            g.run_frame()
+            self.assertEqual(0, g.frame_count)
+            g.scene_manager.actual_scene.invalidate()
+            g.run_frame()
+            self.assertEqual(1, g.frame_count)
+            g.run_frame()
+            self.assertEqual(1, g.frame_count)
+            pygame.event.post(pygame.Event(pygame.USEREVENT))
+            g.run_frame()
+            self.assertEqual(2, g.frame_count)
+            self.assertEqual(pygame.USEREVENT, g.event_handler.last_event.type)
+
+    def test_idle_scene_delta(self):
+        class BareScene(Scene2D):
+            def __init__(self, game) -> None:  # pylint: disable=W0231
+                self.game = game
+                self.deltas = []
+
+            def update(self, delta: float):
+                self.deltas.append(delta)
+
+        with WindowContex(WindowScreen, hwc) as w:
+            g = Game(GameConfig(idle_timeout=0.01, tick_rate=100), w)
+            g.scene_manager = SceneManager(
+                g, initial=CallableScene(BareScene, {"game": g})
+            )
+            g.init_game()
+            pygame.event.clear()
+            scene = g.scene_manager.actual_scene
+            g.scene_manager.update(0)
+            self.assertFalse(g.scene_manager.is_idle)
+            scene.is_static = True
+            for _ in range(5):
+                g.run_frame()
+            g.invalidate()
+            g.run_frame()
+            self.assertEqual(1, g.frame_count)
+            self.assertGreaterEqual(g.elapsed_time, 0.05)
+            self.assertLessEqual(len(scene.deltas), 2)
+
+    def test_run_async(self):
+        with WindowContex(WindowScreen, hwc) as w:
+            g = count_game(GameConfig(fixed_delta=1 / 60, max_frames=5), w)
+            self.assertEqual(5, asyncio.run(g.run_async()))
+            self.assertEqual(5, len(g.scene_manager.actual_scene.deltas))
+
+    def test_spawn(self):
+        results = []
+
+        async def work():
+            await asyncio.sleep(0)
+            return 42
+
+        with WindowContex(WindowScreen, hwc) as w:
+            g = count_game(GameConfig(fixed_delta=1 / 60, max_frames=5), w)
+
+            async def main():
+                g.spawn(work(), results.append)
+                return await g.run_async()
+
+            asyncio.run(main())
+            self.assertEqual([42], results)
+
+    def test_spawn_error(self):
+        errors = []
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("failed")
+
+        with WindowContex(WindowScreen, hwc) as w:
+            g = count_game(GameConfig(fixed_delta=1 / 60, max_frames=5), w)
+
+            async def main():
+                g.spawn(fail(), print, errors.append)
+                g.spawn(fail())
+                return await g.run_async()
+
+            with self.assertLogs("src.game", "ERROR"):
+                self.assertEqual(5, asyncio.run(main()))
+            self.assertEqual(1, len(errors))
+            self.assertIsInstance(errors[0], ValueError)
+
+    def test_scheduler(self):
+        with WindowContex(WindowScreen, hwc) as w:
+            g = Game(GameConfig(fixed_delta=0.125, max_frames=10), w)
+            fired = []
+            g.scheduler.every(0.25, lambda: fired.append(g.frame_count))
+            g.run()
+            self.assertEqual([1, 3, 5, 7, 9], fired)
+
+    def test_idle_scheduler(self):
+        with WindowContex(WindowScreen, hwc) as w:
+            g = Game(GameConfig(idle_timeout=1.0), w)
+            g.init_game()
+            pygame.event.clear()
+            g.scene_manager.update(0)
+            g.scene_manager.actual_scene.is_static = True
+            g.scheduler.after(0.01, g.scene_manager.actual_scene.invalidate)
+            g.run_frame()
+            self.assertEqual(1, g.frame_count)
+
+    def test_idle_jobs(self):
+        log = []
+
+        def steps():
+            for i in range(10):
+                log.append(i)
+                yield
+
+        with WindowContex(WindowScreen, hwc) as w:
+            g = Game(GameConfig(idle_timeout=1.0, job_budget_ms=0), w)
+            g.init_game()
+            pygame.event.clear()
+            g.scene_manager.update(0)
+            g.scene_manager.actual_scene.is_static = True
+            g.jobs.submit(steps())
+            for _ in range(11):
+                g.run_frame()
+            self.assertEqual(list(range(10)), log)
+            self.assertEqual(0, g.jobs.pending)
+
+    def test_idle_pool(self):
+        results = []
+        with WindowContex(WindowScreen, hwc) as w:
+            g = Game(GameConfig(idle_timeout=5.0), w)
+            g.init_game()
+            pygame.event.clear()
+            g.scene_manager.update(0)
+            g.scene_manager.actual_scene.is_static = True
+            g.pool.submit(sum, (2, 3), callback=results.append).result()
+            start = perf_counter()
+            g.run_frame()
+            self.assertLess(perf_counter() - start, 1.0)
+            self.assertEqual([5], results)
+            self.assertEqual(1, g.frame_count)
+            g.pool.shutdown(True)
+
+    def test_idle_timer_after_timeout(self):
+        with WindowContex(WindowScreen, hwc) as w:
+            g = Game(GameConfig(idle_timeout=0.05), w)
+            g.init_game()
+            pygame.event.clear()
+            g.scene_manager.update(0)
+            g.scene_manager.actual_scene.is_static = True
+            fired = []
+            g.scheduler.after(0.15, lambda: fired.append(g.frame_count))
+            for _ in range(20):
+                g.run_frame()
+                if fired:
+                    break
+            self.assertEqual([0], fired)
+            self.assertEqual(1, g.frame_count)
+
+    def test_change_scene_cancels_jobs(self):
+        with WindowContex(WindowScreen, hwc) as w:
+            g = Game(gc, w)
+            g.scene_manager.add_scene("other", CallableScene(Scene2D, {"game": g}))
+            g.init_game()
+            scene = g.scene_manager.actual_scene
+            job = g.jobs.submit((i for i in range(100)), owner=scene)
+            g.scene_manager.update(0)
+            g.scene_manager.change_scene("other")
+            g.scene_manager.update(0)
+            self.assertIsNot(scene, g.scene_manager.actual_scene)
+            self.assertTrue(job.cancelled)
+
+    def test_input_replay(self):
+        with WindowContex(WindowScreen, hwc) as w, tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "inputs.bin")
+            g = count_game(GameConfig(max_frames=3), w)
+            g.init_game()
+            g.start_input_recording(path)
+            pygame.event.post(
+                pygame.Event(
+                    pygame.KEYDOWN, key=pygame.K_a, scancode=0, mod=0, unicode="a"
+                )
+            )
+            g.run()
+            recorded = g.scene_manager.actual_scene.deltas
+            self.assertTrue(g.keyboard.is_pressed(pygame.K_a))
+
+            g = count_game(GameConfig(), w)
+            g.init_game()
+            g.start_replay(path)
+            self.assertEqual(3, g.run())
+            self.assertEqual(recorded, g.scene_manager.actual_scene.deltas)
+            self.assertTrue(g.keyboard.is_pressed(pygame.K_a))
+
+    def test_scene_deregistered(self):
+        with WindowContex(WindowScreen, hwc) as w:
+            g = count_game(GameConfig(), w)
+            g.scene_manager.add_scene("next", CallableScene(CountScene, {"game": g}))
+            g.init_game()
+            scene = g.scene_manager.actual_scene
+            g.event_handler.register(scene)
+            g.scene_manager.update(0)  # finish the enter transition
+            g.scene_manager.change_scene("next")
+            g.scene_manager.update(0)
+            self.assertIsNot(scene, g.scene_manager.actual_scene)
+            self.assertFalse(g.event_handler.check_registered(scene))
+
+    def test_bus_delivery(self):
+        delivered = []
+
+        class BusScene(CountScene):
+            def update(self, delta: float):
+                super().update(delta)
+                self.game.bus.publish(len(self.deltas))
+
+        with WindowContex(WindowScreen, hwc) as w:
+            g = Game(GameConfig(max_frames=2), w)
+            g.scene_manager = SceneManager(
+                g, initial=CallableScene(BusScene, {"game": g})
+            )
+            g.bus.subscribe(int, delivered.append)
+            g.bus.publish(0)
+            g.run()
+            self.assertEqual([[0], [1], [2]], delivered)
+            self.assertEqual(1, g.bus.delivered)
@@ -0,0 +1,153 @@
+import unittest
+
+import pygame
+
+from src.inputs import Keyboard, Mouse
+from src.timers import FrameClock
+
+
+def motion_event(pos: tuple[int, int], rel: tuple[int, int]) -> pygame.Event:
+    return pygame.Event(
+        pygame.MOUSEMOTION,
+        pos=pos,
+        rel=rel,
+        buttons=(0, 0, 0),
+        touch=False,
+        window=None,
+    )
+
+
+def key_event(event_type: int, key: int) -> pygame.Event:
+    return pygame.Event(event_type, key=key, scancode=0, mod=0, unicode="")
+
+
+class TestKeyboard(unittest.TestCase):
+    def setUp(self):
+        self.clock = FrameClock()
+        self.keyboard = Keyboard(self.clock)
+
+    def test_just_pressed(self):
+        self.clock.tick(0.5)
+        self.keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_a))
+        self.assertTrue(self.keyboard.is_pressed(pygame.K_a))
+        self.assertTrue(self.keyboard.just_pressed(pygame.K_a))
+        self.clock.tick(0.5)
+        self.assertTrue(self.keyboard.is_pressed(pygame.K_a))
+        self.assertFalse(self.keyboard.just_pressed(pygame.K_a))
+        self.assertEqual(1, self.keyboard.hold_frames(pygame.K_a))
+        self.assertEqual(0.5, self.keyboard.hold_time(pygame.K_a))
+
+    def test_just_released(self):
+        self.keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_a))
+        self.keyboard.handle_event(key_event(pygame.KEYUP, pygame.K_a))
+        self.assertFalse(self.keyboard.is_pressed(pygame.K_a))
+        self.assertTrue(self.keyboard.just_released(pygame.K_a))
+        self.assertEqual(0, self.keyboard.frames_since_release(pygame.K_a))
+        self.clock.tick(0.1)
+        self.assertFalse(self.keyboard.just_released(pygame.K_a))
+        self.assertAlmostEqual(0.1, self.keyboard.time_since_release(pygame.K_a))
+
+    def test_hold_time_minute_boundary(self):
+        self.keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_a))
+        for _ in range(90):
+            self.clock.tick(1.0)
+        self.assertEqual(90.0, self.keyboard.hold_time(pygame.K_a))
+
+    def test_unknown_key(self):
+        self.assertIsNone(self.keyboard.get_input_data(pygame.K_b))
+        self.assertFalse(self.keyboard.is_pressed(pygame.K_b))
+        self.assertFalse(self.keyboard.just_released(pygame.K_b))
+
+    def test_latch(self):
+        self.keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_a))
+        self.assertFalse(self.keyboard.was_pressed(pygame.K_a))
+        self.keyboard.latch()
+        self.assertTrue(self.keyboard.was_pressed(pygame.K_a))
+        self.keyboard.handle_event(key_event(pygame.KEYUP, pygame.K_a))
+        self.assertTrue(self.keyboard.was_pressed(pygame.K_a))
+        self.keyboard.latch()
+        self.assertFalse(self.keyboard.was_pressed(pygame.K_a))
+
+    def test_key_slots(self):
+        for key in (pygame.K_UP, pygame.K_KP_ENTER, 0x20AC):
+            self.keyboard.handle_event(key_event(pygame.KEYDOWN, key))
+            self.assertTrue(self.keyboard.just_pressed(key))
+        self.assertFalse(self.keyboard.is_pressed(pygame.K_DOWN))
+        self.assertEqual(
+            {pygame.K_UP, pygame.K_KP_ENTER, 0x20AC},
+            {k.key for k in self.keyboard.get_pressed()},
+        )
+
+    def test_reused_record(self):
+        self.keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_a))
+        key = self.keyboard.get_input_data(pygame.K_a)
+        self.assertEqual("a", key.name)
+        self.keyboard.handle_event(key_event(pygame.KEYUP, pygame.K_a))
+        self.assertFalse(key.pressed)
+        self.assertEqual(0, key.end_frame)
+        self.clock.tick(0.1)
+        self.keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_a))
+        self.assertIs(key, self.keyboard[pygame.K_a])
+        self.assertTrue(key.pressed)
+        self.assertEqual(1, key.start_frame)
+        self.assertIsNone(key.end_frame)
+        self.assertIsNone(self.keyboard.frames_since_release(pygame.K_a))
+
+    def test_key_names(self):
+        pygame.init()
+        try:
+            self.keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_UP))
+            self.assertTrue(self.keyboard.is_pressed("up"))
+            self.assertEqual(pygame.K_UP, self.keyboard.get_input_data("up").key)
+            with self.assertRaises(ValueError):
+                self.keyboard.is_pressed("not a key")
+        finally:
+            pygame.quit()
+
+    def test_unknown_keyup(self):
+        self.keyboard.handle_event(key_event(pygame.KEYUP, pygame.K_c))
+        self.keyboard.handle_event(key_event(pygame.KEYUP, 0x20AC))
+        self.assertFalse(self.keyboard.is_pressed(pygame.K_c))
+        self.assertTrue(self.keyboard.just_released(pygame.K_c))
+        self.assertIsNone(self.keyboard.get_input_data(pygame.K_c))
+        self.assertIsNone(self.keyboard.hold_frames(pygame.K_c))
+
+
+class TestMouse(unittest.TestCase):
+    def test_buttons(self):
+        clock = FrameClock()
+        mouse = Mouse(clock)
+        mouse.handle_event(
+            pygame.Event(
+                pygame.MOUSEBUTTONDOWN, pos=(1, 2), button=1, touch=False, window=None
+            )
+        )
+        self.assertTrue(mouse.just_pressed(1))
+        clock.tick(0.1)
+        mouse.handle_event(
+            pygame.Event(
+                pygame.MOUSEBUTTONUP, pos=(1, 2), button=1, touch=False, window=None
+            )
+        )
+        self.assertFalse(mouse.is_pressed(1))
+        self.assertTrue(mouse.just_released(1))
+        self.assertEqual(1, mouse.release_frame(1))
+
+    def test_motion_coalescing(self):
+        clock = FrameClock()
+        mouse = Mouse(clock, history=3)
+        for i in range(4):
+            mouse.handle_event(motion_event((i, i * 2), (1, 2)))
+        motion = mouse.motion
+        self.assertEqual((3, 6), motion.pos)
+        self.assertEqual((4, 8), motion.rel)
+        self.assertEqual((3, 6), mouse.get_pos())
+        self.assertEqual((6.0, 3.0), mouse.get_pos_scaled((10, 10), (20, 5)))
+        self.assertEqual([(1, 2, 0), (2, 4, 0), (3, 6, 0)], mouse.get_history())
+        clock.tick(0.1)
+        mouse.latch()
+        self.assertEqual((0, 0), motion.rel)
+        mouse.handle_event(motion_event((5, 5), (2, -1)))
+        self.assertIs(motion, mouse.motion)
+        self.assertEqual((2, -1), motion.rel)
+        self.assertEqual((5, 5, 1), mouse.get_history()[-1])
@@ -0,0 +1,187 @@
+import threading
+import time
+import unittest
+
+import pygame
+
+from src.consts import PoolBackend
+from src.jobs import JOB_DONE, JobRunner, WorkerPool
+
+
+def steps(name: str, count: int, log: list):
+    for i in range(count):
+        log.append((name, i))
+        yield
+    return name
+
+
+class TestJobRunner(unittest.TestCase):
+    def test_run_to_completion(self):
+        log, results = [], []
+        runner = JobRunner(budget_ms=100)
+        job = runner.submit(steps("a", 3, log), callback=results.append)
+        self.assertEqual(1, runner.run())
+        self.assertTrue(job.done)
+        self.assertEqual("a", job.result)
+        self.assertEqual(["a"], results)
+        self.assertEqual(0, runner.pending)
+        self.assertEqual(4, runner.resumes)
+
+    def test_priority_and_round_robin(self):
+        log = []
+        runner = JobRunner(budget_ms=100)
+        runner.submit(steps("low", 2, log), priority=0)
+        runner.submit(steps("high1", 2, log), priority=1)
+        runner.submit(steps("high2", 2, log), priority=1)
+        runner.run()
+        self.assertEqual(
+            [("high1", 0), ("high2", 0), ("high1", 1), ("high2", 1)], log[:4]
+        )
+        self.assertEqual([("low", 0), ("low", 1)], log[4:])
+
+    def test_budget(self):
+        def slow():
+            while True:
+                time.sleep(0.002)
+                yield
+
+        runner = JobRunner(budget_ms=1)
+        runner.submit(slow())
+        runner.run()
+        self.assertEqual(1, runner.resumes)
+        self.assertGreaterEqual(runner.used_ms, 1)
+        self.assertEqual(1, runner.pending)
+
+    def test_cancel_owner(self):
+        log = []
+        runner = JobRunner()
+        owner = object()
+        runner.submit(steps("a", 5, log), owner=owner)
+        runner.submit(steps("b", 1, log))
+        self.assertEqual(1, runner.cancel_owner(owner))
+        runner.run()
+        self.assertEqual([("b", 0)], log)
+
+    def test_cancel(self):
+        log = []
+        runner = JobRunner()
+        job = runner.submit(steps("a", 5, log))
+        job.cancel()
+        runner.run()
+        self.assertEqual([], log)
+        self.assertEqual(0, runner.pending)
+
+    def test_job_error(self):
+        log, errors = [], []
+
+        def fail():
+            yield
+            raise ValueError("failed")
+
+        runner = JobRunner(budget_ms=100)
+        job = runner.submit(fail(), error_callback=errors.append)
+        runner.submit(fail())
+        runner.submit(steps("a", 2, log))
+        with self.assertLogs("src.jobs", "ERROR"):
+            self.assertEqual(1, runner.run())
+        self.assertTrue(job.done)
+        self.assertIs(errors[0], job.error)
+        self.assertEqual(2, len(log))
+        self.assertEqual(0, runner.pending)
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+class TestWorkerPool(unittest.TestCase):
+    def test_thread_drain(self):
+        results = []
+        pool = WorkerPool()
+        future = pool.submit(square, 4, callback=results.append)
+        future.result()
+        self.assertEqual([], results)
+        self.assertEqual(1, pool.drain())
+        self.assertEqual([16], results)
+        self.assertEqual(0, pool.pending)
+        pool.shutdown(True)
+
+    def test_process(self):
+        results = []
+        pool = WorkerPool(PoolBackend.PROCESS, 1)
+        pool.submit(square, 3, callback=results.append).result()
+        pool.shutdown(True)
+        pool.drain()
+        self.assertEqual([9], results)
+
+    def test_events(self):
+        pygame.init()
+        try:
+            pygame.event.clear()
+            results = []
+            pool = WorkerPool(post_events=True)
+            pool.submit(square, 5, callback=results.append).result()
+            pool.shutdown(True)
+            for event in pygame.event.get(JOB_DONE):
+                pool.handle_event(event)
+            self.assertEqual([25], results)
+        finally:
+            pygame.quit()
+
+    def test_cancel_owner(self):
+        results = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocked():
+            started.set()
+            release.wait()
+            return "blocked"
+
+        owner = object()
+        pool = WorkerPool(workers=1)
+        running = pool.submit(blocked, callback=results.append, owner=owner)
+        waiting = pool.submit(square, 2, callback=results.append, owner=owner)
+        started.wait()
+        self.assertEqual(2, pool.cancel_owner(owner))
+        release.set()
+        running.result()
+        self.assertTrue(waiting.cancelled())
+        pool.drain()
+        self.assertEqual([], results)
+        self.assertEqual(0, pool.pending)
+        pool.shutdown(True)
+
+    def test_error(self):
+        results, errors = [], []
+
+        def fail():
+            raise RuntimeError("failed")
+
+        pool = WorkerPool()
+        pool.submit(fail, error_callback=errors.append)
+        pool.submit(fail)
+        pool.submit(square, 3, callback=results.append)
+        pool.shutdown(True)
+        with self.assertLogs("src.jobs", "ERROR"):
+            self.assertEqual(3, pool.drain())
+        self.assertIsInstance(errors[0], RuntimeError)
+        self.assertEqual([9], results)
+        self.assertEqual(0, pool.pending)
+
+    def test_shutdown_pending(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocked():
+            started.set()
+            release.wait()
+
+        pool = WorkerPool(workers=1)
+        pool.submit(blocked)
+        pool.submit(square, 2, owner="owner")
+        started.wait()
+        pool.shutdown()
+        release.set()
+        self.assertEqual(1, pool.pending)
+        self.assertEqual({}, pool._owners)
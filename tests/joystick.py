@@ -0,0 +1,160 @@
+import unittest
+
+import pygame
+
+from src.inputs import Joystick, JoystickManager
+from src.timers import FrameClock
+
+
+class FakeDevice:
+    def __init__(self, instance_id=0, guid="fake"):
+        self.instance_id = instance_id
+        self.guid = guid
+        self.axes = [0.0] * 4
+        self.buttons = [False] * 4
+        self.hats = [(0, 0)]
+        self.balls = [(0, 0)]
+
+    def get_instance_id(self):
+        return self.instance_id
+
+    def get_guid(self):
+        return self.guid
+
+    def get_id(self):
+        return self.instance_id
+
+    def get_numaxes(self):
+        return len(self.axes)
+
+    def get_numbuttons(self):
+        return len(self.buttons)
+
+    def get_numhats(self):
+        return len(self.hats)
+
+    def get_numballs(self):
+        return len(self.balls)
+
+    def get_axis(self, i):
+        return self.axes[i]
+
+    def get_button(self, i):
+        return self.buttons[i]
+
+    def get_hat(self, i):
+        return self.hats[i]
+
+    def get_ball(self, i):
+        return self.balls[i]
+
+    def quit(self):
+        pass
+
+
+def make_joystick(device: FakeDevice, clock: FrameClock, **kwargs) -> Joystick:
+    return Joystick(clock=clock, device=device, **kwargs)
+
+
+class TestJoystick(unittest.TestCase):
+    def setUp(self):
+        self.clock = FrameClock()
+        self.device = FakeDevice()
+
+    def test_events(self):
+        joystick = make_joystick(self.device, self.clock)
+        joystick.set_deadzone(0, 0.5)
+        joystick.handle_event(
+            pygame.Event(pygame.JOYAXISMOTION, instance_id=0, joy=0, axis=0, value=0.4)
+        )
+        self.assertFalse(joystick.is_moving(0))
+        joystick.handle_event(
+            pygame.Event(pygame.JOYAXISMOTION, instance_id=0, joy=0, axis=0, value=0.75)
+        )
+        self.assertTrue(joystick.just_move(0))
+        self.assertAlmostEqual(0.5, joystick.axis_value(0))
+        joystick.handle_event(
+            pygame.Event(
+                pygame.JOYHATMOTION, instance_id=0, joy=0, hat=0, value=(1, -1)
+            )
+        )
+        self.assertEqual((1, -1), joystick.hat(0))
+        joystick.handle_event(
+            pygame.Event(pygame.JOYBALLMOTION, instance_id=0, joy=0, ball=0, rel=(2, 3))
+        )
+        self.assertEqual((2, 3), joystick.ball(0))
+        joystick.latch()
+        self.assertEqual((0, 0), joystick.ball(0))
+
+    def test_polled(self):
+        joystick = make_joystick(self.device, self.clock, polled=True)
+        self.assertNotIn(pygame.JOYAXISMOTION, joystick.handled_events)
+        joystick.set_stick(0, 1, 0.2)
+        self.device.axes[:2] = [0.1, 0.1]
+        self.device.buttons[2] = True
+        self.device.hats[0] = (0, 1)
+        joystick.update()
+        self.assertEqual(0.0, joystick.axis_value(0))
+        self.assertTrue(joystick.just_pressed(2))
+        self.assertEqual((0, 1), joystick.hat(0))
+
+        self.clock.tick(0.1)
+        self.device.axes[:2] = [0.0, 1.0]
+        self.device.buttons[2] = False
+        joystick.update()
+        self.assertEqual(0.0, joystick.axis_value(0))
+        self.assertAlmostEqual(1.0, joystick.axis_value(1))
+        self.assertTrue(joystick.just_move(1))
+        self.assertTrue(joystick.just_released(2))
+        self.assertEqual(1, joystick.hold_frames(2))
+
+
+class TestJoystickManager(unittest.TestCase):
+    def test_routing(self):
+        manager = JoystickManager(FrameClock())
+        joysticks = [manager.add(FakeDevice(i, f"pad{i}")) for i in range(10)]
+        self.assertEqual(10, len(manager))
+        self.assertIs(joysticks[9], manager.get(9))
+        manager.handle_event(
+            pygame.Event(pygame.JOYBUTTONDOWN, instance_id=7, joy=7, button=1)
+        )
+        self.assertTrue(joysticks[7].is_pressed(1))
+        self.assertFalse(joysticks[6].is_pressed(1))
+        manager.handle_event(
+            pygame.Event(pygame.JOYBUTTONDOWN, instance_id=42, joy=0, button=1)
+        )
+
+    def test_reconnect(self):
+        connected, disconnected = [], []
+        manager = JoystickManager(FrameClock())
+        manager.on_connect = connected.append
+        manager.on_disconnect = disconnected.append
+        first = manager.add(FakeDevice(0, "pad"))
+        second = manager.add(FakeDevice(1, "pad"))
+        self.assertIs(first, manager.remove(0))
+        self.assertFalse(first.is_active)
+        self.assertIsNone(manager.get(0))
+        self.assertEqual([first], disconnected)
+        self.assertIs(first, manager.add(FakeDevice(5, "pad")))
+        self.assertEqual(5, first.instance_id)
+        self.assertEqual(0, manager.slot(first))
+        self.assertEqual(1, manager.slot(second))
+        self.assertIs(first, manager.get_by_instance_id(5))
+        self.assertEqual([first, second, first], connected)
+        third = manager.add(FakeDevice(6, "other"))
+        self.assertEqual(2, manager.slot(third))
+
+    def test_reuse_disconnected(self):
+        manager = JoystickManager(FrameClock())
+        for i in range(3):
+            manager.add(FakeDevice(i, f"pad{i}"))
+        manager.remove(1)
+        manager.remove(0)
+        for i in range(3, 10):
+            manager.add(FakeDevice(i, f"new{i}"))
+            manager.remove(i)
+        self.assertEqual(3, len(manager._slots))
+        self.assertEqual(2, len(manager._disconnected))
+        joystick = manager.add(FakeDevice(10, "pad1"))
+        self.assertEqual(3, len(manager._slots))
+        self.assertEqual(0, manager.slot(joystick))
@@ -0,0 +1,63 @@
+import unittest
+from array import array
+
+from src import FrameProfiler, Game, WindowScreen
+from src.config import GameConfig, WindowConfig
+from src.consts import FramePhase
+
+from .test_utils import WindowContex
+
+hwc = WindowConfig((320, 180), headless=True)
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def test_disabled(self):
+        profiler = FrameProfiler()
+        profiler.begin_frame()
+        profiler.mark(FramePhase.EVENTS)
+        profiler.end_frame()
+        self.assertEqual(0, profiler.frames)
+        self.assertEqual(0.0, profiler.average(FramePhase.FRAME))
+
+    def test_ring_buffer(self):
+        profiler = FrameProfiler(size=4, enabled=True)
+        for _ in range(6):
+            profiler.begin_frame()
+            profiler.mark(FramePhase.UPDATE)
+            profiler.end_frame()
+        self.assertEqual(4, profiler.frames)
+        self.assertEqual(4, len(profiler.samples(FramePhase.UPDATE)))
+
+    def test_enabled_mid_frame(self):
+        profiler = FrameProfiler()
+        profiler.begin_frame()
+        profiler.enabled = True
+        profiler.mark(FramePhase.UPDATE)
+        profiler.end_frame()
+        self.assertEqual(0, profiler.frames)
+        profiler.begin_frame()
+        profiler.mark(FramePhase.UPDATE)
+        profiler.end_frame()
+        self.assertEqual(1, profiler.frames)
+        self.assertLess(profiler.samples(FramePhase.FRAME)[0], 10**9)
+
+    def test_stats(self):
+        profiler = FrameProfiler(size=100, enabled=True)
+        profiler._count = 100
+        profiler._samples[FramePhase.RENDER] = array(
+            "q", [i * 10**6 for i in range(1, 101)]
+        )
+        stats = profiler.stats(FramePhase.RENDER)
+        self.assertAlmostEqual(50.5, stats.average)
+        self.assertEqual(51, stats.p50)
+        self.assertEqual(95, stats.p95)
+        self.assertEqual(99, stats.p99)
+
+    def test_game_profile(self):
+        with WindowContex(WindowScreen, hwc) as w:
+            g = Game(GameConfig(fixed_delta=1 / 60, max_frames=5, profile=True), w)
+            g.run()
+            self.assertEqual(5, g.profiler.frames)
+            stats = g.profiler.all_stats()
+            self.assertEqual(set(FramePhase), set(stats))
+            self.assertGreater(stats[FramePhase.FRAME].average, 0)
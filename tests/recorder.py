@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src import FrameRecorder, Game, WindowScreen
+from src.config import GameConfig, WindowConfig
+from src.consts import RecordFormat
+
+from .test_utils import WindowContex
+
+hwc = WindowConfig((320, 180), headless=True)
+
+
+class TestFrameRecorder(unittest.TestCase):
+    def test_record_png(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            recorder = FrameRecorder(os.path.join(tmp, "{}.png"), (32, 16)).start()
+            surf = pygame.Surface((32, 16))
+            for _ in range(3):
+                self.assertTrue(recorder.capture(surf))
+            recorder.stop()
+            self.assertEqual(3, recorder.recorded)
+            self.assertEqual(["0.png", "1.png", "2.png"], sorted(os.listdir(tmp)))
+
+    def test_record_raw(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "video.raw")
+            recorder = FrameRecorder(path, (32, 16), RecordFormat.RAW).start()
+            recorder.capture(pygame.Surface((64, 32)))
+            recorder.capture(pygame.Surface((32, 16)))
+            recorder.stop()
+            self.assertEqual(2 * 32 * 16 * 3, os.path.getsize(path))
+
+    def test_drop_frames(self):
+        recorder = FrameRecorder("{}.png", (8, 8), buffers=2)
+        surf = pygame.Surface((8, 8))
+        self.assertTrue(recorder.capture(surf))
+        self.assertTrue(recorder.capture(surf))
+        self.assertFalse(recorder.capture(surf))
+        self.assertEqual(1, recorder.dropped)
+        self.assertEqual(2, recorder.queued)
+
+    def test_game_recording(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with WindowContex(WindowScreen, hwc) as w:
+                g = Game(GameConfig(fixed_delta=1 / 60, max_frames=4), w)
+                g.init_game()
+                recorder = g.start_recording(os.path.join(tmp, "{}.png"))
+                g.run()
+                self.assertIsNone(g.recorder)
+            self.assertEqual(4, recorder.recorded + recorder.dropped)
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.replay import InputPlayer, InputRecorder
+from src.timers import Delta, FrameClock
+
+
+class TestReplay(unittest.TestCase):
+    def test_round_trip(self):
+        events = [
+            pygame.Event(
+                pygame.KEYDOWN, key=pygame.K_a, scancode=4, mod=0, unicode="á"
+            ),
+            pygame.Event(
+                pygame.MOUSEMOTION,
+                pos=(3, 4),
+                rel=(-1, 2),
+                buttons=(1, 0, 0),
+                touch=False,
+            ),
+            pygame.Event(
+                pygame.JOYHATMOTION, joy=0, instance_id=2, hat=0, value=(-1, 1)
+            ),
+            pygame.Event(
+                pygame.JOYAXISMOTION, joy=0, instance_id=2, axis=1, value=1 / 3
+            ),
+            pygame.Event(pygame.JOYDEVICEADDED, device_index=1, guid="03000000"),
+            pygame.Event(pygame.USEREVENT, data=object()),
+            pygame.Event(pygame.QUIT),
+        ]
+        clock = FrameClock()
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "inputs.bin")
+            recorder = InputRecorder(path, clock)
+            clock.tick(0.25)
+            recorder.record(events)
+            clock.tick(0.5)
+            recorder.record([])
+            recorder.close()
+            self.assertEqual(2, recorder.frames)
+
+            player = InputPlayer(path)
+            self.assertEqual(0.25, player.replay_delta())
+            played = player.replace_events(
+                [pygame.Event(pygame.USEREVENT), pygame.Event(pygame.QUIT)]
+            )
+            self.assertEqual(
+                [
+                    pygame.KEYDOWN,
+                    pygame.MOUSEMOTION,
+                    pygame.JOYHATMOTION,
+                    pygame.JOYAXISMOTION,
+                    pygame.JOYDEVICEADDED,
+                    pygame.USEREVENT,
+                    pygame.QUIT,
+                ],
+                [event.type for event in played],
+            )
+            self.assertEqual("á", played[0].unicode)
+            self.assertEqual(pygame.K_a, played[0].key)
+            self.assertEqual((-1, 2), played[1].rel)
+            self.assertEqual((1, 0, 0), played[1].buttons)
+            self.assertEqual((-1, 1), played[2].value)
+            self.assertEqual(1 / 3, played[3].value)
+            self.assertEqual("03000000", played[4].guid)
+            self.assertFalse(player.finished)
+            self.assertEqual(0.5, player.replay_delta())
+            self.assertTrue(player.finished)
+            self.assertIsNone(player.replay_delta())
+
+    def test_invalid_file(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "inputs.bin")
+            with open(path, "wb") as file:
+                file.write(b"not a recording")
+            with self.assertRaises(ValueError):
+                InputPlayer(path)
+
+    def test_delta_source(self):
+        deltas = iter([0.1, None])
+        delta = Delta(0.5, FrameClock())
+        delta.source = lambda: next(deltas)
+        self.assertEqual(0.1, delta.get_delta())
+        self.assertEqual(0.5, delta.get_delta())
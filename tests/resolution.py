@@ -0,0 +1,56 @@
+import unittest
+
+from src import WindowDisplay, WindowScreen
+from src.config import WindowConfig
+from src.resolution import DynamicResolution
+
+from .test_utils import WindowContex
+
+
+def display_config() -> WindowConfig:
+    return WindowConfig((720, 480), 2, headless=True)
+
+
+class TestWindowScaleFactor(unittest.TestCase):
+    def test_screen_scale_factor(self):
+        with WindowContex(WindowScreen, display_config()) as w:
+            w.init_screen()
+            self.assertEqual(1.0, w.scale_factor)
+            self.assertFalse(w.set_scale_factor(2))
+
+    def test_display_scale_factor(self):
+        with WindowContex(WindowDisplay, display_config()) as w:
+            w.init_screen()
+            self.assertEqual((360, 240), w.display.get_size())
+            self.assertTrue(w.set_scale_factor(3))
+            self.assertEqual(3, w.scale_factor)
+            self.assertEqual(2, w.config.scale_factor)
+            self.assertEqual((240, 160), w.display.get_size())
+            self.assertFalse(w.set_scale_factor(3))
+
+
+class TestDynamicResolution(unittest.TestCase):
+    def test_scale_up_and_down(self):
+        with WindowContex(WindowDisplay, display_config()) as w:
+            w.init_screen()
+            dynamic = DynamicResolution(w, 10, 1, 3, 0.5, frames=4, cooldown=2)
+            changes = [dynamic.update(20) for _ in range(4)]
+            self.assertEqual([False, False, False, True], changes)
+            self.assertEqual(2.5, dynamic.scale_factor)
+            changes = [dynamic.update(1) for _ in range(4)]
+            self.assertEqual([False, False, False, True], changes)
+            self.assertEqual(2.0, dynamic.scale_factor)
+
+    def test_hysteresis(self):
+        with WindowContex(WindowDisplay, display_config()) as w:
+            w.init_screen()
+            dynamic = DynamicResolution(w, 10, 1, 3, frames=4, cooldown=0)
+            self.assertFalse(any(dynamic.update(8) for _ in range(20)))
+            self.assertEqual(2, dynamic.scale_factor)
+
+    def test_bounds(self):
+        with WindowContex(WindowDisplay, display_config()) as w:
+            w.init_screen()
+            dynamic = DynamicResolution(w, 10, 1, 2, frames=2, cooldown=0)
+            self.assertFalse(any(dynamic.update(50) for _ in range(10)))
+            self.assertEqual(2, dynamic.scale_factor)
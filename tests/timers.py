@@ -0,0 +1,120 @@
+import time
+import unittest
+
+from src.timers import Chronometer, Delta, FrameClock, FramePacer, Scheduler
+
+
+class TestFrameClock(unittest.TestCase):
+    def test_tick(self):
+        clock = FrameClock()
+        self.assertEqual(0, clock.frame)
+        delta = clock.tick()
+        self.assertEqual(1, clock.frame)
+        self.assertGreaterEqual(delta, 0.0)
+        self.assertEqual(delta, clock.delta)
+
+    def test_tick_simulated(self):
+        clock = FrameClock()
+        start = clock.frame_start_ns
+        for _ in range(120):
+            clock.tick(0.5)
+        self.assertEqual(120, clock.frame)
+        self.assertEqual(0.5, clock.delta)
+        self.assertAlmostEqual(60.0, clock.time)
+        self.assertEqual(start + 60 * 10**9, clock.frame_start_ns)
+
+
+class TestDelta(unittest.TestCase):
+    def test_fixed(self):
+        delta = Delta(0.25)
+        self.assertEqual(0.25, delta.get_delta())
+        self.assertEqual(0.25, delta.deltatime)
+
+    def test_clock(self):
+        clock = FrameClock()
+        delta = Delta(0.1, clock)
+        delta.get_delta()
+        delta.get_delta()
+        self.assertEqual(2, clock.frame)
+        self.assertAlmostEqual(0.2, clock.time)
+
+
+class TestChronometer(unittest.TestCase):
+    def test_update(self):
+        chrono = Chronometer()
+        chrono.update(0.5)
+        self.assertEqual(0.5, chrono.current_time)
+        self.assertEqual(500, chrono.current_time_ms)
+        chrono.reset()
+        self.assertEqual(0, chrono.current_time)
+
+
+class TestFramePacer(unittest.TestCase):
+    def test_wait(self):
+        pacer = FramePacer()
+        pacer.wait(100)
+        start = time.perf_counter()
+        for _ in range(10):
+            pacer.wait(100)
+        self.assertAlmostEqual(0.1, time.perf_counter() - start, delta=0.02)
+        stats = pacer.stats()
+        self.assertGreaterEqual(stats.mean_error, 0)
+        self.assertGreaterEqual(stats.max_error, stats.mean_error)
+
+    def test_no_target(self):
+        pacer = FramePacer()
+        pacer.wait(0)
+        self.assertEqual(0.0, pacer.stats().mean_error)
+
+
+class TestScheduler(unittest.TestCase):
+    def test_after(self):
+        fired = []
+        scheduler = Scheduler()
+        scheduler.after(1.0, fired.append, "b")
+        scheduler.after(0.5, fired.append, "a")
+        self.assertEqual(0.5, scheduler.next_timer)
+        self.assertEqual(0, scheduler.update(0.4))
+        self.assertEqual(1, scheduler.update(0.1))
+        self.assertEqual(["a"], fired)
+        self.assertEqual(1, scheduler.update(0.5))
+        self.assertEqual(["a", "b"], fired)
+        self.assertEqual(0, scheduler.pending)
+        self.assertIsNone(scheduler.next_timer)
+
+    def test_every_and_cancel(self):
+        fired = []
+        scheduler = Scheduler()
+        handle = scheduler.every(0.25, fired.append, 1)
+        scheduler.update(1.0)
+        self.assertEqual(4, len(fired))
+        self.assertTrue(scheduler.cancel(handle))
+        self.assertFalse(scheduler.cancel(handle))
+        scheduler.update(1.0)
+        self.assertEqual(4, len(fired))
+        self.assertEqual(0, scheduler.pending)
+
+    def test_every_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            Scheduler().every(0, print)
+
+    def test_many_cancelled(self):
+        scheduler = Scheduler()
+        handles = [scheduler.after(i, print) for i in range(1, 2001)]
+        for handle in handles[:1500]:
+            scheduler.cancel(handle)
+        self.assertEqual(500, scheduler.pending)
+        self.assertEqual(1501, scheduler.next_timer)
+
+    def test_cancel_after_fired(self):
+        scheduler = Scheduler()
+        fired = scheduler.after(0.5, print)
+        handles = [scheduler.after(1.0, print) for _ in range(10)]
+        scheduler.update(0.5)
+        self.assertTrue(scheduler.cancel(fired))
+        self.assertEqual(10, scheduler.pending)
+        handles[0].cancel()
+        self.assertEqual(9, scheduler.pending)
+        self.assertFalse(scheduler.cancel(handles[0]))
+        self.assertEqual(9, scheduler.update(0.5))
+        self.assertEqual(0, scheduler.pending)
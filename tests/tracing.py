@@ -0,0 +1,66 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from src import Game, WindowScreen
+from src.config import GameConfig, WindowConfig
+from src.tracing import Tracer
+
+from .test_utils import WindowContex
+
+hwc = WindowConfig((320, 180), headless=True)
+
+
+class TestTracer(unittest.TestCase):
+    def test_disabled(self):
+        tracer = Tracer()
+        with tracer.span("nothing"):
+            pass
+        tracer.instant("nothing")
+        self.assertEqual(0, tracer.spans)
+
+    def test_span_and_decorator(self):
+        tracer = Tracer(enabled=True)
+
+        @tracer.trace()
+        def work():
+            return 1
+
+        with tracer.span("zone", "ai"):
+            self.assertEqual(1, work())
+        tracer.instant("mark")
+        events = tracer.to_dict()["traceEvents"]
+        names = [e["name"] for e in events if e["ph"] != "M"]
+        self.assertEqual(
+            ["TestTracer.test_span_and_decorator.<locals>.work", "zone", "mark"], names
+        )
+        self.assertEqual("ai", events[1]["cat"])
+        self.assertEqual("i", events[2]["ph"])
+        self.assertEqual(threading.get_ident(), events[0]["tid"])
+
+    def test_ring_buffer(self):
+        tracer = Tracer(size=2, enabled=True)
+        for name in "abc":
+            tracer.add(name, 0, 10)
+        names = [e["name"] for e in tracer.to_dict()["traceEvents"] if e["ph"] == "X"]
+        self.assertEqual(["b", "c"], names)
+
+    def test_game_trace(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with WindowContex(WindowScreen, hwc) as w:
+                g = Game(GameConfig(fixed_delta=1 / 60, max_frames=2), w)
+                g.tracer.enabled = True
+                try:
+                    g.run()
+                finally:
+                    g.tracer.enabled = False
+                path = os.path.join(tmp, "trace.json")
+                g.tracer.dump(path)
+                g.tracer.clear()
+            with open(path, encoding="utf-8") as file:
+                names = {e["name"] for e in json.load(file)["traceEvents"]}
+            self.assertIn("update", names)
+            self.assertIn("frame", names)
+            self.assertIn("main.__init__", names)
@@ -1,3 +1,4 @@
+import os
 import unittest
 
 import pygame
@@ -21,6 +22,19 @@ class TestWindowScreenType(unittest.TestCase):
             self.assertFalse(pygame.get_init())
             self.assertIsNone(w.screen)
 
+    def test_headless_driver_restored(self):
+        driver = os.environ.pop("SDL_VIDEODRIVER", None)
+        try:
+            with WindowContex(
+                WindowScreen, WindowConfig((320, 180), headless=True)
+            ) as w:
+                w.init_screen()
+                self.assertEqual("dummy", pygame.display.get_driver())
+                self.assertNotIn("SDL_VIDEODRIVER", os.environ)
+        finally:
+            if driver is not None:
+                os.environ["SDL_VIDEODRIVER"] = driver
+
     def test_init_screen(self):
         with WindowContex(WindowScreen, wc) as w:
             w.init_screen()
@@ -95,6 +109,31 @@ class TestWindowDisplayType(unittest.TestCase):
             w.init_screen()
             self.assertEqual(pygame.display.update, w.get_update_function())
 
+    def test_threaded_scale(self):
+        twc = WindowConfig((720, 480), 2, "smooth", threaded_scale=True)
+        with WindowContex(WindowDisplay, twc) as w:
+            w.init_screen()
+            self.assertTrue(w.is_threaded)
+            first = w.display
+            w.display.fill((255, 0, 0))
+            w.get_update_function()
+            self.assertIsNot(first, w.display)
+            # the first frame is only sent to be scaled
+            self.assertEqual((0, 0, 0, 255), tuple(w.screen.get_at((10, 10))))
+            w.display.fill((0, 255, 0))
+            w.get_update_function()
+            # the screen shows the previous frame
+            self.assertEqual((255, 0, 0, 255), tuple(w.screen.get_at((10, 10))))
+            self.assertIs(first, w.display)
+            w.close()
+            self.assertFalse(w.is_threaded)
+
+    def test_threaded_scale_vsync(self):
+        twc = WindowConfig((720, 480), 2, vsync=1, threaded_scale=True)
+        with WindowContex(WindowDisplay, twc) as w:
+            w.init_screen()
+            self.assertFalse(w.is_threaded)
+
 
 class TestWindowScreenGLType(unittest.TestCase):
     def test_construction(self):